@@ -0,0 +1,294 @@
+# benchmarks/engines.py
+"""
+Benchmark reproducible de los motores de 'RoundRobinScheduler' sobre cargas
+sintéticas fijas (ver 'models.workload', con semilla): tamaño small/medium/huge,
+carga light/heavy y quantum tiny/large.
+
+Para cada escenario y motor ('tick' avanza unidad a unidad; 'event' salta de
+evento en evento; 'analytic' salta vueltas completas con su forma cerrada) mide:
+  - unidades simuladas por segundo y eventos de planificación (despachos y
+    finalizaciones, los mismos con cualquier motor) por segundo,
+  - pico de memoria residente (RSS) del proceso que ejecuta el caso,
+  - asignaciones: pico de bloques de memoria vivos añadidos durante la simulación y
+    pico de memoria trazada con 'tracemalloc' (en una segunda ejecución, fuera del cronómetro),
+  - coste de 'metrics()', con el cálculo vectorizado (NumPy) y en Python puro.
+Cada caso se ejecuta en un proceso nuevo para que el pico de RSS sea solo suyo.
+
+Los resultados se guardan en JSON; con '--compare' se contrastan con una línea
+base guardada y se señalan las regresiones que superan el umbral (código de
+salida 1 si hay alguna).
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.engines --out bench.json
+    python -m benchmarks.engines --size small --size medium --compare base.json --threshold 0.15
+    python -m benchmarks.engines --compare base.json --results bench.json
+"""
+import argparse
+import gc
+import json
+import math
+import multiprocessing
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import models.metrics as metrics_module
+from models.scheduler import RoundRobinScheduler
+from models.workload import generate_table
+
+try:
+    import resource
+except ImportError:  # No disponible en Windows: el pico de RSS no se mide
+    resource = None
+
+SIZES = {"small": 1_000, "medium": 20_000, "huge": 250_000}
+LOADS = {"light": 0.5, "heavy": 0.95}
+QUANTA = {"tiny": 20, "large": 500}
+MEAN_BURST = 200
+SEED = 2024
+
+ENGINES = ("tick", "event", "analytic")
+# Método de avance de cada motor
+ADVANCE = {"tick": "step", "event": "advance_to_next_event", "analytic": "advance_rounds"}
+
+# Métricas comparadas con la línea base: True si más es mejor
+TRACKED = {
+    "units_per_sec": True,
+    "events_per_sec": True,
+    "metrics_seconds": False,
+    "metrics_python_seconds": False,
+    "peak_rss_mb": False,
+    "peak_blocks": False,
+    "traced_peak_mb": False,
+}
+
+def scenarios(sizes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Escenarios fijos (tamaño x carga x quantum), en orden estable."""
+    return [{"name": f"{size}-{load}-{quantum}", "count": SIZES[size], "load": LOADS[load],
+             "quantum": QUANTA[quantum], "size": size}
+            for size in (sizes or SIZES) for load in LOADS for quantum in QUANTA]
+
+def _build(case: Dict[str, Any]) -> RoundRobinScheduler:
+    """Planificador con la carga del escenario ya cargada."""
+    table = generate_table(case["count"], seed=SEED, mean=MEAN_BURST, load=case["load"])
+    scheduler = RoundRobinScheduler(quantum=case["quantum"])
+    scheduler.load_table(table)
+    return scheduler
+
+def _simulate(scheduler: RoundRobinScheduler, engine: str) -> int:
+    """Ejecuta la simulación hasta el final. Returns: número de avances del motor."""
+    advance = getattr(scheduler, ADVANCE[engine])
+    steps = 0
+    while advance():
+        steps += 1
+    scheduler.flush_events()
+    return steps
+
+def _simulate_sampling(scheduler: RoundRobinScheduler, engine: str, every: int = 1024) -> int:
+    """
+    Como '_simulate', muestreando los bloques de memoria vivos cada 'every' avances.
+    Returns: pico de bloques vivos por encima de los que había al empezar.
+    """
+    advance = getattr(scheduler, ADVANCE[engine])
+    base = peak = sys.getallocatedblocks()
+    steps = 0
+    while advance():
+        steps += 1
+        if not steps % every:
+            peak = max(peak, sys.getallocatedblocks())
+    scheduler.flush_events()
+    return max(peak, sys.getallocatedblocks()) - base
+
+def _time_metrics(scheduler: RoundRobinScheduler, vectorized: bool, calls: int = 5) -> float:
+    """Segundos de la llamada más rápida a 'metrics()' (la primera incluye la preparación de NumPy)."""
+    numpy = metrics_module.np
+    if not vectorized:
+        metrics_module.np = None
+    try:
+        best = math.inf
+        for _ in range(calls):
+            start = time.perf_counter()
+            scheduler.metrics()
+            best = min(best, time.perf_counter() - start)
+        return best
+    finally:
+        metrics_module.np = numpy
+
+def _peak_rss_mb() -> Optional[float]:
+    """Pico de RSS del proceso actual en MB (None si la plataforma no lo ofrece)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024 # bytes en macOS, KB en Linux
+
+def measure_case(case: Dict[str, Any], engine: str, repeat: int = 1, trace: bool = True) -> Dict[str, Any]:
+    """
+    Mide un escenario con un motor (en el proceso actual).
+    Args:
+        repeat (int): Repeticiones de la simulación; se toma la más rápida.
+        trace (bool): Si es False, se omite la segunda ejecución (asignaciones y 'tracemalloc').
+    """
+    best = None
+    for _ in range(max(1, repeat)):
+        scheduler = _build(case)
+        gc.collect()
+        start = time.perf_counter()
+        steps = _simulate(scheduler, engine)
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best[0]:
+            best = (seconds, steps, scheduler)
+    seconds, steps, scheduler = best
+    # Cada despacho cuenta como cambio de contexto; el número de segmentos del historial
+    # no sirve porque depende de la fusión de ráfagas consecutivas del mismo proceso
+    events = scheduler.context_switches + len(scheduler.finished)
+    result = {
+        "scenario": case["name"],
+        "engine": engine,
+        "processes": case["count"],
+        "quantum": case["quantum"],
+        "load": case["load"],
+        "simulated_units": scheduler.time,
+        "steps": steps,
+        "events": events,
+        "context_switches": scheduler.context_switches,
+        "seconds": seconds,
+        "units_per_sec": scheduler.time / seconds,
+        "events_per_sec": events / seconds,
+        "metrics_seconds": _time_metrics(scheduler, True) if metrics_module.np is not None else None,
+        "metrics_python_seconds": _time_metrics(scheduler, False),
+        "peak_rss_mb": _peak_rss_mb(),
+        "peak_blocks": None,
+        "traced_peak_mb": None,
+    }
+    del scheduler, best
+    if trace:
+        scheduler = _build(case)
+        gc.collect()
+        tracemalloc.start()
+        result["peak_blocks"] = _simulate_sampling(scheduler, engine)
+        result["traced_peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    return result
+
+def _measure_isolated(case: Dict[str, Any], engine: str, repeat: int, trace: bool) -> Dict[str, Any]:
+    """Ejecuta 'measure_case' en un proceso nuevo (pico de RSS propio del caso)."""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(measure_case, (case, engine, repeat, trace))
+
+def run_suite(sizes: Optional[List[str]] = None, engines=ENGINES, tick_sizes=("small",),
+              repeat: int = 1, trace: bool = True, isolate: bool = True, log=print) -> Dict[str, Any]:
+    """
+    Ejecuta todos los escenarios con los motores indicados.
+    Args:
+        tick_sizes: Tamaños en los que se mide el motor 'tick' (mucho más lento).
+        isolate (bool): Si es True, cada caso se mide en un proceso nuevo.
+    Returns:
+        dict: {'meta': entorno de la ejecución, 'results': una entrada por caso}.
+    """
+    measure = _measure_isolated if isolate else measure_case
+    results = []
+    for case in scenarios(sizes):
+        for engine in engines:
+            if engine == "tick" and case["size"] not in tick_sizes:
+                continue
+            result = measure(case, engine, repeat, trace)
+            results.append(result)
+            log(_format_result(result))
+    return {"meta": _environment(), "results": results}
+
+def _environment() -> Dict[str, Any]:
+    """Datos del entorno para interpretar los resultados."""
+    numpy = metrics_module.np
+    return {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__ if numpy is not None else None,
+        "seed": SEED,
+        "mean_burst": MEAN_BURST,
+    }
+
+def _format_result(result: Dict[str, Any]) -> str:
+    """Línea de texto con las medidas principales de un caso."""
+    rss = result["peak_rss_mb"]
+    traced = result["traced_peak_mb"]
+    blocks = result["peak_blocks"]
+    metrics_seconds = result["metrics_seconds"]
+    return (f"{result['scenario']:<20}{result['engine']:<9}{result['units_per_sec']:>14,.0f} u/s"
+            f"{result['events_per_sec']:>12,.0f} ev/s"
+            f"{'-' if metrics_seconds is None else f'{metrics_seconds * 1000:.2f}':>9} ms métricas"
+            f" ({result['metrics_python_seconds'] * 1000:.2f} ms Python)"
+            f"{'-' if rss is None else f'{rss:.0f}':>7} MB RSS"
+            f"{'-' if traced is None else f'{traced:.1f}':>8} MB trazados"
+            f"{'-' if blocks is None else blocks:>10} bloques")
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compara dos ejecuciones del benchmark.
+    Returns:
+        list: Descripción de cada regresión mayor que 'threshold' (fracción, 0.1 = 10 %)
+        en los casos presentes en ambas.
+    """
+    base = {(r["scenario"], r["engine"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = base.get((result["scenario"], result["engine"]))
+        if old is None:
+            continue
+        for key, higher_is_better in TRACKED.items():
+            before, after = old.get(key), result.get(key)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{result['scenario']} [{result['engine']}] {key}: "
+                                   f"{before:,.4g} -> {after:,.4g} ({change:+.1%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reproducible de los motores del planificador.")
+    parser.add_argument("--size", action="append", choices=tuple(SIZES),
+                        help="Tamaño de carga a medir (repetible; por defecto, todos).")
+    parser.add_argument("--engine", action="append", choices=ENGINES,
+                        help="Motor a medir (repetible; por defecto, todos).")
+    parser.add_argument("--tick-size", action="append", choices=tuple(SIZES),
+                        help="Tamaños en los que se mide el motor 'tick' (por defecto, solo small).")
+    parser.add_argument("--repeat", type=int, default=1, help="Repeticiones por caso (se toma la más rápida).")
+    parser.add_argument("--no-trace", action="store_true",
+                        help="Omitir la segunda ejecución que mide asignaciones (bloques y tracemalloc).")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Medir en el proceso actual (el pico de RSS pasa a ser acumulado).")
+    parser.add_argument("--out", help="Fichero JSON donde guardar los resultados.")
+    parser.add_argument("--compare", metavar="BASE.json", help="Línea base con la que comparar.")
+    parser.add_argument("--results", metavar="ACTUAL.json",
+                        help="Con --compare, comparar estos resultados guardados en lugar de ejecutar el benchmark.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Empeoramiento relativo que se considera regresión (por defecto 0.10 = 10 %%).")
+    args = parser.parse_args()
+    if args.results and not args.compare:
+        parser.error("--results requiere --compare.")
+
+    if args.results:
+        with open(args.results, encoding="utf-8") as f:
+            current = json.load(f)
+    else:
+        current = run_suite(args.size, args.engine or ENGINES, args.tick_size or ("small",),
+                            args.repeat, not args.no_trace, not args.in_process)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for line in regressions:
+            print(f"REGRESIÓN {line}")
+        print(f"{len(regressions)} regresiones por encima del {args.threshold:.0%} respecto a {args.compare}.")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/memory_process.py
+"""
+Compara la memoria necesaria para representar procesos:
+objetos con __dict__ (representación original), 'Process' con __slots__
+y 'ProcessTable' columnar (con y sin vistas 'ProcessRow').
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.memory_process [--count 1000000]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from models.scheduler import Process
+from models.process_table import ProcessTable
+
+class DictProcess:
+    """Réplica de la clase 'Process' original, con __dict__ por instancia."""
+    def __init__(self, pid: int, arrival: int, burst: int):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.remaining = burst
+        self.start_time = None
+        self.completion_time = None
+
+def _workload(count: int):
+    """Genera pares (arrival, burst) deterministas con valores fuera de la caché de enteros pequeños."""
+    return ((1000 + i * 7, 300 + (i * 7919) % 2000) for i in range(count))
+
+def _measure(build) -> int:
+    """Devuelve los bytes que quedan reservados tras ejecutar 'build'."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return current
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memoria por proceso.")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Número de procesos a crear.")
+    args = parser.parse_args()
+    n = args.count
+
+    def build_table():
+        return ProcessTable.from_pairs(_workload(n))
+
+    def build_table_rows():
+        table = build_table()
+        return table, list(table.rows())
+
+    cases = [
+        ("Process con __dict__", lambda: [DictProcess(pid, a, b) for pid, (a, b) in enumerate(_workload(n), 1)]),
+        ("Process con __slots__", lambda: [Process(pid, a, b) for pid, (a, b) in enumerate(_workload(n), 1)]),
+        ("ProcessTable + vistas ProcessRow", build_table_rows),
+        ("ProcessTable (solo columnas)", build_table),
+    ]
+    baseline = None
+    # Nota: bytes por proceso equivale numéricamente a MB por millón de procesos
+    print(f"{'Representación':<36}{'bytes/proceso (MB/millón)':>27}{'reducción':>12}")
+    for name, build in cases:
+        total = _measure(build)
+        per_proc = total / n
+        if baseline is None:
+            baseline = per_proc
+        print(f"{name:<36}{per_proc:>27.1f}{baseline / per_proc:>11.1f}x")
+
+if __name__ == "__main__":
+    main()
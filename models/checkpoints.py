@@ -0,0 +1,168 @@
+# models/checkpoints.py
+import math
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from models.scheduler import Process
+
+class CheckpointIndex:
+    """
+    Índice de instantáneas de una simulación ordenadas por tiempo, usado para
+    saltar a cualquier instante ('RoundRobinScheduler.seek') sin repetir la
+    simulación desde el principio.
+    Se toma una instantánea cada 'spacing' avances del planificador (eventos o
+    ticks), o cada 'tamaño / BYTES_PER_ADVANCE' avances si es mayor. Si las
+    instantáneas superan 'memory_budget' bytes, se descarta una de cada dos y
+    se duplica la separación, de modo que la memoria queda acotada y el coste
+    de avanzar desde la instantánea más cercana crece solo de forma logarítmica
+    con la longitud de la ejecución.
+    """
+    # Bytes de instantánea por avance que se admiten como coste amortizado
+    BYTES_PER_ADVANCE = 16
+
+    def __init__(self, memory_budget: int = 32 * 1024 * 1024, spacing: int = 256):
+        """
+        Args:
+            memory_budget (int): Bytes máximos ocupados por las instantáneas.
+            spacing (int): Avances del planificador entre instantáneas (valor inicial).
+        """
+        self.memory_budget = memory_budget
+        self.initial_spacing = spacing
+        self.clear()
+
+    def clear(self):
+        """Descarta todas las instantáneas y restablece la separación inicial."""
+        self.spacing = self.initial_spacing
+        self._times: List[int] = []
+        self._blobs: List[bytes] = []
+        self.nbytes = 0
+        self._countdown = 0  # Avances restantes hasta la próxima instantánea
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def tick(self, scheduler) -> None:
+        """Cuenta un avance del planificador y toma una instantánea cuando corresponde."""
+        if self._countdown > 0:
+            self._countdown -= 1
+            return
+        if self._times and scheduler.time <= self._times[-1]:
+            return # Tramo ya cubierto (p. ej. tras volver atrás con 'seek')
+        size = self.record(scheduler)
+        # Separación mínima proporcional al tamaño de la instantánea: tomarla cuesta
+        # O(procesos), así el coste amortizado por avance no crece con la carga
+        self._countdown = max(self.spacing, size // self.BYTES_PER_ADVANCE) - 1
+
+    def record(self, scheduler) -> int:
+        """
+        Añade una instantánea del estado actual (descarta las de instantes iguales o posteriores).
+        Returns:
+            int: Tamaño en bytes de la instantánea.
+        """
+        blob = scheduler.snapshot(include_history=False, include_future=False)
+        t = scheduler.time
+        if self._times and self._times[-1] >= t:
+            self.discard_after(t - 1)
+        self._times.append(t)
+        self._blobs.append(blob)
+        self.nbytes += len(blob)
+        while self.nbytes > self.memory_budget and len(self._times) > 2:
+            self._thin()
+        return len(blob)
+
+    def _thin(self):
+        """Conserva una de cada dos instantáneas (siempre la primera) y duplica la separación."""
+        self._times = self._times[::2]
+        self._blobs = self._blobs[::2]
+        self.nbytes = sum(len(blob) for blob in self._blobs)
+        self.spacing *= 2
+
+    def nearest_before(self, t: int) -> Optional[Tuple[int, bytes]]:
+        """Devuelve (tiempo, instantánea) de la última instantánea con tiempo <= t, o None."""
+        i = bisect_right(self._times, t)
+        if i == 0:
+            return None
+        return self._times[i - 1], self._blobs[i - 1]
+
+    def first(self) -> Optional[Tuple[int, bytes]]:
+        """Devuelve la instantánea más antigua (normalmente la del inicio de la simulación)."""
+        if not self._times:
+            return None
+        return self._times[0], self._blobs[0]
+
+    def discard_after(self, t: int):
+        """
+        Descarta las instantáneas posteriores a 't' (dejaron de ser válidas, p. ej.
+        porque la simulación cambió a partir de ese instante).
+        """
+        i = bisect_left(self._times, t + 1)
+        if i == len(self._times):
+            return
+        self.nbytes -= sum(len(blob) for blob in self._blobs[i:])
+        del self._times[i:]
+        del self._blobs[i:]
+        self._countdown = 0 # La próxima oportunidad vuelve a tomar una instantánea
+
+class ArrivalIndex:
+    """
+    Índice de la carga de trabajo ordenado por (arrival, orden de inserción).
+    Acompaña al índice de instantáneas: las instantáneas en memoria no guardan
+    la cola de llegadas, que se reconstruye desde aquí al restaurarlas. Así,
+    cambiar un proceso que llega en 't' solo invalida las instantáneas desde 't'.
+    El orden se calcula de forma perezosa, la primera vez que se consulta tras un cambio.
+    """
+    def __init__(self):
+        self._entries: Dict[int, Tuple[int, int, "Process"]] = {}  # pid -> (arrival, orden, proceso)
+        self._order: Optional[List[Tuple[int, int, "Process"]]] = None  # Entradas ordenadas (None = por recalcular)
+        self.next_seq = 0  # Mayor orden de inserción registrado + 1
+        # True si el índice contiene toda la carga (permite repetir la simulación desde t=0)
+        self.complete = True
+
+    def add(self, proc: "Process", seq: int):
+        """Registra un proceso con su orden de inserción en la cola de llegadas."""
+        self._entries[proc.pid] = (proc.arrival, seq, proc)
+        self._order = None
+        self.next_seq = max(self.next_seq, seq + 1)
+
+    def extend(self, pids: Iterable[int], entries: List[Tuple[int, int, "Process"]]):
+        """
+        Registra muchos procesos a la vez: 'entries' son (arrival, orden, proceso) en
+        orden de inserción creciente, con los PIDs en 'pids'.
+        """
+        if not entries:
+            return
+        self._entries.update(zip(pids, entries))
+        self._order = None
+        self.next_seq = max(self.next_seq, entries[-1][1] + 1)
+
+    def remove(self, pid: int) -> Optional[Tuple[int, int, "Process"]]:
+        """Elimina un proceso del índice y devuelve su entrada (o None si no estaba)."""
+        entry = self._entries.pop(pid, None)
+        if entry is not None:
+            self._order = None
+        return entry
+
+    def get(self, pid: int) -> Optional[Tuple[int, int, "Process"]]:
+        """Devuelve la entrada (arrival, orden, proceso) de un PID, o None."""
+        return self._entries.get(pid)
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pending_after(self, t: int) -> List[Tuple["Process", int]]:
+        """Procesos con arrival > t y su orden de inserción, en orden de llegada."""
+        order = self._order
+        if order is None:
+            order = self._order = sorted(self._entries.values())
+        return [(proc, seq) for _, seq, proc in order[bisect_right(order, (t, math.inf)):]]
+
+    def clear(self):
+        """Vacía el índice (la carga vuelve a añadirse desde cero)."""
+        self._entries = {}
+        self._order = None
+        self.next_seq = 0
+        self.complete = True
@@ -0,0 +1,356 @@
+# models/cli.py
+"""
+Ejecutor por lotes sin interfaz gráfica (nunca importa tkinter).
+
+Uso (desde la raíz del repositorio):
+    python -m models.cli carga.csv --quantum 200 --format json --history-out historial.json
+    python -m models.cli --sample --timings
+    python -m models.cli carga.csv --sweep 50,100,200,400 --workers 4 --format csv
+    python -m models.cli carga.csv --policy mlfq:levels=4,boost_interval=5000
+    python -m models.cli traza.rrb --stream --timings
+    python -m models.cli traza.rrb --stream --checkpoint run.snap --resume run.snap
+    python -m models.cli carga.csv --cores 8 --smp-queues per-core --migration-cost 5
+    python -m models.cli carga.csv --sweep 5,20,100 --switch-cost latency=1,cache=20,window=500
+    python -m models.cli carga.csv --policy vrr --io every=30,wait=200,pids=1/3
+    python -m models.cli --generate count=10000000,arrival=bursty,burst=pareto,seed=7 --stream --timings
+    python -m models.cli carga.csv --sweep 50,100,200 --cache-dir .rr-cache
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+
+_import_start = time.perf_counter()
+from models.scheduler import RoundRobinScheduler
+from models.history import ExecutionHistory
+from models.policies import POLICIES, make_policy
+from models.process_table import ProcessTable
+from models.io_model import make_io_model
+from models.overhead import make_switch_cost
+from models.run_cache import RunCache
+from models.smp import QUEUES_GLOBAL, QUEUES_PER_CORE, SMPScheduler
+from models.snapshot import read_checkpoint
+from models.sweep import DEFAULT_ENGINE, run_workload, sweep_quantum
+from models.traces import SAMPLE_WORKLOAD, iter_trace, read_workload
+from models.workload import generate, iter_pairs, make_workload, parse_spec
+_import_seconds = time.perf_counter() - _import_start
+
+# Ráfagas retenidas en memoria en modo streaming antes de descargarlas a disco
+STREAM_HISTORY_WINDOW = 4096
+
+def _open_output(path: str):
+    """Abre el destino de salida ('-' significa salida estándar)."""
+    if path == "-":
+        return sys.stdout
+    return open(path, "w", newline="")
+
+def write_metrics(metrics: dict, path: str, fmt: str):
+    """Escribe las métricas en JSON (objeto) o CSV (filas metric,value)."""
+    out = _open_output(path)
+    try:
+        if fmt == "json":
+            json.dump(metrics, out, indent=2)
+            out.write("\n")
+        else:
+            writer = csv.writer(out)
+            writer.writerow(["metric", "value"])
+            for key, value in metrics.items():
+                writer.writerow([key, value])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+def write_history(history, path: str, fmt: str):
+    """
+    Escribe el historial de ráfagas (pid, start, duration); las ráfagas IDLE tienen pid
+    vacío/null y las de sobrecarga de los cambios de contexto, pid -2.
+    """
+    out = _open_output(path)
+    try:
+        if fmt == "json":
+            json.dump([list(entry) for entry in history], out)
+            out.write("\n")
+        else:
+            writer = csv.writer(out)
+            writer.writerow(["pid", "start", "duration"])
+            for pid, start, duration in history:
+                writer.writerow(["" if pid is None else pid, start, duration])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+def write_core_history(histories, path: str, fmt: str):
+    """
+    Escribe el historial de un planificador multinúcleo (core, pid, start, duration).
+    Las ráfagas IDLE tienen pid vacío/null y las de sobrecarga (migraciones y cambios de contexto), pid -2.
+    """
+    out = _open_output(path)
+    try:
+        if fmt == "json":
+            json.dump([[core] + list(entry) for core, history in enumerate(histories) for entry in history], out)
+            out.write("\n")
+        else:
+            writer = csv.writer(out)
+            writer.writerow(["core", "pid", "start", "duration"])
+            for core, history in enumerate(histories):
+                for pid, start, duration in history:
+                    writer.writerow([core, "" if pid is None else pid, start, duration])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+def write_sweep(rows, path: str, fmt: str):
+    """Escribe la tabla de un barrido de quantums (una fila de métricas por quantum)."""
+    out = _open_output(path)
+    try:
+        if fmt == "json":
+            json.dump(rows, out, indent=2)
+            out.write("\n")
+        else:
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            writer = csv.DictWriter(out, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+def _parse_quanta(text: str):
+    """Convierte '50,100,200' en [50, 100, 200]."""
+    try:
+        return [int(q) for q in text.split(",") if q.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Lista de quantums inválida: {text!r}")
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construye el analizador de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(prog="python -m models.cli",
+                                     description="Simulador Round Robin por lotes (sin interfaz gráfica).")
+    parser.add_argument("workload", nargs="?", help="Fichero de carga de trabajo (.csv, .json o .jsonl).")
+    parser.add_argument("--sample", action="store_true", help="Usar los procesos de ejemplo de la aplicación.")
+    parser.add_argument("--generate", metavar="CLAVE=VALOR,...",
+                        help="Usar una carga sintética (ver models.workload), p. ej. "
+                             "'count=100000,arrival=bursty,burst=lognormal,mean=200,load=0.9,seed=7'.")
+    parser.add_argument("--quantum", type=int, default=200, help="Quantum del Round Robin (por defecto 200).")
+    parser.add_argument("--policy", default="rr", metavar="POLÍTICA[:OPCIONES]",
+                        help=f"Política de planificación ({', '.join(POLICIES)}; por defecto 'rr'), "
+                             "p. ej. 'mlfq:levels=4,boost_interval=5000' o 'wrr:weights=1:3/2:2'.")
+    parser.add_argument("--engine", choices=("tick", "event", "analytic"), default=DEFAULT_ENGINE,
+                        help=f"Motor de simulación (por defecto '{DEFAULT_ENGINE}').")
+    parser.add_argument("--format", choices=("json", "csv"), default="json", help="Formato de salida.")
+    parser.add_argument("--metrics-out", default="-", help="Destino de las métricas ('-' = salida estándar).")
+    parser.add_argument("--history-out", help="Destino del historial de ráfagas (no se escribe si se omite).")
+    parser.add_argument("--stream", action="store_true",
+                        help="Leer la traza de forma perezosa (ordenada por arrival) sin retener los procesos terminados.")
+    parser.add_argument("--sweep", type=_parse_quanta, metavar="Q1,Q2,...",
+                        help="Barrer varios quantums en paralelo y escribir una tabla de métricas por quantum.")
+    parser.add_argument("--workers", type=int, help="Procesos paralelos para --sweep (por defecto, número de CPUs).")
+    parser.add_argument("--checkpoint", metavar="FICHERO",
+                        help="Escribir periódicamente un punto de control de la simulación en este fichero.")
+    parser.add_argument("--checkpoint-interval", type=float, default=60.0, metavar="SEGUNDOS",
+                        help="Segundos entre puntos de control (por defecto 60).")
+    parser.add_argument("--resume", metavar="FICHERO",
+                        help="Reanudar la simulación desde un punto de control (misma carga de trabajo).")
+    parser.add_argument("--switch-cost", metavar="COSTE",
+                        help="Coste de cada cambio de contexto en tiempo simulado: latencia fija ('2') u "
+                             "opciones 'latency=2,cache=20,window=500' (recarga de caché según el tiempo fuera de la CPU).")
+    parser.add_argument("--io", metavar="E/S",
+                        help="E/S de los procesos: 'every=30,wait=200[,pids=1/3]' bloquea cada proceso (o solo "
+                             "los PIDs indicados) 'wait' unidades tras cada 'every' unidades de CPU.")
+    parser.add_argument("--cores", type=int, default=1, help="Número de CPUs (más de 1 usa el planificador multinúcleo).")
+    parser.add_argument("--smp-queues", choices=(QUEUES_GLOBAL, QUEUES_PER_CORE), default=QUEUES_GLOBAL,
+                        help="Cola de listos compartida o una por núcleo (solo con --cores > 1).")
+    parser.add_argument("--no-work-stealing", action="store_true",
+                        help="No robar trabajo entre colas por núcleo cuando un núcleo queda libre.")
+    parser.add_argument("--migration-cost", type=int, default=0, metavar="UNIDADES",
+                        help="Unidades perdidas al ejecutar un proceso en un núcleo distinto del anterior.")
+    parser.add_argument("--cache-dir", metavar="DIRECTORIO",
+                        help="Caché en disco de ejecuciones completas: una carga ya simulada con el mismo quantum, "
+                             "política, coste de cambio de contexto y E/S no se vuelve a simular.")
+    parser.add_argument("--timings", action="store_true", help="Informar tiempos de importación, carga y simulación.")
+    return parser
+
+def _read_table(args) -> ProcessTable:
+    """Carga de trabajo completa indicada en la línea de comandos (fichero, ejemplo o sintética)."""
+    if args.generate:
+        return make_workload(args.generate)
+    if args.sample:
+        return ProcessTable.from_pairs(SAMPLE_WORKLOAD)
+    return read_workload(args.workload)
+
+def _stream_opener(args):
+    """Función que abre la traza en streaming a partir de un número de registros ya leídos."""
+    if args.generate:
+        # La carga sintética se genera una vez (es determinista con su semilla) y se recorre por bloques
+        arrivals, bursts = generate(**parse_spec(args.generate))
+        return lambda skip: itertools.islice(iter_pairs(arrivals, bursts), skip, None)
+    return lambda skip: iter_trace(args.workload, skip=skip)
+
+def _run_stream(args, parser) -> int:
+    """Simula una traza en streaming: la memoria depende de los procesos vivos, no del tamaño de la traza."""
+    t0 = time.perf_counter()
+    # El historial tampoco crece con la traza: sin --history-out no se retiene,
+    # y con él se descarga a un fichero temporal en lugar de quedarse en memoria.
+    spill_path = None
+    if args.history_out:
+        fd, spill_path = tempfile.mkstemp(suffix=".rrh")
+        os.close(fd)
+        history = ExecutionHistory(max_bursts=STREAM_HISTORY_WINDOW, spill_path=spill_path)
+    else:
+        history = ExecutionHistory(max_bursts=0)
+    scheduler = RoundRobinScheduler(quantum=args.quantum, history=history, policy=make_policy(args.policy),
+                                    switch_cost=make_switch_cost(args.switch_cost), io_model=make_io_model(args.io))
+    try:
+        open_stream = _stream_opener(args)
+        if args.resume:
+            scheduler.restore(read_checkpoint(args.resume), reopen_stream=open_stream)
+        else:
+            scheduler.attach_arrival_stream(open_stream(0), keep_finished=False)
+        scheduler.run_until_done(mode=args.engine, checkpoint_path=args.checkpoint,
+                                 checkpoint_interval=args.checkpoint_interval)
+        t1 = time.perf_counter()
+        metrics = scheduler.metrics()
+        write_metrics(metrics, args.metrics_out, args.format)
+        if args.history_out:
+            # Se lee a través del planificador: el motor analítico difiere las ráfagas de sus lotes
+            write_history(scheduler.history.iter_all(), args.history_out, args.format)
+    except (OSError, ValueError, KeyError, RuntimeError) as e:
+        parser.error(f"No se pudo procesar la traza: {e}")
+    finally:
+        if spill_path is not None:
+            history.clear()
+            os.remove(spill_path)
+    if args.timings:
+        print(f"[timings] procesos={scheduler.future.consumed} motor={args.engine} (streaming) "
+              f"importación={_import_seconds * 1000:.1f} ms simulación={(t1 - t0) * 1000:.1f} ms "
+              f"tiempo_simulado={scheduler.time}", file=sys.stderr)
+    return 0
+
+def _cache_timings(cache) -> str:
+    """Aciertos y fallos de la caché para '--timings' ('' sin caché)."""
+    return "" if cache is None else f" caché={cache.hits} aciertos/{cache.misses} fallos"
+
+def _run_smp(args, parser) -> int:
+    """Simula la carga con el planificador Round Robin multinúcleo."""
+    t0 = time.perf_counter()
+    try:
+        table = _read_table(args)
+        scheduler = SMPScheduler(cores=args.cores, quantum=args.quantum, queues=args.smp_queues,
+                                 work_stealing=not args.no_work_stealing, migration_cost=args.migration_cost,
+                                 switch_cost=make_switch_cost(args.switch_cost))
+    except (OSError, ValueError, KeyError, RuntimeError) as e:
+        parser.error(f"No se pudo preparar la simulación: {e}")
+    scheduler.load_table(table)
+    t1 = time.perf_counter()
+    scheduler.run_until_done(mode=args.engine)
+    t2 = time.perf_counter()
+    metrics = scheduler.metrics()
+    t3 = time.perf_counter()
+
+    write_metrics(metrics, args.metrics_out, args.format)
+    if args.history_out:
+        write_core_history(scheduler.histories, args.history_out, args.format)
+    if args.timings:
+        print(f"[timings] procesos={len(table)} cpus={args.cores} colas={args.smp_queues} motor={args.engine} "
+              f"importación={_import_seconds * 1000:.1f} ms carga={(t1 - t0) * 1000:.1f} ms "
+              f"simulación={(t2 - t1) * 1000:.1f} ms métricas={(t3 - t2) * 1000:.1f} ms "
+              f"tiempo_simulado={scheduler.time}", file=sys.stderr)
+    return 0
+
+def main(argv=None) -> int:
+    """Punto de entrada de la línea de comandos."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.quantum <= 0:
+        parser.error("El quantum debe ser positivo.")
+    if args.sample + bool(args.workload) + bool(args.generate) != 1:
+        parser.error("Indica un fichero de carga de trabajo, --sample o --generate (solo uno de ellos).")
+    try:
+        make_policy(args.policy)
+        make_switch_cost(args.switch_cost)
+        make_io_model(args.io)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.checkpoint_interval <= 0:
+        parser.error("El intervalo entre puntos de control debe ser positivo.")
+    if args.sweep and (args.checkpoint or args.resume):
+        parser.error("--sweep no admite --checkpoint ni --resume.")
+    if args.cache_dir and (args.stream or args.cores > 1 or args.checkpoint or args.resume):
+        parser.error("--cache-dir no admite --stream, --cores > 1, --checkpoint ni --resume.")
+
+    if args.cores <= 0:
+        parser.error("El número de CPUs debe ser positivo.")
+    if args.cores > 1:
+        if args.stream or args.sweep or args.checkpoint or args.resume:
+            parser.error("--cores > 1 no admite --stream, --sweep, --checkpoint ni --resume.")
+        if make_policy(args.policy).name != "rr":
+            parser.error("El planificador multinúcleo solo admite la política 'rr'.")
+        if args.io:
+            parser.error("El planificador multinúcleo no admite --io.")
+        return _run_smp(args, parser)
+
+    if args.stream:
+        if args.sample or args.sweep:
+            parser.error("--stream requiere un fichero de traza o --generate y no admite --sweep.")
+        return _run_stream(args, parser)
+
+    t0 = time.perf_counter()
+    try:
+        table = _read_table(args)
+    except (OSError, ValueError, KeyError, RuntimeError) as e:
+        parser.error(f"No se pudo leer la carga de trabajo: {e}")
+    t1 = time.perf_counter()
+    cache = None
+    if args.cache_dir:
+        try:
+            cache = RunCache(directory=args.cache_dir)
+        except OSError as e:
+            parser.error(f"No se pudo usar el directorio de la caché: {e}")
+    if args.sweep:
+        try:
+            rows = sweep_quantum(table, args.sweep, workers=args.workers, engine=args.engine, policy=args.policy,
+                                 switch_cost=args.switch_cost, cache=cache, io=args.io)
+        except ValueError as e:
+            parser.error(str(e))
+        t2 = time.perf_counter()
+        write_sweep(rows, args.metrics_out, args.format)
+        if args.timings:
+            print(f"[timings] procesos={len(table)} quantums={len(rows)} motor={args.engine} "
+                  f"importación={_import_seconds * 1000:.1f} ms carga={(t1 - t0) * 1000:.1f} ms "
+                  f"barrido={(t2 - t1) * 1000:.1f} ms{_cache_timings(cache)}", file=sys.stderr)
+        return 0
+    if args.checkpoint or args.resume:
+        scheduler = RoundRobinScheduler(quantum=args.quantum, policy=make_policy(args.policy),
+                                        switch_cost=make_switch_cost(args.switch_cost),
+                                        io_model=make_io_model(args.io))
+        scheduler.load_table(table)
+        try:
+            if args.resume:
+                scheduler.restore(read_checkpoint(args.resume)) # Los procesos se emparejan por PID
+            scheduler.run_until_done(mode=args.engine, checkpoint_path=args.checkpoint,
+                                     checkpoint_interval=args.checkpoint_interval)
+        except (OSError, ValueError) as e:
+            parser.error(f"No se pudo reanudar o guardar el punto de control: {e}")
+    else:
+        scheduler = run_workload(table, args.quantum, args.engine, args.policy, args.switch_cost, cache, args.io)
+    t2 = time.perf_counter()
+    metrics = scheduler.metrics()
+    t3 = time.perf_counter()
+
+    write_metrics(metrics, args.metrics_out, args.format)
+    if args.history_out:
+        write_history(scheduler.history, args.history_out, args.format)
+    if args.timings:
+        print(f"[timings] procesos={len(table)} motor={args.engine} política={args.policy} "
+              f"importación={_import_seconds * 1000:.1f} ms carga={(t1 - t0) * 1000:.1f} ms "
+              f"simulación={(t2 - t1) * 1000:.1f} ms métricas={(t3 - t2) * 1000:.1f} ms "
+              f"tiempo_simulado={scheduler.time}{_cache_timings(cache)}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
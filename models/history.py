@@ -0,0 +1,395 @@
+# models/history.py
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import add, ge, mul, sub
+from typing import Iterator, List, Optional, Tuple
+
+# Código almacenado en la columna de PIDs para las ráfagas IDLE (pid None)
+IDLE_CODE = -1
+# PID de los segmentos de sobrecarga: la CPU está ocupada sin que avance ningún
+# proceso (p. ej. la migración de un proceso entre núcleos)
+OVERHEAD_PID = -2
+
+# Registro binario de las ráfagas descargadas a disco: (pid, start, duration) int64
+_SPILL_RECORD = struct.Struct("<qqq")
+
+Burst = Tuple[Optional[int], int, int]
+
+class ExecutionHistory:
+    """
+    Historial de ráfagas de ejecución almacenado por columnas (pid/start/duration
+    en 'array' de enteros).
+    - Las ráfagas contiguas del mismo PID se fusionan en una sola.
+    - Política de retención opcional: conservar solo las últimas 'max_bursts' ráfagas
+      y/o las que terminan dentro de las últimas 'max_span' unidades de tiempo.
+    - Las ráfagas descartadas pueden descargarse a un fichero ('spill_path').
+    Se recorre como una secuencia de tuplas (pid, start, duration), igual que la
+    lista que usaba el planificador, y con 'pid' None para las ráfagas IDLE.
+    """
+    def __init__(self, merge: bool = True, max_bursts: Optional[int] = None,
+                 max_span: Optional[int] = None, spill_path: Optional[str] = None):
+        """
+        Args:
+            merge (bool): Fusionar ráfagas contiguas del mismo PID.
+            max_bursts (int): Máximo de ráfagas retenidas en memoria (None = sin límite).
+            max_span (int): Unidades de tiempo retenidas hacia atrás desde el final del historial.
+            spill_path (str): Fichero donde se descargan las ráfagas que salen de la retención.
+        """
+        self.merge = merge
+        self.max_bursts = max_bursts
+        self.max_span = max_span
+        self.spill_path = spill_path
+        self._spill_file = None
+        self._pyramid: Optional["OccupancyPyramid"] = None  # Resumen para el Gantt con poco zoom (bajo demanda)
+        self.clear()
+
+    def clear(self):
+        """Vacía el historial (incluido el fichero de descarga, si existe)."""
+        self._pid = array("q")
+        self._start = array("q")
+        self._duration = array("q")
+        self._first = 0  # Índice de la primera ráfaga retenida (las anteriores están pendientes de compactar)
+        self.spilled = 0  # Ráfagas descargadas o descartadas
+        if self._pyramid is not None:
+            self._pyramid = OccupancyPyramid()  # Sigue activa, pero vacía
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        if self.spill_path is not None:
+            open(self.spill_path, "wb").close()
+
+    def append(self, pid: Optional[int], start: int, duration: int):
+        """Añade una ráfaga, fusionándola con la anterior si es contigua y del mismo PID."""
+        code = IDLE_CODE if pid is None else pid
+        if self._pyramid is not None:
+            self._pyramid.add(code, start, duration)
+        n = len(self._pid)
+        if (self.merge and n > self._first and self._pid[-1] == code
+                and self._start[-1] + self._duration[-1] == start):
+            self._duration[-1] += duration
+        else:
+            self._pid.append(code)
+            self._start.append(start)
+            self._duration.append(duration)
+        if self.max_bursts is not None or self.max_span is not None:
+            self._apply_retention()
+
+    def _apply_retention(self):
+        """Mueve el inicio de la ventana retenida y compacta las columnas de forma amortizada."""
+        n = len(self._pid)
+        first = self._first
+        if self.max_bursts is not None:
+            first = max(first, n - self.max_bursts)
+        if self.max_span is not None and n:
+            horizon = self._start[-1] + self._duration[-1] - self.max_span
+            # Primera ráfaga que termina después del horizonte (los finales están ordenados)
+            while first < n and self._start[first] + self._duration[first] <= horizon:
+                first += 1
+        if first == self._first:
+            return
+        self._spill(self._first, first)
+        self._first = first
+        if first >= len(self._pid) // 2 and first >= 1024:
+            self._compact()
+
+    def _spill(self, lo: int, hi: int):
+        """Descarga a disco las ráfagas [lo, hi) que salen de la ventana retenida."""
+        self.spilled += hi - lo
+        if self.spill_path is None:
+            return
+        if self._spill_file is None:
+            self._spill_file = open(self.spill_path, "ab")
+        pack = _SPILL_RECORD.pack
+        self._spill_file.write(b"".join(pack(self._pid[i], self._start[i], self._duration[i]) for i in range(lo, hi)))
+
+    def _compact(self):
+        """Elimina físicamente de las columnas las ráfagas ya descartadas."""
+        first = self._first
+        del self._pid[:first]
+        del self._start[:first]
+        del self._duration[:first]
+        self._first = 0
+
+    def __len__(self) -> int:
+        """Número de ráfagas retenidas en memoria."""
+        return len(self._pid) - self._first
+
+    def __bool__(self) -> bool:
+        return len(self._pid) > self._first
+
+    def _entry(self, i: int) -> Burst:
+        code = self._pid[i]
+        return (None if code == IDLE_CODE else code, self._start[i], self._duration[i])
+
+    def __getitem__(self, index: int) -> Burst:
+        """Acceso por posición dentro de las ráfagas retenidas (admite índices negativos)."""
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("Índice fuera del historial retenido.")
+        return self._entry(self._first + index)
+
+    def __iter__(self) -> Iterator[Burst]:
+        """Recorre las ráfagas retenidas como tuplas (pid, start, duration)."""
+        for i in range(self._first, len(self._pid)):
+            yield self._entry(i)
+
+    def iter_all(self) -> Iterator[Burst]:
+        """Recorre todo el historial: primero lo descargado a disco y después lo retenido."""
+        if self.spill_path is not None:
+            if self._spill_file is not None:
+                self._spill_file.flush()
+            with open(self.spill_path, "rb") as f:
+                data = f.read()
+            for code, start, duration in _SPILL_RECORD.iter_unpack(data):
+                yield (None if code == IDLE_CODE else code, start, duration)
+        yield from self
+
+    def range(self, t0: float, t1: float) -> Iterator[Burst]:
+        """
+        Recorre las ráfagas retenidas que intersecan el intervalo [t0, t1).
+        Como las ráfagas están ordenadas y no se solapan, la búsqueda inicial es O(log n).
+        """
+        n = len(self._pid)
+        i = bisect_right(self._start, t0, self._first, n) - 1
+        if i < self._first or self._start[i] + self._duration[i] <= t0:
+            i += 1
+        i = max(i, self._first)
+        while i < n and self._start[i] < t1:
+            yield self._entry(i)
+            i += 1
+
+    def cursor(self) -> Tuple[int, int]:
+        """
+        Posición actual del historial: (ráfagas registradas en total, incluidas las
+        descargadas; instante final). Permite volver a este punto con 'truncate'.
+        """
+        return self.spilled + len(self), self.end_time()
+
+    def cursor_at(self, t: int) -> Tuple[int, int]:
+        """
+        Cursor del historial tal como estaba en el instante 't' (ráfagas iniciadas
+        antes de 't', con la última recortada en 't'), para un historial que ya
+        contiene ráfagas posteriores.
+        """
+        n = bisect_left(self._start, t, self._first, len(self._pid))
+        if n == self._first:
+            return self.spilled, 0
+        return self.spilled + n - self._first, min(t, self._start[n - 1] + self._duration[n - 1])
+
+    def truncate(self, count: int, end: int):
+        """
+        Devuelve el historial a un cursor obtenido con 'cursor()': descarta las
+        ráfagas posteriores y recorta la última (que pudo alargarse al fusionar).
+        Raises:
+            ValueError: Si el cursor cae en ráfagas ya descargadas o no existe aún.
+        """
+        keep = count - self.spilled
+        if keep < 0 or keep > len(self):
+            raise ValueError(f"El historial no contiene el cursor {count} (retenidas {self.spilled}..{self.spilled + len(self)}).")
+        cut = self._first + keep
+        del self._pid[cut:]
+        del self._start[cut:]
+        del self._duration[cut:]
+        if keep:
+            self._duration[-1] = end - self._start[-1]
+        if self._pyramid is not None:
+            self._pyramid.truncate(end, self)
+
+    def columns(self, limit: Optional[int] = None) -> Tuple[array, array, array]:
+        """
+        Copia de las columnas (pid, start, duration) de las ráfagas retenidas (IDLE con
+        pid IDLE_CODE); con 'limit', solo las 'limit' primeras.
+        """
+        first = self._first
+        end = len(self._pid) if limit is None else first + limit
+        return self._pid[first:end], self._start[first:end], self._duration[first:end]
+
+    def load_columns(self, pid: array, start: array, duration: array, spilled: int = 0):
+        """Sustituye las ráfagas retenidas por las columnas dadas (p. ej. al restaurar una instantánea)."""
+        self._pid = array("q", pid)
+        self._start = array("q", start)
+        self._duration = array("q", duration)
+        self._first = 0
+        self.spilled = spilled
+        if self._pyramid is not None:
+            self._pyramid = None
+            self.pyramid()
+
+    def count_range(self, t0: float, t1: float) -> int:
+        """Número aproximado (±1) de ráfagas retenidas en [t0, t1), calculado en O(log n)."""
+        lo = bisect_right(self._start, t0, self._first, len(self._pid))
+        hi = bisect_right(self._start, t1, self._first, len(self._pid))
+        return hi - lo + 1
+
+    def pyramid(self) -> "OccupancyPyramid":
+        """
+        Devuelve la pirámide de ocupación del historial, creándola la primera vez con
+        las ráfagas retenidas; a partir de entonces se mantiene de forma incremental.
+        """
+        if self._pyramid is None:
+            self._pyramid = OccupancyPyramid()
+            for i in range(self._first, len(self._pid)):
+                self._pyramid.add(self._pid[i], self._start[i], self._duration[i])
+        return self._pyramid
+
+    def end_time(self) -> int:
+        """Instante final de la última ráfaga registrada (0 si está vacío)."""
+        if not self:
+            return 0
+        return self._start[-1] + self._duration[-1]
+
+def _merge_pairs(busy: array, pid: array, units: array) -> Tuple[array, array, array]:
+    """
+    Fusiona cubetas consecutivas de dos en dos (nivel siguiente de la pirámide).
+    La ocupación se suma y el PID dominante es el del hijo con más unidades.
+    """
+    if len(busy) % 2:
+        busy = busy + array("q", [0])
+        pid = pid + array("q", [IDLE_CODE])
+        units = units + array("q", [0])
+    busy_a, busy_b = busy[0::2], busy[1::2]
+    pid_a, pid_b = pid[0::2], pid[1::2]
+    units_a, units_b = units[0::2], units[1::2]
+    # Todo con map() sobre operadores de C para no ejecutar bytecode por cubeta:
+    # pid = pb + (pa - pb) * (ua >= ub), y lo mismo para las unidades del dominante
+    first_wins = list(map(ge, units_a, units_b))
+    merged_busy = array("q", list(map(add, busy_a, busy_b)))
+    merged_pid = array("q", list(map(add, pid_b, map(mul, map(sub, pid_a, pid_b), first_wins))))
+    merged_units = array("q", list(map(add, units_b, map(mul, map(sub, units_a, units_b), first_wins))))
+    return merged_busy, merged_pid, merged_units
+
+class OccupancyPyramid:
+    """
+    Resumen multirresolución de la ocupación de la CPU para dibujar el Gantt con poco zoom.
+    El nivel 0 divide el tiempo en cubetas de 'width' unidades (potencia de dos) con la
+    ocupación (unidades de CPU ocupadas) y el PID dominante de cada cubeta; cada nivel
+    superior fusiona las cubetas del anterior de dos en dos. Los niveles superiores se
+    recalculan de forma perezosa solo a partir de la primera cubeta modificada.
+    El PID dominante es aproximado: se conserva el que más unidades acumula de forma
+    contigua dentro de la cubeta.
+    """
+    # Máximo de cubetas del nivel 0; al superarlo se duplica el ancho de cubeta
+    MAX_BUCKETS = 1 << 17
+
+    def __init__(self):
+        self.width = 1  # Unidades de tiempo por cubeta en el nivel 0
+        self._busy = array("q")
+        self._pid = array("q")
+        self._units = array("q")
+        # Niveles superiores en caché: lista de (busy, pid, units, cubetas válidas)
+        self._levels: List[List] = []
+
+    def add(self, code: int, start: int, duration: int):
+        """Registra una ráfaga (las ráfagas IDLE no cuentan como ocupación)."""
+        if code == IDLE_CODE or duration <= 0:
+            return
+        end = start + duration
+        while end > self.width * self.MAX_BUCKETS:
+            self._coarsen()
+        w = self.width
+        busy, pids, units = self._busy, self._pid, self._units
+        first = start // w
+        last = (end - 1) // w
+        if len(busy) <= last:
+            grow = last + 1 - len(busy)
+            busy.extend(array("q", [0]) * grow)
+            pids.extend(array("q", [IDLE_CODE]) * grow)
+            units.extend(array("q", [0]) * grow)
+        # Cubetas parciales de los extremos
+        for b in (first, last) if first != last else (first,):
+            overlap = min(end, (b + 1) * w) - max(start, b * w)
+            busy[b] += overlap
+            if pids[b] == code:
+                units[b] += overlap
+            elif overlap > units[b]:
+                pids[b] = code
+                units[b] = overlap
+        # Cubetas centrales cubiertas por completo (aún vacías: las ráfagas llegan en orden)
+        if last - first > 1:
+            span = last - first - 1
+            busy[first + 1:last] = array("q", [w]) * span
+            pids[first + 1:last] = array("q", [code]) * span
+            units[first + 1:last] = array("q", [w]) * span
+        for level in self._levels:
+            first >>= 1
+            level[3] = min(level[3], first)
+
+    def truncate(self, end: int, history: "ExecutionHistory"):
+        """
+        Descarta la ocupación registrada a partir de 'end' y reconstruye la cubeta
+        parcial con las ráfagas del historial que la solapan.
+        """
+        w = self.width
+        b = end // w
+        del self._busy[b:]
+        del self._pid[b:]
+        del self._units[b:]
+        for j, level in enumerate(self._levels, 1):
+            level[3] = min(level[3], b >> j)
+        for pid, start, duration in history.range(b * w, end):
+            lo = max(start, b * w)
+            hi = min(start + duration, end)
+            if hi > lo:
+                self.add(IDLE_CODE if pid is None else pid, lo, hi - lo)
+
+    def _coarsen(self):
+        """Duplica el ancho de las cubetas del nivel 0 fusionándolas de dos en dos."""
+        self._busy, self._pid, self._units = _merge_pairs(self._busy, self._pid, self._units)
+        self.width *= 2
+        self._levels = []
+
+    def _level(self, j: int) -> Tuple[array, array, array]:
+        """Devuelve el nivel 'j' (0 = el más fino), recalculando solo la parte invalidada."""
+        if j == 0:
+            return self._busy, self._pid, self._units
+        while len(self._levels) < j:
+            self._levels.append([array("q"), array("q"), array("q"), 0])
+        level = self._levels[j - 1]
+        lower_busy, lower_pid, lower_units = self._level(j - 1)
+        valid = level[3]
+        target = (len(lower_busy) + 1) // 2
+        if valid < target or len(level[0]) != target:
+            lo = valid * 2
+            busy, pids, units = _merge_pairs(lower_busy[lo:], lower_pid[lo:], lower_units[lo:])
+            for col, new in zip(level[:3], (busy, pids, units)):
+                del col[valid:]
+                col.extend(new)
+            level[3] = len(level[0])
+        return level[0], level[1], level[2]
+
+    def columns(self, t0: float, t1: float, count: int) -> List[Tuple[Optional[int], float]]:
+        """
+        Resume el intervalo [t0, t1) en 'count' columnas (p. ej. una por píxel).
+        Returns:
+            List[Tuple[Optional[int], float]]: Para cada columna, el PID dominante
+            (None si no hubo ocupación) y la fracción de CPU ocupada (0..1).
+        """
+        if count <= 0 or t1 <= t0:
+            return []
+        per_column = (t1 - t0) / count
+        # Nivel más grueso cuyas cubetas siguen siendo más estrechas que una columna
+        j = 0
+        while self.width << (j + 1) <= per_column:
+            j += 1
+        busy, pids, units = self._level(j)
+        w = self.width << j
+        n = len(busy)
+        result = []
+        for c in range(count):
+            c0 = t0 + c * per_column
+            b0 = max(0, int(c0 // w))
+            b1 = min(n, int(-(-(c0 + per_column) // w)))
+            total = 0
+            best_pid = IDLE_CODE
+            best_units = 0
+            for b in range(b0, b1):
+                total += busy[b]
+                if units[b] > best_units:
+                    best_units = units[b]
+                    best_pid = pids[b]
+            span = (b1 - b0) * w if b1 > b0 else 1
+            result.append((None if best_pid == IDLE_CODE else best_pid, min(1.0, total / span)))
+        return result
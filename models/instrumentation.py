@@ -0,0 +1,163 @@
+# models/instrumentation.py
+"""
+Instrumentación opcional del camino crítico: temporizadores y contadores por fase.
+
+No añade comprobaciones al código medido: al activarla se instalan envoltorios
+sobre los métodos de cada objeto (atributos de instancia que ocultan los de la
+clase) y al desactivarla se retiran, de modo que desactivada no cuesta nada.
+Cada fase acumula llamadas y segundos; los tiempos son inclusivos (una fase
+incluye las fases que se ejecutan dentro de ella), pero una fase que se llama
+a sí misma de forma anidada no se cuenta dos veces.
+
+Incluye también la captura de perfiles con cProfile ('ProfileCapture').
+"""
+import cProfile
+import io
+import pstats
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+class Instrumentation:
+    """Temporizadores por fase y contadores, instalados envolviendo métodos."""
+    def __init__(self):
+        self._phases: Dict[str, List] = {}  # fase -> [llamadas, segundos, profundidad de anidamiento]
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, List] = {}  # nombre -> [función de lectura, valor al poner a cero]
+        self._patches: List[tuple] = []  # (objeto, nombre, valor previo en la instancia o None)
+        self._started = time.perf_counter()
+
+    def wrap(self, owner: Any, name: str, phase: Optional[str] = None, counter: Optional[str] = None,
+             amount: Optional[Callable[[Any], int]] = None):
+        """
+        Mide las llamadas a 'owner.name' hasta 'uninstall'.
+        Args:
+            phase (str): Fase a la que se suman las llamadas y el tiempo (None = solo contar).
+            counter (str): Contador que se incrementa en cada llamada.
+            amount: Si se indica, el contador se incrementa en 'amount(resultado)' en lugar de en 1.
+        """
+        original = getattr(owner, name)
+        entry = self._phases.setdefault(phase, [0, 0.0, 0]) if phase is not None else None
+        counters = self._counters
+        if counter is not None:
+            counters.setdefault(counter, 0)
+        perf_counter = time.perf_counter
+
+        def measured(*args, **kwargs):
+            if entry is None or entry[2]:
+                result = original(*args, **kwargs)
+                if entry is not None:
+                    entry[0] += 1
+            else:
+                entry[2] = 1
+                start = perf_counter()
+                try:
+                    result = original(*args, **kwargs)
+                finally:
+                    entry[1] += perf_counter() - start
+                    entry[0] += 1
+                    entry[2] = 0
+            if counter is not None:
+                counters[counter] += 1 if amount is None else amount(result)
+            return result
+
+        previous = getattr(owner, "__dict__", {}).get(name)
+        setattr(owner, name, measured)
+        self._patches.append((owner, name, previous))
+
+    def track(self, name: str, read: Callable[[], int]):
+        """Contador derivado de un valor que el objeto ya mantiene (se informa su incremento)."""
+        self._gauges[name] = [read, read()]
+
+    def count(self, name: str, amount: int = 1):
+        """Incrementa un contador manualmente."""
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def uninstall(self):
+        """Retira todos los envoltorios (en orden inverso, por si un método se envolvió dos veces)."""
+        for owner, name, previous in reversed(self._patches):
+            if previous is None:
+                try:
+                    delattr(owner, name)
+                except AttributeError:
+                    pass
+            else:
+                setattr(owner, name, previous)
+        self._patches = []
+
+    def reset(self):
+        """Pone a cero fases y contadores sin retirar los envoltorios."""
+        for entry in self._phases.values():
+            entry[0], entry[1] = 0, 0.0
+        for name in self._counters:
+            self._counters[name] = 0
+        for gauge in self._gauges.values():
+            gauge[1] = gauge[0]()
+        self._started = time.perf_counter()
+
+    def phase(self, name: str) -> Dict[str, float]:
+        """Llamadas y segundos acumulados de una fase (ceros si no existe)."""
+        calls, seconds, _ = self._phases.get(name, (0, 0.0, 0))
+        return {"calls": calls, "seconds": seconds, "mean_us": seconds * 1e6 / calls if calls else 0.0}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            dict: 'elapsed' (segundos desde la activación o el último 'reset'),
+            'phases' ({fase: {'calls', 'seconds', 'mean_us'}}) y 'counters'.
+        """
+        counters = dict(self._counters)
+        for name, (read, base) in self._gauges.items():
+            counters[name] = read() - base
+        return {
+            "elapsed": time.perf_counter() - self._started,
+            "phases": {name: self.phase(name) for name in self._phases},
+            "counters": counters,
+        }
+
+def format_stats(stats: Dict[str, Any], title: str = "") -> str:
+    """Texto de varias líneas con las fases (ordenadas por tiempo) y los contadores de 'stats()'."""
+    lines = [title] if title else []
+    phases = stats.get("phases", {})
+    elapsed = stats.get("elapsed") or 0.0
+    for name, phase in sorted(phases.items(), key=lambda item: -item[1]["seconds"]):
+        share = f"{phase['seconds'] / elapsed:>6.1%}" if elapsed else ""
+        lines.append(f"{name:<12}{phase['calls']:>10,} {phase['seconds'] * 1000:>10.1f} ms {share}")
+    for name, value in stats.get("counters", {}).items():
+        lines.append(f"{name:<22}{value:>12,}")
+    return "\n".join(lines)
+
+class ProfileCapture:
+    """Captura con cProfile activable y desactivable (p. ej. desde la interfaz)."""
+    def __init__(self):
+        self._profiler: Optional[cProfile.Profile] = None
+
+    @property
+    def active(self) -> bool:
+        return self._profiler is not None
+
+    def start(self):
+        """Empieza a perfilar (no hace nada si ya se está perfilando)."""
+        if self._profiler is None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self, path: Optional[str] = None, limit: int = 15, sort: str = "cumulative") -> str:
+        """
+        Detiene la captura.
+        Args:
+            path (str): Si se indica, guarda el perfil en este fichero (formato pstats,
+                legible con 'python -m pstats').
+            limit (int): Funciones incluidas en el resumen.
+            sort (str): Criterio de orden del resumen ('cumulative', 'tottime', ...).
+        Returns:
+            str: Resumen de pstats con las funciones más costosas ('' si no se perfilaba).
+        """
+        profiler, self._profiler = self._profiler, None
+        if profiler is None:
+            return ""
+        profiler.disable()
+        if path is not None:
+            profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
@@ -0,0 +1,102 @@
+# models/io_model.py
+"""
+Operaciones de E/S en tiempo simulado.
+
+Por defecto los procesos solo usan la CPU; con un 'IOModel' cada proceso afectado
+se bloquea tras cada 'every' unidades de CPU y espera 'wait' unidades antes de
+volver a la cola de listos. La ráfaga que termina el proceso no va seguida de
+E/S. Un proceso bloqueado deja la CPU antes de agotar su rodaja, que es lo que
+distinguen Virtual Round Robin (cola auxiliar) y Weighted Round Robin (déficit)
+de Round Robin. El tiempo bloqueado no cuenta como espera en 'metrics()'.
+"""
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from models.scheduler import Process
+
+class IOModel:
+    """Patrón de E/S periódico: 'wait' unidades bloqueado tras cada 'every' unidades de CPU."""
+    def __init__(self, every: int, wait: int, pids: Optional[Iterable[int]] = None):
+        """
+        Args:
+            every (int): Unidades de CPU entre dos peticiones de E/S.
+            wait (int): Unidades que dura cada E/S.
+            pids: PIDs de los procesos que hacen E/S (None = todos).
+        Raises:
+            ValueError: Si 'every' o 'wait' no son positivos o 'pids' está vacío.
+        """
+        if every <= 0 or wait <= 0:
+            raise ValueError("El periodo y la duración de la E/S deben ser positivos.")
+        self.every = every
+        self.wait = wait
+        self.pids = frozenset(pids) if pids is not None else None
+        if self.pids is not None and not self.pids:
+            raise ValueError("La lista de PIDs con E/S no puede estar vacía.")
+
+    def applies(self, pid: int) -> bool:
+        """True si el proceso hace E/S."""
+        return self.pids is None or pid in self.pids
+
+    def until_request(self, proc: "Process") -> Optional[int]:
+        """
+        Unidades de CPU que le quedan al proceso hasta su próxima petición de E/S
+        (None si no hace E/S o terminará antes).
+        """
+        if not self.applies(proc.pid):
+            return None
+        units = self.every - (proc.burst - proc.remaining) % self.every
+        return units if units < proc.remaining else None
+
+    def requests(self, proc: "Process") -> bool:
+        """True si el proceso acaba de completar 'every' unidades de CPU y debe bloquearse."""
+        if proc.remaining <= 0 or not self.applies(proc.pid):
+            return False
+        done = proc.burst - proc.remaining
+        return done > 0 and done % self.every == 0
+
+    def blocked_time(self, pid: int, burst: int) -> int:
+        """Tiempo total que un proceso de ráfaga 'burst' pasa bloqueado en E/S."""
+        if not self.applies(pid):
+            return 0
+        return (burst - 1) // self.every * self.wait
+
+    def spec(self) -> str:
+        """Especificación textual equivalente (ver 'make_io_model')."""
+        spec = f"every={self.every},wait={self.wait}"
+        if self.pids is not None:
+            spec += ",pids=" + "/".join(str(pid) for pid in sorted(self.pids))
+        return spec
+
+    def __repr__(self) -> str:
+        return f"IOModel({self.spec()})"
+
+def make_io_model(spec: Optional[str]) -> Optional[IOModel]:
+    """
+    Crea un modelo de E/S a partir de una especificación textual
+    'every=10,wait=30[,pids=1/3]'. Al ser texto, se puede pasar a los procesos
+    trabajadores de un barrido.
+    Returns:
+        IOModel: El modelo, o None si la especificación está vacía (sin E/S).
+    Raises:
+        ValueError: Si la especificación no es válida.
+    """
+    if spec is None or not spec.strip():
+        return None
+    kwargs = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        key = key.strip().lower()
+        if not sep or key not in ("every", "wait", "pids"):
+            raise ValueError(f"Opción de E/S inválida: {item!r} (se esperaba every=, wait= o pids=)")
+        try:
+            if key == "pids":
+                kwargs[key] = [int(v) for v in value.split("/") if v.strip()]
+            else:
+                kwargs[key] = int(value)
+        except ValueError:
+            raise ValueError(f"Valor inválido para la opción {key!r}: {value!r}")
+    if "every" not in kwargs or "wait" not in kwargs:
+        raise ValueError("La especificación de E/S necesita 'every' y 'wait'.")
+    return IOModel(**kwargs)
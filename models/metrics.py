@@ -0,0 +1,226 @@
+# models/metrics.py
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+from models.process_table import NO_VALUE, ProcessTable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa el cálculo en Python puro
+    np = None
+
+# Percentiles reportados para turnaround, espera y respuesta
+PERCENTILES = (50, 95, 99)
+
+def compute_metrics(arrival: Sequence[int], burst: Sequence[int], start: Sequence[int],
+                    completion: Sequence[int], context_switches: int) -> Dict[str, Any]:
+    """
+    Calcula las métricas de rendimiento a partir de columnas de procesos terminados.
+    Usa NumPy (una sola pasada vectorizada) si está disponible y, si no, un único
+    recorrido en Python puro.
+    Args:
+        arrival, burst, start, completion: Columnas alineadas (una posición por proceso).
+            'start' usa NO_VALUE para procesos sin tiempo de inicio.
+        context_switches (int): Número de cambios de contexto de la simulación.
+    Returns:
+        dict: Métricas con las mismas claves que 'RoundRobinScheduler.metrics'
+              más los percentiles p50/p95/p99 de turnaround, espera y respuesta.
+    """
+    if len(completion) == 0:
+        return {}
+    if np is not None:
+        return _compute_numpy(arrival, burst, start, completion, context_switches)
+    return _compute_python(arrival, burst, start, completion, context_switches)
+
+def finished_columns(table: ProcessTable, count: Optional[int] = None) -> Optional[tuple]:
+    """
+    Columnas arrival, burst, start y completion de las filas terminadas de una
+    'ProcessTable', como vectores de NumPy leídos directamente de los arrays
+    (sin crear un objeto de Python por proceso).
+    Args:
+        count (int): Número de filas terminadas esperado (p. ej. len(finished)).
+    Returns:
+        tuple: Las cuatro columnas, o None si NumPy no está disponible o si la
+               tabla tiene otro número de filas terminadas (restos de otra ejecución).
+    """
+    if np is None:
+        return None
+    completion = _as_int64(table.completion_time)
+    done = completion != NO_VALUE
+    if count is not None and int(np.count_nonzero(done)) != count:
+        return None
+    return (_as_int64(table.arrival)[done], _as_int64(table.burst)[done],
+            _as_int64(table.start_time)[done], completion[done])
+
+def table_metrics(table: ProcessTable, context_switches: int) -> Dict[str, Any]:
+    """Calcula las métricas directamente sobre las filas terminadas de una 'ProcessTable'."""
+    columns = finished_columns(table)
+    if columns is not None:
+        return compute_metrics(*columns, context_switches)
+    rows = [i for i, c in enumerate(table.completion_time) if c != NO_VALUE]
+    return compute_metrics([table.arrival[i] for i in rows], [table.burst[i] for i in rows],
+                           [table.start_time[i] for i in rows], [table.completion_time[i] for i in rows],
+                           context_switches)
+
+def _as_int64(column):
+    """Convierte una columna a un vector int64 de NumPy (sin copia si es un array('q'))."""
+    if isinstance(column, np.ndarray):
+        return column.astype(np.int64, copy=False)
+    try:
+        return np.frombuffer(column, dtype=np.int64)
+    except (TypeError, ValueError):
+        return np.asarray(column, dtype=np.int64)
+
+def _compute_numpy(arrival, burst, start, completion, context_switches: int) -> Dict[str, Any]:
+    """Versión vectorizada de 'compute_metrics'."""
+    arrival = _as_int64(arrival)
+    burst = _as_int64(burst)
+    start = _as_int64(start)
+    completion = _as_int64(completion)
+    n = len(completion)
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    response = np.where(start != NO_VALUE, start - arrival, 0)
+    makespan = int(completion.max())
+    positive = burst > 0
+    ntat = turnaround[positive] / burst[positive]
+    avg_ntat = float(ntat.mean()) if len(ntat) else 0
+    stdev_ntat = 0
+    cv_ntat = 0
+    if len(ntat) > 1:
+        stdev_ntat = float(ntat.std(ddof=1))
+        if avg_ntat > 0:
+            cv_ntat = stdev_ntat / avg_ntat * 100
+    result = {
+        "avg_turnaround": int(turnaround.sum()) / n,
+        "avg_waiting": int(waiting.sum()) / n,
+        "avg_response": int(response.sum()) / n,
+        "context_switches": context_switches,
+        "throughput": n / makespan if makespan > 0 else float('inf'),
+        "makespan": makespan,
+        "avg_ntat": avg_ntat,
+        "stdev_ntat": stdev_ntat,
+        "cv_ntat": cv_ntat
+    }
+    for name, values in (("turnaround", turnaround), ("waiting", waiting), ("response", response)):
+        for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            result[f"p{p}_{name}"] = float(value)
+    return result
+
+def _compute_python(arrival, burst, start, completion, context_switches: int) -> Dict[str, Any]:
+    """Versión en Python puro de 'compute_metrics' (un único recorrido de las columnas)."""
+    n = len(completion)
+    turnaround: List[int] = []
+    waiting: List[int] = []
+    response: List[int] = []
+    ntat_values: List[float] = []
+    makespan = 0
+    for a, b, s, c in zip(arrival, burst, start, completion):
+        tat = c - a
+        turnaround.append(tat)
+        waiting.append(tat - b)
+        response.append(s - a if s != NO_VALUE else 0)
+        if c > makespan:
+            makespan = c
+        if b > 0:
+            ntat_values.append(tat / b)
+    avg_ntat = sum(ntat_values) / len(ntat_values) if ntat_values else 0
+    stdev_ntat = 0
+    cv_ntat = 0
+    if len(ntat_values) > 1:
+        variance_ntat = sum((ntat - avg_ntat) ** 2 for ntat in ntat_values) / (len(ntat_values) - 1)
+        stdev_ntat = math.sqrt(variance_ntat)
+        if avg_ntat > 0:
+            cv_ntat = stdev_ntat / avg_ntat * 100
+    result = {
+        "avg_turnaround": sum(turnaround) / n,
+        "avg_waiting": sum(waiting) / n,
+        "avg_response": sum(response) / n,
+        "context_switches": context_switches,
+        "throughput": n / makespan if makespan > 0 else float('inf'),
+        "makespan": makespan,
+        "avg_ntat": avg_ntat,
+        "stdev_ntat": stdev_ntat,
+        "cv_ntat": cv_ntat
+    }
+    for name, values in (("turnaround", turnaround), ("waiting", waiting), ("response", response)):
+        values.sort()
+        for p in PERCENTILES:
+            result[f"p{p}_{name}"] = _percentile(values, p)
+    return result
+
+def overhead_metrics(useful: int, overhead: int) -> Dict[str, Any]:
+    """
+    Métricas de la sobrecarga de los cambios de contexto: tiempo total de sobrecarga
+    y eficiencia de la CPU (fracción del tiempo ocupado dedicada a trabajo útil).
+    """
+    busy = useful + overhead
+    return {
+        "overhead_time": overhead,
+        "cpu_efficiency": useful / busy if busy > 0 else 1.0,
+    }
+
+class MetricsAccumulator:
+    """
+    Acumula las métricas de los procesos a medida que terminan, en memoria constante.
+    Produce las mismas claves base que 'compute_metrics' (sin percentiles, que
+    requieren conservar todos los valores). La varianza del NTAT se calcula con
+    el algoritmo de Welford.
+    """
+    def __init__(self):
+        self.count = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self.total_response = 0
+        self.makespan = 0
+        self.ntat_count = 0
+        self.ntat_mean = 0.0
+        self.ntat_m2 = 0.0  # Suma de cuadrados de las desviaciones (Welford)
+
+    def add(self, arrival: int, burst: int, start: Optional[int], completion: int):
+        """Registra un proceso terminado."""
+        tat = completion - arrival
+        self.count += 1
+        self.total_turnaround += tat
+        self.total_waiting += tat - burst
+        if start is not None:
+            self.total_response += start - arrival
+        if completion > self.makespan:
+            self.makespan = completion
+        if burst > 0:
+            ntat = tat / burst
+            self.ntat_count += 1
+            delta = ntat - self.ntat_mean
+            self.ntat_mean += delta / self.ntat_count
+            self.ntat_m2 += delta * (ntat - self.ntat_mean)
+
+    def result(self, context_switches: int) -> Dict[str, Any]:
+        """Devuelve las métricas acumuladas (vacío si no ha terminado ningún proceso)."""
+        n = self.count
+        if n == 0:
+            return {}
+        avg_ntat = self.ntat_mean if self.ntat_count else 0
+        stdev_ntat = 0
+        cv_ntat = 0
+        if self.ntat_count > 1:
+            stdev_ntat = math.sqrt(self.ntat_m2 / (self.ntat_count - 1))
+            if avg_ntat > 0:
+                cv_ntat = stdev_ntat / avg_ntat * 100
+        return {
+            "avg_turnaround": self.total_turnaround / n,
+            "avg_waiting": self.total_waiting / n,
+            "avg_response": self.total_response / n,
+            "context_switches": context_switches,
+            "throughput": n / self.makespan if self.makespan > 0 else float('inf'),
+            "makespan": self.makespan,
+            "avg_ntat": avg_ntat,
+            "stdev_ntat": stdev_ntat,
+            "cv_ntat": cv_ntat
+        }
+
+def _percentile(sorted_values: List[int], p: float) -> float:
+    """Percentil con interpolación lineal (mismo criterio que numpy.percentile por defecto)."""
+    pos = (len(sorted_values) - 1) * p / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return float(sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo))
@@ -0,0 +1,93 @@
+# models/overhead.py
+"""
+Coste de los cambios de contexto en tiempo simulado.
+
+Por defecto los cambios de contexto solo se cuentan; con un 'ContextSwitchCost'
+cada despacho ocupa la CPU durante unas unidades antes de que el proceso avance:
+  - una latencia fija de despacho (guardar y cargar el contexto), y
+  - opcionalmente, una penalización por recargar la caché que crece con el tiempo
+    que el proceso lleva fuera de la CPU: nula si vuelve de inmediato y completa
+    tras 'cache_window' unidades (o en su primera ejecución, con la caché fría).
+Los planificadores registran ese tiempo como segmentos OVERHEAD_PID del historial
+y lo informan en 'metrics()' ('overhead_time' y 'cpu_efficiency').
+"""
+from typing import Optional
+
+class ContextSwitchCost:
+    """Modelo de coste de un despacho: latencia fija más recarga de caché."""
+    def __init__(self, latency: int = 0, cache_penalty: int = 0, cache_window: int = 1000):
+        """
+        Args:
+            latency (int): Unidades que cuesta cada despacho.
+            cache_penalty (int): Unidades adicionales con la caché completamente fría.
+            cache_window (int): Unidades fuera de la CPU tras las que la caché se
+                considera fría; la penalización crece linealmente hasta entonces.
+        Raises:
+            ValueError: Si algún parámetro es negativo o la ventana no es positiva.
+        """
+        if latency < 0 or cache_penalty < 0:
+            raise ValueError("Los costes de cambio de contexto no pueden ser negativos.")
+        if cache_window <= 0:
+            raise ValueError("La ventana de la caché debe ser positiva.")
+        self.latency = latency
+        self.cache_penalty = cache_penalty
+        self.cache_window = cache_window
+
+    @property
+    def tracks_cache(self) -> bool:
+        """True si el coste depende de cuándo se ejecutó el proceso por última vez."""
+        return self.cache_penalty > 0
+
+    def cost(self, away: Optional[int]) -> int:
+        """
+        Unidades de sobrecarga de un despacho.
+        Args:
+            away (int): Unidades desde que el proceso dejó la CPU (None si nunca se ha ejecutado).
+        """
+        if not self.cache_penalty:
+            return self.latency
+        if away is None or away >= self.cache_window:
+            return self.latency + self.cache_penalty
+        return self.latency + self.cache_penalty * away // self.cache_window
+
+    def spec(self) -> str:
+        """Especificación textual equivalente (ver 'make_switch_cost')."""
+        return f"latency={self.latency},cache={self.cache_penalty},window={self.cache_window}"
+
+    def __repr__(self) -> str:
+        return f"ContextSwitchCost({self.spec()})"
+
+# Nombres cortos aceptados en las especificaciones textuales
+_SPEC_KEYS = {"latency": "latency", "cache": "cache_penalty", "window": "cache_window"}
+
+def make_switch_cost(spec: Optional[str]) -> Optional[ContextSwitchCost]:
+    """
+    Crea un modelo de coste a partir de una especificación textual: un entero (solo
+    latencia, p. ej. '2') u opciones 'latency=2,cache=20,window=500'. Al ser texto,
+    se puede pasar a los procesos trabajadores de un barrido.
+    Returns:
+        ContextSwitchCost: El modelo, o None si la especificación está vacía o es '0'
+        (cambios de contexto gratuitos).
+    Raises:
+        ValueError: Si la especificación no es válida.
+    """
+    if spec is None or not spec.strip():
+        return None
+    kwargs = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        if not sep:
+            key, value = "latency", key
+        name = _SPEC_KEYS.get(key.strip().lower())
+        if name is None:
+            raise ValueError(f"Opción de coste desconocida: {key.strip()!r} (disponibles: {', '.join(_SPEC_KEYS)})")
+        try:
+            kwargs[name] = int(value)
+        except ValueError:
+            raise ValueError(f"Valor inválido para la opción {key.strip()!r}: {value!r}")
+    cost = ContextSwitchCost(**kwargs)
+    if not (cost.latency or cost.cache_penalty):
+        return None
+    return cost
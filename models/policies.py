@@ -0,0 +1,581 @@
+# models/policies.py
+"""
+Políticas de planificación intercambiables para 'RoundRobinScheduler'.
+
+Una política es la cola de procesos listos del planificador junto con las
+decisiones que dependen de ella: a quién se entrega la CPU, durante cuánto
+tiempo (rodaja) y si una llegada expulsa al proceso en ejecución. El reloj,
+las llegadas, el historial, las métricas, los observadores y las instantáneas
+son comunes a todas, y cada política funciona igual con el motor por ticks
+('step') y con el motor por eventos ('advance_to_next_event').
+"""
+import heapq
+import zlib
+from array import array
+from collections import OrderedDict
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from models.process_table import NO_VALUE
+
+if TYPE_CHECKING:
+    from models.scheduler import Process, RoundRobinScheduler
+
+class ReadyQueue:
+    """
+    Cola FIFO de procesos listos indexada por PID (OrderedDict).
+    Ofrece la misma interfaz que el 'deque' que sustituye (append, popleft,
+    iteración, len) y además pertenencia y eliminación por PID en O(1).
+    """
+    __slots__ = ("_procs",)
+
+    def __init__(self, procs: Iterable["Process"] = ()):
+        self._procs: "OrderedDict[int, Process]" = OrderedDict((p.pid, p) for p in procs)
+
+    def append(self, proc: "Process"):
+        """Añade un proceso al final de la cola."""
+        self._procs[proc.pid] = proc
+
+    def popleft(self) -> "Process":
+        """Extrae el primer proceso de la cola."""
+        return self._procs.popitem(last=False)[1]
+
+    def pop(self) -> "Process":
+        """Extrae el último proceso de la cola (el robo de trabajo toma de este extremo)."""
+        return self._procs.popitem()[1]
+
+    def remove(self, pid: int) -> bool:
+        """Elimina el proceso con el PID dado. Returns: True si estaba en la cola."""
+        return self._procs.pop(pid, None) is not None
+
+    def clear(self):
+        self._procs.clear()
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._procs
+
+    def __len__(self) -> int:
+        return len(self._procs)
+
+    def __bool__(self) -> bool:
+        return bool(self._procs)
+
+    def __iter__(self) -> Iterator["Process"]:
+        return iter(self._procs.values())
+
+class SchedulingPolicy:
+    """
+    Interfaz de una política de planificación.
+    La política hace de cola 'ready' del planificador: 'append' recibe las
+    llegadas, 'popleft' elige el siguiente proceso al despachar y la iteración
+    recorre los listos en el orden en que se mostrarían (y se guardan en las
+    instantáneas). El motor consulta además:
+      - 'time_slice' al despachar: unidades que puede ejecutar el proceso antes
+        de volver a la cola (None = sin límite).
+      - 'requeue' cuando el proceso deja la CPU sin terminar (rodaja agotada o expulsión).
+      - 'suspend' / 'resume' cuando el proceso se bloquea en una E/S y cuando vuelve
+        de ella (ver models/io_model.py).
+      - 'should_preempt' tras cada llegada, si la política es expulsiva.
+      - 'next_timer' / 'on_timer' para decisiones periódicas (p. ej. el impulso de MLFQ).
+    El estado propio de la política (niveles, déficits...), también el de los
+    procesos bloqueados, se guarda en las instantáneas mediante 'state' y se
+    recupera con 'load'; 'remove' olvida además el de un proceso bloqueado.
+    """
+    name = ""
+    preemptive = False  # True si una llegada puede expulsar al proceso en ejecución
+    pid_dependent = False  # True si las decisiones dependen de los PIDs (p. ej. pesos por PID)
+
+    def bind(self, scheduler: "RoundRobinScheduler"):
+        """Asocia la política al planificador (da acceso al quantum y al estado de la ejecución)."""
+        self.scheduler = scheduler
+
+    # --- Cola de listos ---
+    def append(self, proc: "Process"): raise NotImplementedError
+    def popleft(self) -> "Process": raise NotImplementedError
+    def remove(self, pid: int) -> bool: raise NotImplementedError
+    def clear(self): raise NotImplementedError
+    def __contains__(self, pid: int) -> bool: raise NotImplementedError
+    def __len__(self) -> int: raise NotImplementedError
+    def __iter__(self) -> Iterator["Process"]: raise NotImplementedError
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    # --- Decisiones ---
+    def time_slice(self, proc: "Process") -> Optional[int]:
+        """Rodaja del proceso recién despachado; por defecto, el quantum del planificador."""
+        return self.scheduler.quantum
+
+    def requeue(self, proc: "Process", consumed: int, expired: bool):
+        """
+        Devuelve a la cola un proceso que deja la CPU sin terminar.
+        Args:
+            consumed (int): Unidades ejecutadas desde que se despachó.
+            expired (bool): True si agotó su rodaja; False si fue expulsado.
+        """
+        self.append(proc)
+
+    def suspend(self, proc: "Process", consumed: int):
+        """
+        El proceso en ejecución se bloquea en una E/S antes de agotar su rodaja
+        (no está en la cola hasta 'resume').
+        Args:
+            consumed (int): Unidades ejecutadas desde que se despachó.
+        """
+
+    def resume(self, proc: "Process"):
+        """Un proceso vuelve de una E/S; por defecto, al final de la cola."""
+        self.append(proc)
+
+    def should_preempt(self, current: "Process") -> bool:
+        """Indica si, tras una llegada, el proceso en ejecución debe volver a la cola."""
+        return False
+
+    def next_timer(self, time: int) -> Optional[int]:
+        """Próximo instante posterior a 'time' en que la política necesita 'on_timer' (None = nunca)."""
+        return None
+
+    def on_timer(self, time: int):
+        """Decisión periódica de la política en el instante 'time'."""
+
+    # --- Instantáneas ---
+    def state(self) -> array:
+        """Estado propio de la política (además del orden de los listos) como enteros."""
+        return array("q")
+
+    def load(self, procs: List["Process"], state: Sequence[int]):
+        """Reconstruye la cola a partir de los listos (en orden de iteración) y de 'state'."""
+        self.clear()
+        for proc in procs:
+            self.append(proc)
+
+class RoundRobinPolicy(ReadyQueue, SchedulingPolicy):
+    """Round Robin clásico: cola FIFO, rodaja igual al quantum y sin expulsión por llegada."""
+    name = "rr"
+
+    def __init__(self):
+        ReadyQueue.__init__(self)
+
+class WeightedRoundRobinPolicy(RoundRobinPolicy):
+    """
+    Round Robin ponderado con déficit (DRR): cada proceso recibe una rodaja de
+    'quantum * peso' y, si deja la CPU antes de agotarla (una E/S o una
+    expulsión), conserva lo que le faltaba (déficit) para su siguiente turno, de
+    modo que su parte de la CPU por vuelta es proporcional a su peso aunque sus
+    ráfagas de CPU no encajen con la rodaja. El déficit se limita a una rodaja
+    completa para que un proceso que siempre se bloquea antes no lo acumule sin fin.
+    """
+    name = "wrr"
+
+    def __init__(self, weights: Optional[Dict[int, int]] = None, default_weight: int = 1):
+        """
+        Args:
+            weights (dict): Peso por PID (enteros positivos).
+            default_weight (int): Peso de los procesos que no aparecen en 'weights'.
+        """
+        super().__init__()
+        self.weights = dict(weights or {})
+        self.default_weight = default_weight
+        self.pid_dependent = bool(self.weights)
+        if default_weight <= 0 or any(w <= 0 for w in self.weights.values()):
+            raise ValueError("Los pesos deben ser enteros positivos.")
+        self._deficit: Dict[int, int] = {}  # pid -> rodaja pendiente de los procesos en cola o bloqueados
+        self._running_deficit = 0  # Déficit con el que se despachó el proceso en ejecución
+
+    def popleft(self) -> "Process":
+        proc = ReadyQueue.popleft(self)
+        self._running_deficit = self._deficit.pop(proc.pid, 0)
+        return proc
+
+    def remove(self, pid: int) -> bool:
+        self._deficit.pop(pid, None)
+        return ReadyQueue.remove(self, pid)
+
+    def clear(self):
+        ReadyQueue.clear(self)
+        self._deficit = {}
+        self._running_deficit = 0
+
+    def time_slice(self, proc: "Process") -> Optional[int]:
+        return self.scheduler.quantum * self.weights.get(proc.pid, self.default_weight) + self._running_deficit
+
+    def requeue(self, proc: "Process", consumed: int, expired: bool):
+        if not expired:
+            self.suspend(proc, consumed)
+        self.append(proc)
+
+    def suspend(self, proc: "Process", consumed: int):
+        leftover = self.time_slice(proc) - consumed
+        if leftover > 0:
+            base = self.scheduler.quantum * self.weights.get(proc.pid, self.default_weight)
+            self._deficit[proc.pid] = min(leftover, base)
+
+    def state(self) -> array:
+        values = array("q", [self._running_deficit])
+        for pid, deficit in self._deficit.items():
+            values.extend((pid, deficit))
+        return values
+
+    def load(self, procs: List["Process"], state: Sequence[int]):
+        super().load(procs, state)
+        if state:
+            self._running_deficit = state[0]
+            self._deficit = {state[i]: state[i + 1] for i in range(1, len(state), 2)}
+
+class MLFQPolicy(SchedulingPolicy):
+    """
+    Cola multinivel con realimentación (MLFQ). Las llegadas entran en el nivel 0
+    (máxima prioridad); siempre se ejecuta el primer proceso del nivel más alto
+    no vacío y una llegada a un nivel superior expulsa al proceso en ejecución.
+    Cada nivel tiene una asignación de CPU: el proceso que la consume (en una o
+    varias rodajas) baja un nivel. Con 'boost_interval', todos los procesos
+    vuelven al nivel 0 periódicamente para evitar la inanición.
+    """
+    name = "mlfq"
+    preemptive = True
+
+    def __init__(self, levels: int = 3, quanta: Optional[Sequence[int]] = None, boost_interval: Optional[int] = None):
+        """
+        Args:
+            levels (int): Número de niveles.
+            quanta: Asignación por nivel; por defecto 'quantum * 2**nivel' con el quantum del planificador.
+            boost_interval (int): Periodo del impulso al nivel 0 (None = sin impulso).
+        """
+        if quanta is not None:
+            levels = len(quanta)
+            if any(q <= 0 for q in quanta):
+                raise ValueError("Las asignaciones de MLFQ deben ser positivas.")
+        if levels <= 0:
+            raise ValueError("MLFQ necesita al menos un nivel.")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("El periodo de impulso debe ser positivo.")
+        self.levels = levels
+        self.quanta = list(quanta) if quanta is not None else None
+        self.boost_interval = boost_interval
+        self.clear()
+
+    def _allotment(self, level: int) -> int:
+        """Asignación de CPU del nivel."""
+        if self.quanta is not None:
+            return self.quanta[level]
+        return self.scheduler.quantum << level
+
+    def _push(self, proc: "Process", level: int, used: int):
+        self._queues[level][proc.pid] = proc
+        self._level[proc.pid] = level
+        if used:
+            self._used[proc.pid] = used
+
+    def append(self, proc: "Process"):
+        """Una llegada entra en el nivel de máxima prioridad."""
+        self._push(proc, 0, 0)
+
+    def popleft(self) -> "Process":
+        for level, queue in enumerate(self._queues):
+            if queue:
+                proc = queue.popitem(last=False)[1]
+                del self._level[proc.pid]
+                self._running = (level, self._used.pop(proc.pid, 0))
+                return proc
+        raise IndexError("popleft de una cola vacía")
+
+    def remove(self, pid: int) -> bool:
+        self._suspended.pop(pid, None) # También el nivel de un proceso bloqueado
+        level = self._level.pop(pid, None)
+        if level is None:
+            return False
+        del self._queues[level][pid]
+        self._used.pop(pid, None)
+        return True
+
+    def clear(self):
+        self._queues: List["OrderedDict[int, Process]"] = [OrderedDict() for _ in range(self.levels)]
+        self._level: Dict[int, int] = {}  # pid -> nivel de los procesos en cola
+        self._used: Dict[int, int] = {}  # pid -> asignación ya consumida en su nivel (si no es 0)
+        self._suspended: Dict[int, Tuple[int, int]] = {}  # pid -> (nivel, consumido) de los procesos bloqueados
+        self._running: Tuple[int, int] = (0, 0)  # (nivel, consumido) del proceso despachado
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._level
+
+    def __len__(self) -> int:
+        return len(self._level)
+
+    def __iter__(self) -> Iterator["Process"]:
+        return chain.from_iterable(queue.values() for queue in self._queues)
+
+    def time_slice(self, proc: "Process") -> Optional[int]:
+        level, used = self._running
+        return self._allotment(level) - used
+
+    def _charge(self, consumed: int) -> Tuple[int, int]:
+        """(nivel, consumido) del proceso despachado tras ejecutar 'consumed' unidades."""
+        level, used = self._running
+        used += consumed
+        if used >= self._allotment(level):
+            return min(level + 1, self.levels - 1), 0
+        return level, used
+
+    def requeue(self, proc: "Process", consumed: int, expired: bool):
+        self._push(proc, *self._charge(consumed))
+
+    def suspend(self, proc: "Process", consumed: int):
+        self._suspended[proc.pid] = self._charge(consumed)
+
+    def resume(self, proc: "Process"):
+        """Al volver de la E/S recupera su nivel y lo consumido en él."""
+        self._push(proc, *self._suspended.pop(proc.pid, (0, 0)))
+
+    def should_preempt(self, current: "Process") -> bool:
+        queues = self._queues
+        for level in range(self._running[0]):
+            if queues[level]:
+                return True
+        return False
+
+    def next_timer(self, time: int) -> Optional[int]:
+        if self.boost_interval is None:
+            return None
+        return (time // self.boost_interval + 1) * self.boost_interval
+
+    def on_timer(self, time: int):
+        """Impulso: todos los procesos vuelven al nivel 0 (en orden de prioridad) con la asignación completa."""
+        boosted = list(self)
+        self._queues = [OrderedDict((p.pid, p) for p in boosted)] + [OrderedDict() for _ in range(self.levels - 1)]
+        self._level = dict.fromkeys(self._level, 0)
+        self._used = {}
+        self._suspended = dict.fromkeys(self._suspended, (0, 0))
+        if self.scheduler.current is not None:
+            # La rodaja en curso no cambia; lo consumido desde el impulso cuenta en el nivel 0
+            self._running = (0, -self.scheduler.current_consumed)
+
+    def state(self) -> array:
+        values = array("q", self._running)
+        for pid, level in self._level.items():
+            values.extend((pid, level, self._used.get(pid, 0)))
+        for pid, (level, used) in self._suspended.items():
+            values.extend((pid, level, used))
+        return values
+
+    def load(self, procs: List["Process"], state: Sequence[int]):
+        self.clear()
+        if not state:
+            for proc in procs:
+                self.append(proc)
+            return
+        self._running = (state[0], state[1])
+        placement = {state[i]: (state[i + 1], state[i + 2]) for i in range(2, len(state), 3)}
+        for proc in procs:
+            level, used = placement.pop(proc.pid, (0, 0))
+            self._push(proc, level, used)
+        # Los PIDs restantes son procesos bloqueados en una E/S
+        self._suspended = placement
+
+class SRTFPolicy(SchedulingPolicy):
+    """
+    Shortest Remaining Time First: se ejecuta el proceso con menos tiempo
+    restante (min-heap por (restante, orden de llegada a la cola)) y una llegada
+    con menos restante que el proceso en ejecución lo expulsa. No usa quantum.
+    La eliminación por PID es perezosa, como en la cola de llegadas.
+    """
+    name = "srtf"
+    preemptive = True
+
+    def __init__(self):
+        self.clear()
+
+    def append(self, proc: "Process"):
+        entry = (proc.remaining, self._seq, proc)
+        self._seq += 1
+        heapq.heappush(self._heap, entry)
+        self._live[proc.pid] = entry
+
+    def _purge_top(self):
+        heap = self._heap
+        live = self._live
+        while heap and live.get(heap[0][2].pid) is not heap[0]:
+            heapq.heappop(heap)
+
+    def popleft(self) -> "Process":
+        self._purge_top()
+        proc = heapq.heappop(self._heap)[2]
+        del self._live[proc.pid]
+        return proc
+
+    def remove(self, pid: int) -> bool:
+        if self._live.pop(pid, None) is None:
+            return False
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._heap = [entry for entry in self._heap if self._live.get(entry[2].pid) is entry]
+            heapq.heapify(self._heap)
+        return True
+
+    def clear(self):
+        self._heap: List[Tuple[int, int, "Process"]] = []
+        self._live: Dict[int, Tuple[int, int, "Process"]] = {}  # pid -> su entrada viva en el heap
+        self._seq = 0
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._live
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __iter__(self) -> Iterator["Process"]:
+        return (entry[2] for entry in sorted(self._live.values()))
+
+    def time_slice(self, proc: "Process") -> Optional[int]:
+        return None
+
+    def should_preempt(self, current: "Process") -> bool:
+        self._purge_top()
+        return bool(self._heap) and self._heap[0][0] < current.remaining
+
+class VirtualRoundRobinPolicy(RoundRobinPolicy):
+    """
+    Virtual Round Robin: un proceso que se bloquea en una E/S antes de agotar su
+    quantum pasa, al volver, a una cola auxiliar que tiene prioridad sobre la
+    principal, y solo recibe lo que le faltaba de ese quantum. Favorece a los
+    procesos limitados por E/S sin perjudicar a los limitados por CPU.
+    Sin modelo de E/S (ver models/io_model.py) ningún proceso cede la CPU antes
+    de tiempo y la política se comporta como Round Robin.
+    """
+    name = "vrr"
+
+    def __init__(self):
+        super().__init__()
+        self._aux = ReadyQueue()
+        self._grant: Dict[int, int] = {}  # pid -> quantum pendiente (cola auxiliar o bloqueados)
+        self._running_grant: Optional[int] = None  # Rodaja del proceso despachado desde la cola auxiliar
+
+    def popleft(self) -> "Process":
+        if self._aux:
+            proc = self._aux.popleft()
+            self._running_grant = self._grant.pop(proc.pid)
+            return proc
+        self._running_grant = None
+        return ReadyQueue.popleft(self)
+
+    def remove(self, pid: int) -> bool:
+        self._grant.pop(pid, None) # También el de un proceso bloqueado
+        if self._aux.remove(pid):
+            return True
+        return ReadyQueue.remove(self, pid)
+
+    def clear(self):
+        ReadyQueue.clear(self)
+        self._aux.clear()
+        self._grant = {}
+        self._running_grant = None
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._aux or ReadyQueue.__contains__(self, pid)
+
+    def __len__(self) -> int:
+        return len(self._aux) + ReadyQueue.__len__(self)
+
+    def __bool__(self) -> bool:
+        return bool(self._aux) or ReadyQueue.__bool__(self)
+
+    def __iter__(self) -> Iterator["Process"]:
+        return chain(self._aux, ReadyQueue.__iter__(self))
+
+    def time_slice(self, proc: "Process") -> Optional[int]:
+        return self.scheduler.quantum if self._running_grant is None else self._running_grant
+
+    def requeue(self, proc: "Process", consumed: int, expired: bool):
+        if not expired:
+            self.suspend(proc, consumed)
+            self.resume(proc)
+        else:
+            self.append(proc)
+
+    def suspend(self, proc: "Process", consumed: int):
+        leftover = self.time_slice(proc) - consumed
+        if leftover > 0:
+            self._grant[proc.pid] = leftover
+
+    def resume(self, proc: "Process"):
+        if proc.pid in self._grant:
+            self._aux.append(proc)
+        else:
+            self.append(proc)
+
+    def state(self) -> array:
+        values = array("q", [NO_VALUE if self._running_grant is None else self._running_grant])
+        for pid, grant in self._grant.items():
+            values.extend((pid, grant))
+        return values
+
+    def load(self, procs: List["Process"], state: Sequence[int]):
+        self.clear()
+        # Los PIDs con rodaja pendiente que no están en la cola son procesos bloqueados
+        self._grant = {state[i]: state[i + 1] for i in range(1, len(state), 2)} if state else {}
+        for proc in procs:
+            if proc.pid in self._grant:
+                self._aux.append(proc)
+            else:
+                self.append(proc)
+        if state and state[0] != NO_VALUE:
+            self._running_grant = state[0]
+
+# Políticas disponibles por nombre (CLI, barridos y bancos de pruebas)
+POLICIES = {
+    RoundRobinPolicy.name: RoundRobinPolicy,
+    WeightedRoundRobinPolicy.name: WeightedRoundRobinPolicy,
+    MLFQPolicy.name: MLFQPolicy,
+    SRTFPolicy.name: SRTFPolicy,
+    VirtualRoundRobinPolicy.name: VirtualRoundRobinPolicy,
+}
+
+def policy_id(policy: SchedulingPolicy) -> int:
+    """Identificador numérico de la política (se guarda en las instantáneas para detectar mezclas)."""
+    return zlib.crc32(policy.name.encode("utf-8"))
+
+def policy_from_id(identifier: int) -> SchedulingPolicy:
+    """
+    Crea, con sus opciones por defecto, la política cuyo 'policy_id' es 'identifier'.
+    Raises:
+        ValueError: Si ninguna política tiene ese identificador.
+    """
+    for cls in POLICIES.values():
+        if policy_id(cls) == identifier:
+            return cls()
+    raise ValueError(f"Política de planificación desconocida en la instantánea (id {identifier}).")
+
+def _parse_option(value: str):
+    """Convierte el valor de una opción: entero, lista 'a/b/c' o diccionario 'pid:peso/pid:peso'."""
+    if ":" in value:
+        return {int(k): int(v) for k, v in (item.split(":", 1) for item in value.split("/") if item)}
+    if "/" in value:
+        return [int(v) for v in value.split("/") if v]
+    return int(value)
+
+def make_policy(spec: str = "rr") -> SchedulingPolicy:
+    """
+    Crea una política a partir de una especificación textual 'nombre[:opción=valor,...]',
+    p. ej. 'mlfq:levels=4,boost_interval=5000', 'mlfq:quanta=50/100/400' o
+    'wrr:weights=1:3/2:2,default_weight=1'. Al ser texto, se puede pasar a los
+    procesos trabajadores de un barrido.
+    Raises:
+        ValueError: Si la política o sus opciones no son válidas.
+    """
+    name, _, options = spec.partition(":")
+    cls = POLICIES.get(name.strip().lower())
+    if cls is None:
+        raise ValueError(f"Política desconocida: {name!r} (disponibles: {', '.join(POLICIES)})")
+    kwargs = {}
+    for item in options.split(","):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Opción de política inválida: {item!r} (se esperaba clave=valor)")
+        try:
+            kwargs[key.strip()] = _parse_option(value.strip())
+        except ValueError:
+            raise ValueError(f"Valor inválido para la opción {key.strip()!r}: {value!r}")
+    try:
+        return cls(**kwargs)
+    except TypeError as e:
+        raise ValueError(f"Opciones inválidas para la política {name!r}: {e}")
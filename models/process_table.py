@@ -0,0 +1,147 @@
+# models/process_table.py
+from array import array
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Valor almacenado en las columnas para representar "sin valor" (None)
+NO_VALUE = -1
+
+class ProcessTable:
+    """
+    Almacén columnar de procesos (struct-of-arrays).
+    Cada atributo del proceso se guarda en un 'array' tipado de enteros de 64 bits,
+    de modo que un millón de procesos ocupa unos pocos MB en lugar de cientos.
+    Las filas se identifican por su índice entero; 'row(i)' devuelve una vista
+    ligera con la misma interfaz que 'Process' para que el planificador, las
+    métricas y el presentador puedan trabajar con cualquiera de las dos formas.
+    """
+    COLUMNS = ("pid", "arrival", "burst", "remaining", "start_time", "completion_time")
+
+    def __init__(self):
+        """Inicializa una tabla vacía."""
+        self.pid = array("q")
+        self.arrival = array("q")
+        self.burst = array("q")
+        self.remaining = array("q")
+        self.start_time = array("q")  # NO_VALUE si aún no ha comenzado
+        self.completion_time = array("q")  # NO_VALUE si aún no ha terminado
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[int, int]], first_pid: int = 1) -> "ProcessTable":
+        """
+        Construye una tabla a partir de pares (arrival, burst).
+        Args:
+            pairs: Iterable de pares (arrival, burst).
+            first_pid (int): PID asignado a la primera fila; los siguientes son consecutivos.
+        """
+        table = cls()
+        pid = first_pid
+        for arrival, burst in pairs:
+            table.append(pid, arrival, burst)
+            pid += 1
+        return table
+
+    @classmethod
+    def from_columns(cls, arrival: array, burst: array, first_pid: int = 1,
+                     pid: Optional[array] = None) -> "ProcessTable":
+        """
+        Construye una tabla a partir de columnas 'array' de enteros de 64 bits
+        (p. ej. las de 'models.workload'), sin crear un objeto por proceso.
+        Las columnas se copian; los PIDs son 'pid' o, si se omite, consecutivos
+        desde 'first_pid'.
+        """
+        n = len(arrival)
+        if len(burst) != n or (pid is not None and len(pid) != n):
+            raise ValueError("Las columnas deben tener la misma longitud.")
+        table = cls()
+        table.pid = array("q", pid if pid is not None else range(first_pid, first_pid + n))
+        table.arrival = array("q", arrival)
+        table.burst = array("q", burst)
+        table.reset()
+        return table
+
+    @classmethod
+    def from_processes(cls, processes: Iterable) -> "ProcessTable":
+        """Construye una tabla copiando el estado de objetos con la interfaz de 'Process'."""
+        table = cls()
+        for p in processes:
+            row = table.append(p.pid, p.arrival, p.burst)
+            table.remaining[row] = p.remaining
+            table.start_time[row] = NO_VALUE if p.start_time is None else p.start_time
+            table.completion_time[row] = NO_VALUE if p.completion_time is None else p.completion_time
+        return table
+
+    def append(self, pid: int, arrival: int, burst: int) -> int:
+        """
+        Añade un proceso nuevo (sin iniciar) a la tabla.
+        Returns:
+            int: Índice de la fila creada.
+        """
+        self.pid.append(pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.remaining.append(burst)
+        self.start_time.append(NO_VALUE)
+        self.completion_time.append(NO_VALUE)
+        return len(self.pid) - 1
+
+    def reset(self):
+        """Devuelve todas las filas a su estado inicial (sin iniciar)."""
+        n = len(self.pid)
+        self.remaining = array("q", self.burst)
+        self.start_time = array("q", [NO_VALUE]) * n
+        self.completion_time = array("q", [NO_VALUE]) * n
+
+    def row(self, index: int) -> "ProcessRow":
+        """Devuelve una vista tipo 'Process' sobre la fila 'index'."""
+        return ProcessRow(self, index)
+
+    def rows(self) -> Iterator["ProcessRow"]:
+        """Recorre todas las filas como vistas tipo 'Process'."""
+        for i in range(len(self.pid)):
+            yield ProcessRow(self, i)
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def nbytes(self) -> int:
+        """Memoria ocupada por los datos de las columnas (en bytes)."""
+        return sum(getattr(self, c).buffer_info()[1] * getattr(self, c).itemsize for c in self.COLUMNS)
+
+def _column(name: str, nullable: bool = False) -> property:
+    """Crea una propiedad de 'ProcessRow' que lee y escribe la columna 'name'."""
+    if nullable:
+        def getter(self) -> Optional[int]:
+            value = getattr(self.table, name)[self.index]
+            return None if value == NO_VALUE else value
+
+        def setter(self, value: Optional[int]):
+            getattr(self.table, name)[self.index] = NO_VALUE if value is None else value
+    else:
+        def getter(self) -> int:
+            return getattr(self.table, name)[self.index]
+
+        def setter(self, value: int):
+            getattr(self.table, name)[self.index] = value
+    return property(getter, setter)
+
+class ProcessRow:
+    """
+    Vista ligera sobre una fila de 'ProcessTable'.
+    Expone los mismos atributos que 'Process' (pid, arrival, burst, remaining,
+    start_time, completion_time) leyendo y escribiendo directamente en las columnas.
+    """
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: ProcessTable, index: int):
+        self.table = table
+        self.index = index
+
+    pid = _column("pid")
+    arrival = _column("arrival")
+    burst = _column("burst")
+    remaining = _column("remaining")
+    start_time = _column("start_time", nullable=True)
+    completion_time = _column("completion_time", nullable=True)
+
+    def __repr__(self) -> str:
+        return f"ProcessRow(pid={self.pid}, arrival={self.arrival}, burst={self.burst})"
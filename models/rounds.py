@@ -0,0 +1,168 @@
+# models/rounds.py
+"""
+Forma cerrada de Round Robin para lotes en los que no llega nadie.
+
+Si todos los procesos de la cola ya han llegado y no hay llegadas pendientes
+antes de un instante límite, cada vuelta de la cola ejecuta min(restante,
+quantum) de cada proceso vivo, en el mismo orden. Con k_i = ceil(r_i / Q)
+vueltas para terminar el proceso i, el trabajo de las K primeras vueltas es
+    S(K) = suma de min(r_i, K * Q),
+así que se pueden saltar muchas vueltas a la vez ordenando los restantes
+(O(n log n)) en lugar de simular cada rodaja:
+  - el proceso i termina en la vuelta k_i, en el instante
+      inicio + S(k_i - 1) + Q * (vivos con k_j > k_i antes que él en la cola)
+             + (lo que ejecutan en su última vuelta los que terminan con él y van antes)
+             + (r_i - (k_i - 1) * Q);
+  - los supervivientes conservan su orden relativo.
+Tras las vueltas completas se ejecuta además el prefijo de la siguiente vuelta
+que cabe antes del límite. Las rodajas individuales (para el historial) se
+generan solo cuando se piden ('RoundBatch.segments').
+"""
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterator, List, Optional, Tuple
+
+class RoundBatch:
+    """Resultado de saltar vueltas completas de Round Robin (ver 'plan_rounds')."""
+    __slots__ = ("start", "quantum", "remaining", "rounds", "prefix", "end", "slices",
+                 "first_run", "finished", "order", "left")
+
+    def __init__(self, start: int, quantum: int, remaining: List[int], rounds: int):
+        self.start = start  # Instante inicial del lote
+        self.quantum = quantum
+        self.remaining = remaining  # Restante de cada proceso al empezar (en orden de cola)
+        self.rounds = rounds  # Vueltas completas saltadas
+        self.prefix = 0  # Rodajas ejecutadas de la vuelta siguiente
+        self.end = start  # Instante final del lote (fin de una rodaja)
+        self.slices = 0  # Rodajas ejecutadas (un despacho cada una)
+        self.first_run: List[int] = []  # Inicio de la primera rodaja de cada proceso
+        self.finished: List[Tuple[int, int]] = []  # (instante de fin, índice) en orden de finalización
+        self.order: List[int] = []  # Índices de los supervivientes en el nuevo orden de la cola
+        self.left: List[int] = []  # Restante de cada proceso al terminar el lote
+
+    def segments(self, pids: List[int], merge: bool = True) -> Iterator[Tuple[int, int, int]]:
+        """
+        Genera las rodajas del lote como (pid, inicio, duración), en orden.
+        Con 'merge', las rodajas consecutivas de un único proceso vivo se entregan
+        como una sola (el historial las fusionaría de todos modos).
+        """
+        quantum = self.quantum
+        remaining = list(self.remaining)
+        alive = list(range(len(remaining)))
+        t = self.start
+        for _ in range(self.rounds):
+            if merge and len(alive) == 1:
+                i = alive[0]
+                run = min(remaining[i], quantum * (self.rounds - _))
+                yield pids[i], t, run
+                t += run
+                remaining[i] -= run
+                alive = [i] if remaining[i] else []
+                break
+            survivors = []
+            for i in alive:
+                run = min(remaining[i], quantum)
+                yield pids[i], t, run
+                t += run
+                remaining[i] -= run
+                if remaining[i]:
+                    survivors.append(i)
+            alive = survivors
+        for i in alive[:self.prefix]:
+            run = min(remaining[i], quantum)
+            yield pids[i], t, run
+            t += run
+
+def plan_rounds(start: int, quantum: int, remaining: List[int], limit: Optional[int]) -> Optional[RoundBatch]:
+    """
+    Calcula cuántas vueltas completas caben antes de 'limit' y su resultado.
+    Args:
+        start (int): Instante actual; la primera rodaja es la del proceso en cabeza.
+        quantum (int): Rodaja de todos los procesos.
+        remaining (list): Trabajo restante de cada proceso, en orden de cola (cabeza primero).
+        limit (int): Instante que el lote no puede superar (None = sin límite).
+    Returns:
+        RoundBatch: El lote, o None si no cabe ni una vuelta completa.
+    """
+    n = len(remaining)
+    rounds_needed = [(r + quantum - 1) // quantum for r in remaining]
+    by_size = sorted(remaining)
+    sums = [0, *accumulate(by_size)]
+
+    def work(k: int) -> int:
+        """Unidades ejecutadas en las k primeras vueltas: suma de min(r_i, k * Q)."""
+        cap = k * quantum
+        below = bisect_right(by_size, cap)
+        return sums[below] + cap * (n - below)
+
+    last = max(rounds_needed)
+    if limit is None:
+        rounds = last
+    else:
+        budget = limit - start
+        if work(1) > budget:
+            return None
+        lo, hi = 1, last # Mayor número de vueltas cuyo trabajo cabe en el presupuesto
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if work(mid) <= budget:
+                lo = mid
+            else:
+                hi = mid - 1
+        rounds = lo
+    batch = RoundBatch(start, quantum, remaining, rounds)
+    batch.first_run = [start + offset for offset in accumulate((min(r, quantum) for r in remaining[:-1]), initial=0)]
+    left = [max(r - rounds * quantum, 0) for r in remaining]
+    batch.slices = sum(min(k, rounds) for k in rounds_needed)
+
+    # Finalizaciones de las vueltas completas, agrupadas por vuelta. Un árbol de Fenwick
+    # cuenta los procesos vivos (aún en cola en esa vuelta) que van delante de cada uno.
+    tree = [0] * (n + 1)
+    for i in range(1, n + 1):
+        tree[i] += 1
+        parent = i + (i & -i)
+        if parent <= n:
+            tree[parent] += tree[i]
+    groups = {}
+    for i, k in enumerate(rounds_needed):
+        if k <= rounds:
+            groups.setdefault(k, []).append(i)
+    finished = batch.finished
+    for k in sorted(groups):
+        base = start + work(k - 1)
+        done = (k - 1) * quantum
+        last_pieces = 0 # Última rodaja de los que terminan en esta vuelta y van delante
+        for rank, i in enumerate(groups[k]):
+            ahead, j = 0, i # Vivos por delante en la cola (prefijo del árbol)
+            while j > 0:
+                ahead += tree[j]
+                j -= j & -j
+            piece = remaining[i] - done
+            last_pieces += piece
+            finished.append((base + quantum * (ahead - rank) + last_pieces, i))
+        for i in groups[k]:
+            j = i + 1
+            while j <= n:
+                tree[j] -= 1
+                j += j & -j
+
+    # Prefijo de la vuelta siguiente que cabe antes del límite
+    alive = [i for i in range(n) if left[i]]
+    t = start + work(rounds)
+    prefix = 0
+    for i in alive:
+        run = min(left[i], quantum)
+        if limit is not None and t + run > limit:
+            break
+        t += run
+        left[i] -= run
+        prefix += 1
+        if not left[i]:
+            finished.append((t, i))
+    finished.sort()
+    batch.prefix = prefix
+    batch.slices += prefix
+    batch.end = t
+    batch.order = [i for i in alive[prefix:] + alive[:prefix] if left[i]]
+    batch.left = left
+    return batch
@@ -0,0 +1,241 @@
+# models/run_cache.py
+"""
+Caché de ejecuciones completas, direccionada por contenido.
+
+La clave es un hash de la carga de trabajo (columnas arrival y burst en orden de
+admisión: por llegada y, a igualdad de llegada, en el orden en que se añadieron,
+que es el que decide el desempate), el quantum, la política, el coste de los
+cambios de contexto y el modelo de E/S. El motor no forma parte de la clave: todos producen el
+mismo resultado.
+
+Cada entrada guarda las métricas y la instantánea final de la ejecución
+(comprimida con zlib; contiene el historial y el resultado de cada proceso). Los
+PIDs de la instantánea se guardan canónicos (1..n en orden de admisión), así que
+una misma carga con otros PIDs también acierta, salvo si la política decide según
+los PIDs (p. ej. 'wrr:weights=1:3') o la E/S se limita a algunos PIDs: entonces
+los PIDs forman parte de la clave.
+Las entradas se conservan en
+memoria con expulsión LRU y, opcionalmente, en un directorio local.
+"""
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from models.io_model import make_io_model
+from models.policies import make_policy
+from models.snapshot import decode_snapshot, encode_snapshot, read_checkpoint, write_checkpoint
+
+if TYPE_CHECKING:
+    from models.scheduler import Process, RoundRobinScheduler
+
+RUN_MAGIC = b"RRRUN001"
+RUN_SUFFIX = ".rrrun"
+_METRICS_LENGTH = struct.Struct("<I")
+
+def admission_order(arrival: Sequence[int]) -> List[int]:
+    """Índices de las filas en orden de admisión (por llegada, estable)."""
+    n = len(arrival)
+    if all(arrival[i] <= arrival[i + 1] for i in range(n - 1)):
+        return list(range(n)) # Caso habitual: la carga ya está ordenada
+    return sorted(range(n), key=arrival.__getitem__)
+
+def workload_key(arrival: Sequence[int], burst: Sequence[int], quantum: int,
+                 policy: str = "rr", switch_cost: Optional[str] = None,
+                 pids: Optional[Sequence[int]] = None, io: Optional[str] = None) -> str:
+    """
+    Clave de una ejecución.
+    Args:
+        arrival, burst: Columnas de la carga en orden de admisión (ver 'admission_order').
+        quantum (int): Quantum de la ejecución.
+        policy (str): Especificación de la política (ver 'models.policies.make_policy').
+        switch_cost (str): Especificación del coste de los cambios de contexto (None = gratuitos).
+        pids: PIDs de la carga en orden de admisión. Solo forman parte de la clave si la
+            política o la E/S dependen de ellos; en ese caso son obligatorios.
+        io (str): Especificación del modelo de E/S (None = sin E/S).
+    Returns:
+        str: Hash hexadecimal.
+    Raises:
+        ValueError: Si la política o la E/S dependen de los PIDs y no se indican.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    columns = [arrival, burst]
+    io_model = make_io_model(io)
+    if make_policy(policy).pid_dependent or (io_model is not None and io_model.pids is not None):
+        if pids is None:
+            raise ValueError(f"La política {policy!r} o la E/S {io!r} dependen de los PIDs: "
+                             "la clave necesita los PIDs de la carga.")
+        columns.append(pids)
+    io_spec = io_model.spec() if io_model is not None else ""
+    options = f"{len(arrival)}|{quantum}|{policy.strip().lower()}|{switch_cost or ''}|{io_spec}|{len(columns)}"
+    digest.update(options.encode("utf-8"))
+    for column in columns:
+        values = array("q", column)
+        if sys.byteorder != "little":
+            values.byteswap()
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+def pending_workload(scheduler: "RoundRobinScheduler") -> Optional[List["Process"]]:
+    """
+    Procesos de un planificador que aún no ha empezado a simular, en orden de admisión.
+    Returns:
+        list: Los procesos, o None si la simulación ya avanzó (o lee una traza en streaming).
+    """
+    if (scheduler.time or scheduler.current is not None or scheduler.finished
+            or scheduler.finished_stats is not None or len(scheduler.history)):
+        return None
+    procs = list(scheduler.ready)
+    pending = sorted(scheduler.future.entries(), key=lambda entry: (entry[0].arrival, entry[1]))
+    procs.extend(proc for proc, _ in pending)
+    return procs
+
+def scheduler_key(procs: Sequence["Process"], quantum: int, policy: str = "rr",
+                  switch_cost: Optional[str] = None, io: Optional[str] = None) -> str:
+    """'workload_key' de unos procesos en orden de admisión (ver 'pending_workload')."""
+    return workload_key([p.arrival for p in procs], [p.burst for p in procs], quantum, policy, switch_cost,
+                        [p.pid for p in procs], io)
+
+def _remap_pids(snapshot: bytes, mapping: Dict[int, int]) -> bytes:
+    """Reescribe los PIDs de una instantánea (los códigos negativos, IDLE o sin valor, no cambian)."""
+    state = decode_snapshot(snapshot)
+    get = mapping.get
+    procs = state["procs"]
+    procs[0::6] = array("q", [get(pid, pid) for pid in procs[0::6]])
+    for name in ("finished", "ready", "history_pid", "io_pids"):
+        state[name] = array("q", [get(pid, pid) for pid in state[name]])
+    for name in ("future", "last_run"):
+        pairs = state[name]
+        pairs[0::2] = array("q", [get(pid, pid) for pid in pairs[0::2]])
+    blocked = state["blocked"]
+    blocked[0::3] = array("q", [get(pid, pid) for pid in blocked[0::3]])
+    for name in ("current_pid", "burst_pid"):
+        state[name] = get(state[name], state[name])
+    return encode_snapshot(state)
+
+def export_run(scheduler: "RoundRobinScheduler", pids: Sequence[int]) -> bytes:
+    """
+    Instantánea final de una ejecución terminada, con PIDs canónicos.
+    Args:
+        pids: PIDs de la carga en orden de admisión.
+    """
+    snapshot = scheduler.snapshot()
+    if any(pid != i for i, pid in enumerate(pids, 1)):
+        snapshot = _remap_pids(snapshot, {pid: i for i, pid in enumerate(pids, 1)})
+    return snapshot
+
+def import_run(scheduler: "RoundRobinScheduler", snapshot: bytes, pids: Sequence[int]):
+    """Lleva un planificador sin empezar al final de la ejecución guardada (ver 'restore_completed')."""
+    if any(pid != i for i, pid in enumerate(pids, 1)):
+        snapshot = _remap_pids(snapshot, dict(enumerate(pids, 1)))
+    scheduler.restore_completed(snapshot)
+
+class CachedRun:
+    """Entrada de la caché: métricas e instantánea final (PIDs canónicos)."""
+    __slots__ = ("metrics", "snapshot")
+
+    def __init__(self, metrics: Dict[str, Any], snapshot: bytes):
+        self.metrics = metrics
+        self.snapshot = snapshot
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.snapshot)
+
+    def to_bytes(self) -> bytes:
+        """Formato en disco: cabecera mágica, métricas en JSON (con su longitud) e instantánea."""
+        metrics = json.dumps(self.metrics).encode("utf-8")
+        return RUN_MAGIC + _METRICS_LENGTH.pack(len(metrics)) + metrics + self.snapshot
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "CachedRun":
+        """
+        Raises:
+            ValueError: Si el blob no es una entrada válida.
+        """
+        if blob[:len(RUN_MAGIC)] != RUN_MAGIC:
+            raise ValueError("El fichero no es una entrada de la caché de ejecuciones.")
+        offset = len(RUN_MAGIC)
+        (length,) = _METRICS_LENGTH.unpack_from(blob, offset)
+        offset += _METRICS_LENGTH.size
+        metrics = json.loads(blob[offset:offset + length].decode("utf-8"))
+        return cls(metrics, blob[offset + length:])
+
+class RunCache:
+    """Caché LRU de ejecuciones completas, en memoria y opcionalmente en disco."""
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024,
+                 directory: Optional[str] = None):
+        """
+        Args:
+            max_entries (int): Entradas retenidas en memoria.
+            max_bytes (int): Tamaño máximo de las instantáneas retenidas en memoria.
+            directory (str): Si se indica, las entradas también se escriben en este
+                directorio (un fichero por clave) y se leen de él en los fallos de memoria.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries: "OrderedDict[str, CachedRun]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (self.directory is not None and os.path.exists(self._path(key)))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + RUN_SUFFIX)
+
+    def get(self, key: str) -> Optional[CachedRun]:
+        """Devuelve la entrada de 'key' (y la marca como usada recientemente), o None."""
+        run = self._entries.get(key)
+        if run is not None:
+            self._entries.move_to_end(key)
+        elif self.directory is not None:
+            try:
+                run = CachedRun.from_bytes(read_checkpoint(self._path(key)))
+            except (OSError, ValueError): # Ausente o ilegible: se trata como un fallo
+                run = None
+            if run is not None:
+                self._retain(key, run)
+        if run is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return run
+
+    def put(self, key: str, metrics: Dict[str, Any], snapshot: bytes) -> CachedRun:
+        """Guarda una ejecución (ver 'export_run')."""
+        run = CachedRun(metrics, snapshot)
+        self._retain(key, run)
+        if self.directory is not None:
+            try:
+                write_checkpoint(self._path(key), run.to_bytes())
+            except OSError:
+                pass # La caché en disco es opcional: la entrada sigue en memoria
+        return run
+
+    def _retain(self, key: str, run: CachedRun):
+        """Añade la entrada en memoria y expulsa las menos usadas si se superan los límites."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.nbytes -= previous.nbytes
+        self._entries[key] = run
+        self.nbytes += run.nbytes
+        while self._entries and (len(self._entries) > self.max_entries or self.nbytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        """Vacía la caché en memoria (los ficheros del directorio se conservan)."""
+        self._entries.clear()
+        self.nbytes = 0
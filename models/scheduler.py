@@ -1,7 +1,20 @@
 # models/scheduler.py
+import gc
+import heapq
 import math
-from collections import deque
-from typing import Optional, List, Tuple, Deque
+import time
+from array import array
+from typing import Callable, Optional, List, Tuple, Dict, Iterator, Iterable
+from models.process_table import ProcessRow, ProcessTable, NO_VALUE
+from models.metrics import MetricsAccumulator, compute_metrics, finished_columns, overhead_metrics
+from models.history import ExecutionHistory, OVERHEAD_PID
+from models.snapshot import decode_snapshot, encode_snapshot, write_checkpoint
+from models.checkpoints import ArrivalIndex, CheckpointIndex
+from models.overhead import ContextSwitchCost
+from models.io_model import IOModel
+from models.policies import RoundRobinPolicy, SchedulingPolicy, policy_from_id, policy_id
+from models.rounds import RoundBatch, plan_rounds
+from models.instrumentation import Instrumentation
 
 # --- CLASES DEL MODELO ---
 class Process:
@@ -9,7 +22,10 @@ class Process:
     Representa un proceso individual en el sistema.
     Almacena sus atributos estáticos (PID, tiempo de llegada, ráfaga de CPU)
     y su estado dinámico durante la simulación.
+    Usa __slots__ para no reservar un __dict__ por instancia.
     """
+    __slots__ = ("pid", "arrival", "burst", "remaining", "start_time", "completion_time")
+
     def __init__(self, pid: int, arrival: int, burst: int):
         """
         Inicializa un nuevo proceso.
@@ -25,6 +41,247 @@ class Process:
         self.start_time: Optional[int] = None  # Tiempo en que comienza su primera ejecución
         self.completion_time: Optional[int] = None  # Tiempo en que termina completamente
 
+class ArrivalQueue:
+    """
+    Cola de procesos que aún no han llegado, implementada como un min-heap
+    indexado por (arrival, orden de inserción).
+    Los procesos con el mismo tiempo de llegada conservan el orden FIFO en que
+    se añadieron. La admisión solo extrae los procesos que ya deben llegar.
+    Opcionalmente puede leer de una fuente perezosa de pares (arrival, burst)
+    ordenada por llegada: solo se materializa el siguiente registro de la fuente.
+    La eliminación por PID es perezosa (O(1)): la entrada se marca como muerta y
+    se descarta cuando llega al tope del heap.
+    """
+    def __init__(self):
+        self._heap: List[Tuple[int, int, Process]] = []
+        self._live: Dict[int, Tuple[int, int, Process]] = {}  # pid -> su entrada viva en el heap
+        self._seq = 0  # Contador de inserción para desempatar de forma estable
+        self._source: Optional[Iterator[Tuple[int, int]]] = None  # Fuente perezosa (traza)
+        self._source_seq = 0  # Orden de inserción asignado a toda la fuente
+        self._head: Optional[Process] = None  # Próximo proceso de la fuente (ya leído)
+        self._next_pid = 1  # PID del próximo registro de la fuente
+        self.consumed = 0  # Registros leídos de la fuente
+
+    def push(self, proc: Process, seq: Optional[int] = None) -> int:
+        """
+        Inserta un proceso en O(log n).
+        Args:
+            seq (int): Orden de inserción a usar (p. ej. el que tenía un proceso editado,
+                para conservar sus desempates); por defecto, el siguiente.
+        Returns:
+            int: El orden de inserción asignado.
+        """
+        if seq is None:
+            seq = self.take_seq()
+        entry = (proc.arrival, seq, proc)
+        heapq.heappush(self._heap, entry)
+        self._live[proc.pid] = entry
+        return seq
+
+    def extend(self, entries: List[Tuple[int, int, Process]], pids: Iterable[int]):
+        """
+        Inserta muchos procesos a la vez: O(n) con 'heapify' en lugar de n inserciones.
+        Args:
+            entries: Entradas (arrival, orden de inserción, proceso); los órdenes se
+                reservan con 'take_seqs'.
+            pids: PID de cada entrada, en el mismo orden.
+        """
+        self._live.update(zip(pids, entries))
+        self._heap.extend(entries)
+        heapq.heapify(self._heap)
+
+    def take_seqs(self, count: int) -> int:
+        """Reserva 'count' órdenes de inserción consecutivos y devuelve el primero."""
+        seq = self._seq
+        self._seq += count
+        return seq
+
+    def take_seq(self) -> int:
+        """Reserva el siguiente orden de inserción."""
+        seq = self._seq
+        self._seq += 1
+        return seq
+
+    def _purge_top(self):
+        """Descarta del tope del heap las entradas eliminadas."""
+        heap = self._heap
+        live = self._live
+        while heap and live.get(heap[0][2].pid) is not heap[0]:
+            heapq.heappop(heap)
+
+    def attach_source(self, pairs: Iterable[Tuple[int, int]], first_pid: int = 1, source_seq: Optional[int] = None):
+        """
+        Conecta una fuente perezosa de pares (arrival, burst) ordenada por arrival.
+        Los registros se convierten en 'Process' (con PIDs consecutivos desde
+        'first_pid') solo cuando el reloj de la simulación los necesita.
+        Args:
+            source_seq (int): Orden de inserción de la fuente; solo se indica al
+                reconectarla tras restaurar una instantánea.
+        Raises:
+            ValueError: Si ya hay una fuente conectada.
+        """
+        if self._source is not None or self._head is not None:
+            raise ValueError("La cola de llegadas ya tiene una fuente conectada.")
+        self._source = iter(pairs)
+        if source_seq is None:
+            self._source_seq = self._seq
+            self._seq += 1
+        else:
+            self._source_seq = source_seq
+        self._next_pid = first_pid
+        self._advance_source()
+
+    def _advance_source(self):
+        """Lee el siguiente registro de la fuente y lo deja como cabeza."""
+        previous = self._head
+        try:
+            arrival, burst = next(self._source)
+        except StopIteration:
+            self._head = None
+            self._source = None
+            return
+        if previous is not None and arrival < previous.arrival:
+            raise ValueError(f"La traza debe estar ordenada por arrival (registro {self.consumed + 1}: {arrival} < {previous.arrival}).")
+        self._head = Process(self._next_pid, arrival, burst)
+        self._next_pid += 1
+        self.consumed += 1
+
+    def _head_first(self) -> bool:
+        """Indica si la cabeza de la fuente precede al tope del heap."""
+        head = self._head
+        if head is None:
+            return False
+        self._purge_top()
+        if not self._heap:
+            return True
+        top = self._heap[0]
+        return (head.arrival, self._source_seq) < (top[0], top[1])
+
+    def peek(self) -> Optional[Process]:
+        """Devuelve el próximo proceso en llegar sin extraerlo."""
+        if self._head_first():
+            return self._head
+        self._purge_top()
+        return self._heap[0][2] if self._heap else None
+
+    def pop_due(self, time: int) -> List[Process]:
+        """
+        Extrae, en orden de llegada, los procesos con arrival <= time.
+        Returns:
+            List[Process]: Procesos admitidos (vacía si no llega ninguno).
+        """
+        heap = self._heap
+        live = self._live
+        if self._head is None:
+            if not heap or heap[0][0] > time:
+                return []
+            due = []
+            while heap and heap[0][0] <= time:
+                entry = heapq.heappop(heap)
+                proc = entry[2]
+                if live.get(proc.pid) is entry:
+                    del live[proc.pid]
+                    due.append(proc)
+            return due
+        due = []
+        while True:
+            if self._head_first():
+                if self._head.arrival > time:
+                    break
+                due.append(self._head)
+                self._advance_source()
+            elif heap and heap[0][0] <= time:
+                proc = heapq.heappop(heap)[2]
+                del live[proc.pid] # '_head_first' ya descartó las entradas muertas del tope
+                due.append(proc)
+            else:
+                break
+        return due
+
+    def remove(self, pid: int) -> bool:
+        """
+        Elimina el proceso con el PID dado en O(1) amortizado.
+        Returns:
+            bool: True si el proceso estaba en la cola.
+        """
+        if self._live.pop(pid, None) is not None:
+            # Compactar si las entradas muertas superan a las vivas (acota la memoria)
+            if len(self._heap) > 2 * len(self._live) + 64:
+                self._heap = [entry for entry in self._heap if self._live.get(entry[2].pid) is entry]
+                heapq.heapify(self._heap)
+            return True
+        if self._head is not None and self._head.pid == pid:
+            self._advance_source()
+            return True
+        return False
+
+    def entries(self) -> List[Tuple[Process, int]]:
+        """
+        Procesos pendientes ya leídos con su orden de inserción, para las instantáneas.
+        La cabeza de la fuente se incluye con el orden de la fuente.
+        """
+        live = self._live
+        entries = [(entry[2], entry[1]) for entry in self._heap if live.get(entry[2].pid) is entry]
+        if self._head is not None:
+            entries.append((self._head, self._source_seq))
+        return entries
+
+    def restore(self, entries: Iterable[Tuple[Process, int]], seq: int, source_seq: int, next_pid: int, consumed: int):
+        """
+        Reconstruye la cola a partir de 'entries()' y de sus contadores. La cabeza
+        de la fuente vuelve al heap con el orden de la fuente, por lo que los
+        desempates son los mismos al reconectar la traza con 'attach_source'.
+        """
+        self.clear()
+        self._heap = [(proc.arrival, entry_seq, proc) for proc, entry_seq in entries]
+        heapq.heapify(self._heap)
+        self._live = {entry[2].pid: entry for entry in self._heap}
+        self._seq = seq
+        self._source_seq = source_seq
+        self._next_pid = next_pid
+        self.consumed = consumed
+
+    def __contains__(self, pid: int) -> bool:
+        """Indica en O(1) si el proceso con el PID dado está pendiente (ya leído)."""
+        return pid in self._live or (self._head is not None and self._head.pid == pid)
+
+    def clear(self):
+        """Vacía la cola y desconecta la fuente perezosa."""
+        self._heap = []
+        self._live = {}
+        self._seq = 0
+        self._source = None
+        self._head = None
+        self.consumed = 0
+
+    def __len__(self) -> int:
+        """Número de procesos pendientes ya leídos (no cuenta lo que falta por leer de la fuente)."""
+        return len(self._live) + (self._head is not None)
+
+    def __bool__(self) -> bool:
+        return bool(self._live) or self._head is not None
+
+    def __iter__(self) -> Iterator[Process]:
+        """Recorre los procesos ya leídos en orden de llegada (vista de solo lectura)."""
+        live = self._live
+        entries = [entry for entry in self._heap if live.get(entry[2].pid) is entry]
+        if self._head is not None:
+            entries.append((self._head.arrival, self._source_seq, self._head))
+        return (entry[2] for entry in sorted(entries))
+
+# Tipos de evento usados en los lotes de 'SchedulerObserver.on_events'.
+# Cada evento es una tupla cuyo primer elemento es el tipo:
+#   (EVENT_TICK, time)
+#   (EVENT_CONTEXT_SWITCH, pid, time)
+#   (EVENT_FINISHED, proc, time)
+#   (EVENT_BURST, pid, start_time, duration)
+# El planificador multinúcleo (models/smp.py) añade al final el índice del núcleo
+# en los cambios de contexto y en las ráfagas.
+EVENT_TICK = 0
+EVENT_CONTEXT_SWITCH = 1
+EVENT_FINISHED = 2
+EVENT_BURST = 3
+
 class SchedulerObserver:
     """
     Clase base abstracta para objetos que desean recibir notificaciones
@@ -36,74 +293,460 @@ class SchedulerObserver:
     def on_process_finished(self, proc: Process, time: int): pass
     def on_execution_burst(self, pid: Optional[int], start_time: int, duration: int): pass
 
-class RoundRobinScheduler:
+    def on_core_burst(self, core: int, pid: Optional[int], start_time: int, duration: int):
+        """Ráfaga en un núcleo concreto (planificador multinúcleo); por defecto se trata como 'on_execution_burst'."""
+        self.on_execution_burst(pid, start_time, duration)
+
+    def on_events(self, batch: List[tuple]):
+        """
+        Recibe un lote de eventos cuando el planificador agrupa las notificaciones.
+        La implementación por defecto es un adaptador de compatibilidad que
+        reenvía cada evento al método individual correspondiente.
+        """
+        for event in batch:
+            kind = event[0]
+            if kind == EVENT_TICK:
+                self.on_tick(event[1])
+            elif kind == EVENT_CONTEXT_SWITCH:
+                self.on_context_switch(event[1], event[2])
+            elif kind == EVENT_FINISHED:
+                self.on_process_finished(event[1], event[2])
+            elif len(event) > 4:
+                self.on_core_burst(event[4], event[1], event[2], event[3])
+            else:
+                self.on_execution_burst(event[1], event[2], event[3])
+
+# Estados de un proceso dentro del planificador (ver 'RoundRobinScheduler.state_of')
+STATE_FUTURE = "future"
+STATE_READY = "ready"
+STATE_RUNNING = "running"
+STATE_FINISHED = "finished"
+STATE_BLOCKED = "blocked"  # En una E/S (ver models/io_model.py)
+
+class EventSource:
+    """
+    Registro de observadores y agrupación de eventos, común a los planificadores
+    (de una CPU y multinúcleo, ver models/smp.py). También la instrumentación
+    opcional ('enable_instrumentation' / 'stats').
+    """
+    # Métodos medidos con la instrumentación activa: (método, fase, contador o None)
+    INSTRUMENTED_METHODS: Tuple[Tuple[str, str, Optional[str]], ...] = ()
+    # Métodos de los observadores medidos (fase 'observers')
+    OBSERVER_METHODS = ("on_tick", "on_context_switch", "on_process_finished",
+                        "on_execution_burst", "on_core_burst", "on_events")
+
+    def __init__(self):
+        self.observers = []  # Lista de observadores registrados
+        # Agrupación de eventos (desactivada por defecto: cada evento se notifica al instante)
+        self._event_buffer: Optional[List[tuple]] = None
+        self._batch_max_events: Optional[int] = None
+        self._batch_interval: Optional[float] = None
+        self._batch_last_flush = 0.0
+        self.instrumentation: Optional[Instrumentation] = None  # Temporizadores y contadores (desactivados)
+
+    def subscribe(self, obs: SchedulerObserver):
+        """Agrega un observador a la lista."""
+        self.observers.append(obs)
+        if self.instrumentation is not None:
+            self._instrument_observer(obs)
+
+    def enable_instrumentation(self, enabled: bool = True) -> Optional[Instrumentation]:
+        """
+        Activa (o desactiva) los temporizadores por fase y los contadores del camino
+        crítico: pasos del motor, llegadas admitidas, cambios de contexto y llamadas
+        a los observadores (ver models/instrumentation.py). Desactivada no tiene coste:
+        los métodos medidos se envuelven al activarla y se restauran al desactivarla.
+        Volver a activarla pone las medidas a cero.
+        Returns:
+            Instrumentation: La instrumentación activa, o None si se desactiva.
+        """
+        if self.instrumentation is not None:
+            self.instrumentation.uninstall()
+            self.instrumentation = None
+        if enabled:
+            instrumentation = Instrumentation()
+            for name, phase, counter in self.INSTRUMENTED_METHODS:
+                instrumentation.wrap(self, name, phase, counter)
+            instrumentation.wrap(self._future, "pop_due", counter="arrivals", amount=len)
+            instrumentation.track("context_switches", lambda: self.context_switches)
+            self.instrumentation = instrumentation
+            for obs in self.observers:
+                self._instrument_observer(obs)
+        return self.instrumentation
+
+    def _instrument_observer(self, obs: SchedulerObserver):
+        """Mide las llamadas a los métodos de un observador (fase 'observers')."""
+        for name in self.OBSERVER_METHODS:
+            if hasattr(obs, name):
+                self.instrumentation.wrap(obs, name, "observers", "observer_calls")
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Estadísticas de ejecución del planificador.
+        Returns:
+            dict: Reloj, cambios de contexto y, con la instrumentación activa, los
+            tiempos por fase y los contadores desde su activación ('Instrumentation.stats').
+        """
+        stats = {"instrumented": self.instrumentation is not None, "time": self.time,
+                 "context_switches": self.context_switches}
+        if self.instrumentation is not None:
+            stats.update(self.instrumentation.stats())
+        return stats
+
+    def set_event_batching(self, max_events: Optional[int] = 256, interval: Optional[float] = None, enabled: bool = True):
+        """
+        Activa o desactiva la agrupación de eventos para los observadores.
+        Con la agrupación activa, los eventos se acumulan en un buffer y se entregan
+        como una sola llamada 'on_events(batch)' por vaciado. El buffer se vacía al
+        alcanzar 'max_events', al pasar 'interval' segundos desde el último vaciado,
+        al terminar 'run_until_done' o al llamar a 'flush_events' (p. ej. tras un lote de pasos).
+        Args:
+            max_events (int): Eventos por lote (None = sin límite por cantidad).
+            interval (float): Segundos máximos entre vaciados (None = sin límite por tiempo).
+            enabled (bool): False vuelve a la notificación inmediata, evento a evento.
+        """
+        self.flush_events()
+        self._batch_max_events = max_events
+        self._batch_interval = interval
+        self._batch_last_flush = time.perf_counter()
+        self._event_buffer = [] if enabled else None
+
+    def flush_events(self):
+        """Entrega a los observadores los eventos acumulados (si hay alguno)."""
+        batch = self._event_buffer
+        if not batch:
+            return
+        self._event_buffer = []
+        self._batch_last_flush = time.perf_counter()
+        for o in self.observers:
+            o.on_events(batch)
+
+    def _queue_event(self, event: tuple):
+        """Añade un evento al buffer y lo vacía si se alcanza el tamaño o el intervalo."""
+        buffer = self._event_buffer
+        buffer.append(event)
+        if self._batch_max_events is not None and len(buffer) >= self._batch_max_events:
+            self.flush_events()
+        elif self._batch_interval is not None and time.perf_counter() - self._batch_last_flush >= self._batch_interval:
+            self.flush_events()
+
+class RoundRobinScheduler(EventSource):
     """
     Implementa la lógica del algoritmo de planificación Round Robin.
     Gestiona las colas de procesos, el reloj del sistema y notifica eventos
-    a los observadores registrados.
+    a los observadores registrados. La elección del siguiente proceso, la
+    duración de cada rodaja y la expulsión por llegada se delegan en una
+    'SchedulingPolicy' (por defecto, Round Robin clásico; ver models/policies.py).
+    Con un 'ContextSwitchCost', cada despacho ocupa la CPU unas unidades antes de que
+    el proceso avance (segmentos OVERHEAD_PID del historial; ver models/overhead.py).
     """
-    def __init__(self, quantum: int = 200):
+    INSTRUMENTED_METHODS = (
+        ("step", "step", "steps"),
+        ("advance_to_next_event", "advance", "steps"),
+        ("advance_rounds", "advance", "steps"),
+        ("_run_rounds", "rounds", None),
+        ("_move_arrivals", "arrivals", None),
+        ("_dispatch_next", "dispatch", None),
+        ("_run_current", "run", None),
+        ("flush_events", "flush", None),
+        ("metrics", "metrics", None),
+    )
+
+    ROUNDS_MIN_SLICES = 8  # Rodajas mínimas para que 'advance_rounds' use la forma cerrada
+
+    def __init__(self, quantum: int = 200, history: Optional[ExecutionHistory] = None,
+                 policy: Optional[SchedulingPolicy] = None, switch_cost: Optional[ContextSwitchCost] = None,
+                 io_model: Optional[IOModel] = None):
         """
         Inicializa el planificador.
         Args:
             quantum (int): Cantidad de tiempo asignada a cada proceso en turno.
+            history (ExecutionHistory): Almacén del historial de ráfagas (permite
+                configurar la retención y la descarga a disco). Por defecto, uno sin límite.
+            policy (SchedulingPolicy): Política de planificación (una instancia por
+                planificador). Por defecto, 'RoundRobinPolicy'.
+            switch_cost (ContextSwitchCost): Coste de cada cambio de contexto en tiempo
+                simulado. Por defecto (None), los cambios de contexto no consumen tiempo.
+            io_model (IOModel): E/S de los procesos. Por defecto (None), los procesos
+                solo usan la CPU.
         """
+        super().__init__()
         self.quantum = quantum
         self.time = 0  # Reloj del sistema
-        self.future = []  # Lista de procesos que aún no han llegado (ordenada por arrival)
-        self.ready: Deque[Process] = deque()  # Cola de procesos listos para ejecutar
+        self._future = ArrivalQueue()  # Procesos que aún no han llegado (min-heap por arrival)
+        # Cola de procesos listos: la propia política (en Round Robin, FIFO indexada por PID)
+        self.ready: SchedulingPolicy = policy if policy is not None else RoundRobinPolicy()
+        self.ready.bind(self)
+        self._preemptive = self.ready.preemptive
         self.finished = []  # Lista de procesos terminados
+        self._table: Optional[ProcessTable] = None  # Tabla de la que vienen todos los procesos (None si hay otros)
+        self.finished_stats: Optional[MetricsAccumulator] = None  # Métricas acumuladas si no se retienen los terminados
         self.current: Optional[Process] = None  # Proceso en ejecución actual
         self.current_consumed = 0  # Tiempo consumido del quantum del proceso actual
+        self._slice: Optional[int] = None  # Rodaja del proceso actual según la política (None = sin límite)
+        self._timer: Optional[int] = self.ready.next_timer(0)  # Próximo instante de 'on_timer' de la política
         self.context_switches = 0  # Contador de cambios de contexto
-        self.observers = []  # Lista de observadores registrados
-        self.history = []  # Historial de ráfagas de ejecución [(pid, start_time, duration), ...]
+        self.switch_cost = switch_cost
+        self._stall = 0  # Unidades de sobrecarga pendientes antes de que avance el proceso actual
+        self.overhead_time = 0  # Unidades de CPU dedicadas a cambios de contexto
+        self._last_run: Dict[int, int] = {}  # pid -> instante en que dejó la CPU (penalización de caché)
+        self.io_model = io_model
+        self._blocked: List[Tuple[int, int, Process]] = []  # Procesos en E/S: min-heap por (fin de la E/S, orden)
+        self._io_seq = 0  # Orden de bloqueo (desempate entre E/S que terminan a la vez)
+        self._finished_io = 0  # Tiempo bloqueado de los terminados no retenidos ('finished_stats')
+        # Índice pid -> estado (future/ready/running/finished/blocked); la ubicación exacta la
+        # resuelve cada estructura por PID: 'future' y 'ready' eliminan en O(1)
+        self._state: Dict[int, str] = {}
+        self.checkpoints: Optional[CheckpointIndex] = None  # Instantáneas para 'seek' (desactivado por defecto)
+        self._arrivals: Optional[ArrivalIndex] = None  # Carga por llegada (acompaña a las instantáneas)
+        self._history_ahead = False  # El historial contiene ráfagas posteriores al instante actual (tras 'restore')
+        # Lotes del motor analítico cuyas ráfagas aún no se han volcado al historial
+        self._deferred_history: List[Tuple[RoundBatch, List[int]]] = []
+        self._rounds_retry = 0  # Cambios de contexto a partir de los que se reintenta un lote analítico
+        # Historial de ráfagas de ejecución, iterable como [(pid, start_time, duration), ...]
+        self.history = history if history is not None else ExecutionHistory()
         # Para rastrear la ráfaga en ejecución actual
         self.current_burst_start = 0
         self.current_burst_pid = None
 
-    def subscribe(self, obs: SchedulerObserver):
-        """Agrega un observador a la lista."""
-        self.observers.append(obs)
+    @property
+    def policy(self) -> SchedulingPolicy:
+        """Política de planificación en uso (es también la cola 'ready')."""
+        return self.ready
+
+    @property
+    def future(self) -> ArrivalQueue:
+        """Vista de los procesos que aún no han llegado, iterable en orden de llegada."""
+        return self._future
+
+    @property
+    def history(self) -> ExecutionHistory:
+        """
+        Historial de ráfagas. Las rodajas de los lotes del motor analítico
+        ('advance_rounds') se generan al consultarlo por primera vez.
+        """
+        if self._deferred_history:
+            self._materialize_history()
+        return self._history
+
+    @history.setter
+    def history(self, history: ExecutionHistory):
+        if self._deferred_history:
+            self._materialize_history() # Las rodajas pendientes pertenecen al historial anterior
+        self._history = history
+
+    def _materialize_history(self):
+        """Vuelca al historial las rodajas de los lotes analíticos pendientes, en orden."""
+        deferred, self._deferred_history = self._deferred_history, []
+        history = self._history
+        for batch, pids in deferred:
+            for pid, start, duration in batch.segments(pids, history.merge):
+                history.append(pid, start, duration)
 
     def set_quantum(self, q: int):
         """Cambia el valor del quantum."""
+        if q != self.quantum:
+            self._invalidate_checkpoints(self.time)
         self.quantum = q
+        if self.current is not None:
+            self._slice = self.ready.time_slice(self.current) # La rodaja en curso usa el nuevo quantum
+
+    def set_switch_cost(self, switch_cost: Optional[ContextSwitchCost]):
+        """Cambia el coste de los cambios de contexto (se aplica desde el próximo despacho)."""
+        self._invalidate_checkpoints(self.time)
+        self.switch_cost = switch_cost
+
+    def state_of(self, pid: int) -> Optional[str]:
+        """
+        Devuelve el estado del proceso en O(1): STATE_FUTURE, STATE_READY,
+        STATE_RUNNING, STATE_FINISHED o None si el planificador no lo conoce
+        (p. ej. registros de una traza que aún no se han leído).
+        """
+        return self._state.get(pid)
 
     def add_process(self, proc: Process):
         """
         Añade un proceso al planificador.
         Lo coloca en la cola 'ready' si ya ha llegado, o en 'future' si no.
         """
+        self._invalidate_checkpoints(proc.arrival)
+        self._table = None
         if proc.arrival <= self.time:
             self.ready.append(proc)
+            self._state[proc.pid] = STATE_READY
+            seq = self._future.take_seq() if self._arrivals is not None else None
+        else:
+            seq = self._future.push(proc) # O(log n), mantiene el orden por arrival
+            self._state[proc.pid] = STATE_FUTURE
+        if self._arrivals is not None:
+            self._arrivals.add(proc, seq)
+
+    def contains(self, pid: int) -> bool:
+        """Indica en O(1) si el planificador conoce el proceso (en cualquier estado)."""
+        return pid in self._state
+
+    def remove(self, pid: int) -> bool:
+        """
+        Elimina un proceso del planificador usando el índice de estados.
+        Es O(1) para procesos en 'future', 'ready' o en ejecución; para los terminados
+        cuesta un desplazamiento de la lista 'finished' y para los bloqueados en una
+        E/S, reconstruir su heap.
+        No repite la simulación: para eliminarlo como si nunca hubiera existido, ver 'delete_process'.
+        Returns:
+            bool: True si el proceso estaba en el planificador.
+        """
+        entry = self._arrivals.remove(pid) if self._arrivals is not None else None
+        self._invalidate_checkpoints(self.time if entry is None else entry[0])
+        state = self._state.pop(pid, None)
+        if state == STATE_FUTURE:
+            self._future.remove(pid)
+        elif state == STATE_READY:
+            self.ready.remove(pid)
+        elif state == STATE_RUNNING:
+            self.current = None
+            self._stall = 0
+        elif state == STATE_BLOCKED:
+            self._blocked = [entry for entry in self._blocked if entry[2].pid != pid]
+            heapq.heapify(self._blocked)
+            self.ready.remove(pid) # Estado que la política guarda del proceso bloqueado
+        elif state == STATE_FINISHED:
+            finished = self.finished
+            for i in range(len(finished) - 1, -1, -1):
+                if finished[i].pid == pid:
+                    del finished[i]
+                    break
+        else:
+            return self._future.remove(pid) # Registro de una traza aún no admitido
+        self._last_run.pop(pid, None)
+        return True
+
+    def load_table(self, table: ProcessTable):
+        """
+        Añade todas las filas de una 'ProcessTable' al planificador.
+        Cada fila se maneja mediante una vista 'ProcessRow' (índice de fila en la tabla),
+        por lo que el estado de los procesos se escribe directamente en las columnas.
+        La carga se inserta en bloque leyendo las columnas, con el mismo orden y los
+        mismos desempates que añadir las filas una a una con 'add_process'.
+        """
+        if not len(table):
+            return
+        # Si la tabla es la única fuente de procesos, 'metrics' lee sus columnas directamente
+        self._table = table if not self._state else None
+        # La carga crea millones de objetos sin ciclos: pausar el GC evita recorrerlos una y otra vez
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._load_rows(table)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _load_rows(self, table: ProcessTable):
+        """Inserción en bloque de 'load_table' (tabla no vacía)."""
+        n = len(table)
+        time, arrival, pid = self.time, table.arrival, table.pid
+        first = min(arrival)
+        self._invalidate_checkpoints(first)
+        rows = list(map(ProcessRow, [table] * n, range(n)))
+        future, index = self._future, self._arrivals
+        if first > time: # Caso habitual: nada ha llegado aún
+            pending = None
+        else:
+            pending = [i for i in range(n) if arrival[i] > time]
+            for i in [i for i in range(n) if arrival[i] <= time]:
+                self.ready.append(rows[i])
+                self._state[pid[i]] = STATE_READY
+        if index is not None or pending is None:
+            # Con índice de llegadas, todas las filas reservan un orden de inserción (como en 'add_process')
+            base = future.take_seqs(n)
+            entries = list(zip(arrival, range(base, base + n), rows))
+            if index is not None:
+                index.extend(pid, entries)
+            if pending is not None:
+                entries = [entries[i] for i in pending]
         else:
-            self.future.append(proc)
-            self.future.sort(key=lambda p: p.arrival) # Mantiene 'future' ordenada
+            base = future.take_seqs(len(pending))
+            entries = list(zip([arrival[i] for i in pending], range(base, base + len(pending)), [rows[i] for i in pending]))
+        pending_pids = pid if pending is None else [pid[i] for i in pending]
+        future.extend(entries, pending_pids)
+        self._state.update(dict.fromkeys(pending_pids, STATE_FUTURE))
+
+    def attach_arrival_stream(self, pairs: Iterable[Tuple[int, int]], first_pid: int = 1, keep_finished: bool = True):
+        """
+        Conecta una traza perezosa de pares (arrival, burst), ordenada por arrival,
+        a la cola de procesos futuros. Los registros se leen solo cuando el reloj
+        de la simulación los alcanza.
+        Args:
+            pairs: Iterable de pares (arrival, burst), p. ej. 'models.traces.iter_trace'.
+            first_pid (int): PID del primer registro; los siguientes son consecutivos.
+            keep_finished (bool): Si es False, los procesos terminados no se guardan
+                en 'finished' sino que se acumulan en 'finished_stats', de modo que la
+                memoria depende de los procesos vivos y no de la longitud de la traza.
+        """
+        self._future.attach_source(pairs, first_pid)
+        self._move_arrivals() # Igual que 'add_process': lo que ya ha llegado pasa a 'ready'
+        if not keep_finished:
+            self.finished_stats = MetricsAccumulator()
 
-    def _move_arrivals(self):
+    def _move_arrivals(self) -> bool:
         """
-        Mueve procesos de la lista 'future' a la cola 'ready'
+        Mueve procesos de la cola 'future' a la cola 'ready'
         si su tiempo de llegada es menor o igual al tiempo actual del sistema.
+        Solo extrae del heap los procesos que ya han llegado.
+        Después devuelve a la cola los procesos cuya E/S ha terminado.
+        Returns:
+            bool: True si ha llegado (o vuelto de una E/S) algún proceso.
         """
-        moved = [p for p in self.future if p.arrival <= self.time]
-        self.future = [p for p in self.future if p.arrival > self.time]
-        for p in moved:
+        state = self._state
+        due = self._future.pop_due(self.time)
+        for p in due:
             self.ready.append(p)
+            state[p.pid] = STATE_READY
+        blocked = self._blocked
+        if not blocked or blocked[0][0] > self.time:
+            return bool(due)
+        while blocked and blocked[0][0] <= self.time:
+            p = heapq.heappop(blocked)[2]
+            self.ready.resume(p)
+            state[p.pid] = STATE_READY
+        return True
+
+    def _next_arrival(self) -> Optional[int]:
+        """Instante de la próxima llegada o del próximo fin de una E/S (None si no hay)."""
+        nxt = self._future.peek().arrival if self._future else None
+        if self._blocked:
+            wake = self._blocked[0][0]
+            if nxt is None or wake < nxt:
+                nxt = wake
+        return nxt
+
+    def _fire_timer(self):
+        """Ejecuta la decisión periódica de la política y programa la siguiente."""
+        self.ready.on_timer(self.time)
+        self._timer = self.ready.next_timer(self.time)
 
     # --- Métodos de notificación a observadores ---
     def _notify_tick(self):
         """Notifica a los observadores que ha avanzado una unidad de tiempo."""
+        if self._event_buffer is not None:
+            self._queue_event((EVENT_TICK, self.time))
+            return
         for o in self.observers:
             o.on_tick(self.time)
 
     def _notify_context_switch(self, pid: Optional[int]):
         """Notifica a los observadores que ha ocurrido un cambio de contexto."""
+        if self._event_buffer is not None:
+            self._queue_event((EVENT_CONTEXT_SWITCH, pid, self.time))
+            return
         for o in self.observers:
             o.on_context_switch(pid, self.time)
 
     def _notify_finished(self, proc: Process):
         """Notifica a los observadores que un proceso ha terminado."""
+        if self._event_buffer is not None:
+            self._queue_event((EVENT_FINISHED, proc, self.time))
+            return
         for o in self.observers:
             o.on_process_finished(proc, self.time)
 
@@ -113,7 +756,12 @@ class RoundRobinScheduler:
         También almacena la ráfaga en el historial.
         """
         if duration > 0:
-            self.history.append((pid, start_time, duration))
+            if self._deferred_history:
+                self._materialize_history()
+            self._history.append(pid, start_time, duration)
+        if self._event_buffer is not None:
+            self._queue_event((EVENT_BURST, pid, start_time, duration))
+            return
         for obs in self.observers:
             obs.on_execution_burst(pid, start_time, duration)
 
@@ -132,132 +780,882 @@ class RoundRobinScheduler:
         self.current_burst_pid = pid
         self.current_burst_start = self.time
 
-    def step(self) -> bool:
+    def _dispatch_next(self):
+        """Saca el siguiente proceso de la cola 'ready' y le entrega la CPU."""
+        self._end_current_burst() # Finalizar ráfaga anterior (de IDLE o de otro proceso)
+        self.current = self.ready.popleft()
+        self._slice = self.ready.time_slice(self.current)
+        self._state[self.current.pid] = STATE_RUNNING
+        self.current_consumed = 0
+        self.context_switches += 1
+        if self.current.start_time is None:
+            self.current.start_time = self.time
+        self._notify_context_switch(self.current.pid)
+        cost = self.switch_cost
+        if cost is not None:
+            last = self._last_run.pop(self.current.pid, None)
+            self._stall = cost.cost(None if last is None else self.time - last)
+            if self._stall:
+                self._start_new_burst(OVERHEAD_PID) # La CPU carga el contexto antes de que avance el proceso
+                return
+        self._start_new_burst(self.current.pid) # Iniciar ráfaga del nuevo proceso
+
+    def _prepare_cpu(self) -> Optional[bool]:
         """
-        Ejecuta un paso de la simulación (avanza una unidad de tiempo).
-        Implementa la lógica principal del algoritmo Round Robin.
+        Parte común de ambos motores: admite llegadas y decide quién ocupa la CPU.
         Returns:
-            bool: True si la simulación puede continuar, False si ha terminado.
+            Optional[bool]: None si hay un proceso listo para ejecutar; en otro caso,
+            el valor que debe devolver el paso (True si la simulación continúa).
         """
         self._move_arrivals()
         # Caso 1: No hay proceso en ejecución ni en la cola ready
         if self.current is None and not self.ready:
-            # Si hay procesos futuros, avanzar el tiempo hasta su llegada
-            if self.future:
+            # Si hay procesos futuros (o en E/S), avanzar el tiempo hasta su llegada
+            if self._future or self._blocked:
                 # Si estábamos en IDLE, notificar esa ráfaga
                 if self.current_burst_pid is None and self.time > self.current_burst_start:
                     self._notify_execution_burst(None, self.current_burst_start, self.time - self.current_burst_start)
-                self.time = self.future[0].arrival
+                self.time = self._next_arrival()
                 self._move_arrivals()
+                if self._timer is not None and self.time >= self._timer:
+                    self._fire_timer()
                 self._notify_tick()
                 self._start_new_burst(None) # Iniciar ráfaga de IDLE
                 return True
-            else:
-                # No hay más procesos, finalizar simulación
-                self._end_current_burst()
-                return False
+            # No hay más procesos, finalizar simulación
+            self._end_current_burst()
+            return False
         # Caso 2: Seleccionar un nuevo proceso para ejecutar
         if self.current is None:
-            self._end_current_burst() # Finalizar ráfaga anterior (de IDLE o de otro proceso)
-            self.current = self.ready.popleft()
-            self.current_consumed = 0
-            self.context_switches += 1
-            if self.current.start_time is None:
-                self.current.start_time = self.time
-            self._notify_context_switch(self.current.pid)
-            self._start_new_burst(self.current.pid) # Iniciar ráfaga del nuevo proceso
+            self._dispatch_next()
+        # Caso 2a: La CPU está cargando el contexto del proceso actual (no se le expulsa)
+        elif self._stall:
+            pass
+        # Caso 2b: Un proceso añadido directamente a 'ready' desplaza al actual (políticas expulsivas)
+        elif self._preemptive and self.ready and self.ready.should_preempt(self.current):
+            self._preempt(False)
+            self._dispatch_next()
         # Caso 3: El proceso en ejecución ha cambiado (por preemption o finalización)
         elif self.current_burst_pid != self.current.pid:
             self._end_current_burst()
             self._start_new_burst(self.current.pid)
-        # Ejecutar el proceso actual por una unidad de tiempo
-        self.current.remaining -= 1
-        self.current_consumed += 1
-        self.time += 1
+        return None
+
+    def _run_current(self, units: int) -> bool:
+        """
+        Ejecuta el proceso actual durante 'units' unidades de tiempo y resuelve
+        su finalización, su bloqueo en una E/S, su expulsión por quantum o su
+        expulsión por una llegada.
+        Returns:
+            bool: Siempre True (la simulación puede continuar).
+        """
+        if self._stall:
+            return self._run_stall(units)
+        self.current.remaining -= units
+        self.current_consumed += units
+        self.time += units
         self._notify_tick()
-        self._move_arrivals() # Verificar si llegan nuevos procesos
+        arrived = self._move_arrivals() # Verificar si llegan nuevos procesos
+        if self._timer is not None and self.time >= self._timer:
+            self._fire_timer()
+            arrived = True # La cola ha cambiado: la política puede querer expulsar
         # Caso 4: El proceso actual ha terminado
         if self.current.remaining == 0:
             self.current.completion_time = self.time
             finished = self.current
-            self.finished.append(finished)
+            if self.finished_stats is None:
+                self.finished.append(finished)
+                self._state[finished.pid] = STATE_FINISHED
+            else:
+                del self._state[finished.pid] # Los terminados no se retienen
+                service = finished.burst
+                if self.io_model is not None:
+                    blocked = self.io_model.blocked_time(finished.pid, finished.burst)
+                    self._finished_io += blocked
+                    service += blocked # La espera solo cuenta el tiempo en la cola de listos
+                self.finished_stats.add(finished.arrival, service, finished.start_time, finished.completion_time)
             self._notify_finished(finished)
             self._end_current_burst() # Finalizar su ráfaga
             self.current = None
             self.current_consumed = 0
             return True
+        # Caso 4b: El proceso pide una E/S y deja la CPU
+        if self.io_model is not None and self.io_model.requests(self.current):
+            self._block()
+            return True
         # Caso 5: El quantum del proceso actual se ha agotado (preemption)
-        if self.current_consumed >= self.quantum:
-            self._end_current_burst() # Finalizar su ráfaga
-            self.ready.append(self.current) # Moverlo al final de la cola ready
-            self.current = None
-            self.current_consumed = 0
+        if self._slice is not None and self.current_consumed >= self._slice:
+            self._preempt(True)
+            return True
+        # Caso 5b: Una llegada desplaza al proceso actual (políticas expulsivas)
+        if arrived and self._preemptive and self.ready.should_preempt(self.current):
+            self._preempt(False)
             return True
         # Caso 6: El proceso sigue ejecutando
         return True
 
+    def _run_stall(self, units: int) -> bool:
+        """
+        Consume 'units' unidades de la sobrecarga del despacho en curso; al completarla,
+        el proceso empieza a avanzar. Las llegadas se admiten, pero no lo expulsan.
+        Returns:
+            bool: Siempre True (la simulación puede continuar).
+        """
+        self._stall -= units
+        self.overhead_time += units
+        self.time += units
+        self._notify_tick()
+        self._move_arrivals()
+        if self._timer is not None and self.time >= self._timer:
+            self._fire_timer()
+        if not self._stall:
+            self._end_current_burst() # Finalizar el segmento de sobrecarga
+            self._start_new_burst(self.current.pid)
+        return True
+
+    def _preempt(self, expired: bool):
+        """Devuelve el proceso actual a la cola 'ready' según la política y libera la CPU."""
+        if self.switch_cost is not None:
+            self._last_run[self.current.pid] = self.time
+        self._end_current_burst() # Finalizar su ráfaga
+        self.ready.requeue(self.current, self.current_consumed, expired) # En Round Robin, al final de la cola
+        self._state[self.current.pid] = STATE_READY
+        self.current = None
+        self.current_consumed = 0
+
+    def _block(self):
+        """Bloquea el proceso actual en una E/S de 'io_model.wait' unidades y libera la CPU."""
+        proc = self.current
+        if self.switch_cost is not None:
+            self._last_run[proc.pid] = self.time
+        self._end_current_burst() # Finalizar su ráfaga
+        self.ready.suspend(proc, self.current_consumed) # La política recuerda lo que le quedaba de rodaja
+        heapq.heappush(self._blocked, (self.time + self.io_model.wait, self._io_seq, proc))
+        self._io_seq += 1
+        self._state[proc.pid] = STATE_BLOCKED
+        self.current = None
+        self.current_consumed = 0
+
+    def step(self) -> bool:
+        """
+        Ejecuta un paso de la simulación (avanza una unidad de tiempo).
+        Implementa la lógica principal del algoritmo Round Robin.
+        Returns:
+            bool: True si la simulación puede continuar, False si ha terminado.
+        """
+        if self._history_ahead:
+            self.truncate_history_to_present()
+        if self.checkpoints is not None:
+            self.checkpoints.tick(self)
+        outcome = self._prepare_cpu()
+        if outcome is not None:
+            return outcome
+        return self._run_current(1)
+
+    def advance_to_next_event(self, until: Optional[int] = None) -> bool:
+        """
+        Motor orientado a eventos: en lugar de avanzar una unidad, salta directamente
+        al primer evento relevante (fin del quantum, fin del proceso, próxima llegada
+        o temporizador de la política).
+        Produce exactamente el mismo historial, procesos terminados, cambios de contexto
+        y métricas que 'step', pero solo notifica 'on_tick' en los instantes de evento
+        (también el final de la sobrecarga de un cambio de contexto).
+        Args:
+            until (int): Si se indica, la ejecución no avanza el reloj más allá de este
+                instante (los saltos de CPU IDLE hasta la próxima llegada sí pueden superarlo).
+        Returns:
+            bool: True si la simulación puede continuar, False si ha terminado.
+        """
+        if self._history_ahead:
+            self.truncate_history_to_present()
+        if self.checkpoints is not None:
+            self.checkpoints.tick(self)
+        outcome = self._prepare_cpu()
+        if outcome is not None:
+            return outcome
+        return self._run_current(self._event_units(until))
+
+    def _event_units(self, until: Optional[int]) -> int:
+        """
+        Unidades hasta el primer evento relevante (fin de rodaja o de proceso, petición
+        o fin de una E/S, llegada, temporizador o 'until').
+        """
+        if self._stall:
+            units = self._stall
+        else:
+            units = self.current.remaining
+            if self._slice is not None:
+                units = min(units, self._slice - self.current_consumed)
+            if self.io_model is not None:
+                request = self.io_model.until_request(self.current)
+                if request is not None:
+                    units = min(units, request)
+        if self._future:
+            units = min(units, self._future.peek().arrival - self.time)
+        if self._blocked:
+            units = min(units, self._blocked[0][0] - self.time)
+        if self._timer is not None:
+            units = min(units, self._timer - self.time)
+        if until is not None:
+            units = min(units, until - self.time)
+        # Al menos una unidad, igual que 'step' (p. ej. si el quantum se redujo en caliente)
+        return max(1, units)
+
+    def advance_rounds(self, until: Optional[int] = None) -> bool:
+        """
+        Motor analítico: como 'advance_to_next_event', pero cuando la política es Round
+        Robin clásico y no hay llegadas pendientes antes del próximo fin de proceso, salta
+        muchas vueltas completas de la cola de una vez con su forma cerrada
+        (ver models/rounds.py). Produce el mismo historial, procesos terminados, cambios
+        de contexto y métricas que los otros motores.
+        El atajo solo se aplica sin observadores, sin coste de cambio de contexto, sin
+        E/S, sin instantáneas para 'seek' y sin eventos en búfer (en otro caso, cada llamada
+        avanza un evento, como 'advance_to_next_event'). Las rodajas del lote se vuelcan
+        al historial cuando alguien lo consulta.
+        Args:
+            until (int): Si se indica, la ejecución no avanza el reloj más allá de este
+                instante (los saltos de CPU IDLE hasta la próxima llegada sí pueden superarlo).
+        Returns:
+            bool: True si la simulación puede continuar, False si ha terminado.
+        """
+        if self._history_ahead:
+            self.truncate_history_to_present()
+        if self.checkpoints is not None:
+            self.checkpoints.tick(self)
+        outcome = self._prepare_cpu()
+        if outcome is not None:
+            return outcome
+        if (self.context_switches >= self._rounds_retry and not self.current_consumed
+                and type(self.ready) is RoundRobinPolicy and self.switch_cost is None and self.io_model is None
+                and self._timer is None and self._event_buffer is None
+                and self.checkpoints is None and not self.observers
+                and self._run_rounds(until)):
+            return True
+        return self._run_current(self._event_units(until))
+
+    def _run_rounds(self, until: Optional[int]) -> bool:
+        """
+        Ejecuta de una vez las vueltas completas de la cola que terminan antes de la
+        próxima llegada (y de 'until'). El proceso actual acaba de ser despachado.
+        Returns:
+            bool: False si no cabe ni una vuelta (se reintenta más adelante).
+        """
+        limit = until
+        if self._future:
+            # Una rodaja que acaba justo en la llegada se reencola detrás del recién llegado:
+            # ese caso lo resuelve el motor por eventos
+            arrival = self._future.peek().arrival - 1
+            limit = arrival if limit is None else min(limit, arrival)
+        procs = [self.current]
+        procs.extend(self.ready)
+        remaining = [p.remaining for p in procs]
+        # Comprobación barata antes de ordenar: el lote debe cubrir la primera vuelta entera
+        # y al menos ROUNDS_MIN_SLICES rodajas (con menos, el motor por eventos es más rápido)
+        budget = None if limit is None else limit - self.time
+        quantum, slices, pending = self.quantum, 0, remaining
+        while pending and slices < self.ROUNDS_MIN_SLICES:
+            survivors = []
+            for r in pending:
+                if budget is not None:
+                    budget -= r if r < quantum else quantum
+                    if budget < 0:
+                        break
+                slices += 1
+                if r > quantum:
+                    survivors.append(r - quantum)
+            else:
+                pending = survivors
+                continue
+            break
+        if slices < self.ROUNDS_MIN_SLICES or slices < len(remaining):
+            # Reintentar cuando se hayan ejecutado las rodajas revisadas
+            self._rounds_retry = self.context_switches + slices + 1
+            return False
+        batch = plan_rounds(self.time, quantum, remaining, limit)
+        for proc, first_run in zip(procs, batch.first_run):
+            if proc.start_time is None:
+                proc.start_time = first_run
+        self._deferred_history.append((batch, [p.pid for p in procs]))
+        self.context_switches += batch.slices - 1 # El primer despacho ya se contó
+        self.time = batch.end
+        for proc, left in zip(procs, batch.left):
+            proc.remaining = left
+        for completion, i in batch.finished:
+            finished = procs[i]
+            finished.completion_time = completion
+            if self.finished_stats is None:
+                self.finished.append(finished)
+                self._state[finished.pid] = STATE_FINISHED
+            else:
+                del self._state[finished.pid]
+                self.finished_stats.add(finished.arrival, finished.burst, finished.start_time, completion)
+        self.ready.clear()
+        for i in batch.order:
+            self.ready.append(procs[i])
+            self._state[procs[i].pid] = STATE_READY
+        self.current = None
+        self.current_consumed = 0
+        self.current_burst_pid = None # La última rodaja del lote ya está en el historial
+        self.current_burst_start = self.time
+        return True
+
+    def run_until_done(self, mode: str = "tick", checkpoint_path: Optional[str] = None,
+                       checkpoint_interval: float = 60.0):
+        """
+        Ejecuta la simulación hasta que no queden procesos.
+        Args:
+            mode (str): "tick" avanza unidad a unidad con 'step';
+                        "event" salta de evento en evento con 'advance_to_next_event';
+                        "analytic" salta vueltas completas con 'advance_rounds'.
+            checkpoint_path (str): Si se indica, se escribe un punto de control
+                ('checkpoint') en este fichero cada 'checkpoint_interval' segundos
+                y otro al terminar.
+            checkpoint_interval (float): Segundos de reloj entre puntos de control.
+        """
+        if mode == "tick":
+            advance = self.step
+        elif mode == "event":
+            advance = self.advance_to_next_event
+        elif mode == "analytic":
+            advance = self.advance_rounds
+        else:
+            raise ValueError(f"Modo de ejecución desconocido: {mode!r}")
+        if checkpoint_path is None:
+            while advance():
+                pass
+        else:
+            next_checkpoint = time.perf_counter() + checkpoint_interval
+            while advance():
+                if time.perf_counter() >= next_checkpoint:
+                    self.checkpoint(checkpoint_path)
+                    next_checkpoint = time.perf_counter() + checkpoint_interval
+            self.checkpoint(checkpoint_path)
+        self.flush_events()
+
+    # --- Instantáneas (snapshot / restore) ---
+    def _all_processes(self, entries: Optional[List[Tuple[Process, int]]] = None) -> List[Process]:
+        """Todos los procesos que conoce el planificador (pendientes, listos, bloqueados, en ejecución y terminados)."""
+        if entries is None:
+            entries = self._future.entries()
+        procs = [proc for proc, _ in entries]
+        procs.extend(self.ready)
+        procs.extend(entry[2] for entry in self._blocked)
+        if self.current is not None:
+            procs.append(self.current)
+        procs.extend(self.finished)
+        return procs
+
+    def snapshot(self, include_history: bool = True, include_future: bool = True) -> bytes:
+        """
+        Captura el estado completo de la simulación en un blob binario compacto:
+        reloj, colas (con su orden), estado de cada proceso, contadores, la ráfaga
+        en curso y el cursor del historial.
+        Args:
+            include_history (bool): Incluir las ráfagas retenidas del historial. Si es
+                False solo se guarda el cursor: 'restore' conserva el historial actual
+                y lo recorta al instante restaurado cuando la simulación vuelve a
+                avanzar (útil para moverse dentro de la misma ejecución).
+            include_future (bool): Si es False, se omiten los procesos pendientes que
+                están en el índice de llegadas (ver 'enable_checkpoints'); solo sirve
+                para las instantáneas en memoria, que los reconstruyen desde el índice.
+        Returns:
+            bytes: Instantánea para 'restore' o 'from_snapshot'.
+        """
+        future = self._future
+        entries = future.entries()
+        if not include_future:
+            indexed = self._arrivals
+            entries = [(proc, seq) for proc, seq in entries if proc.pid not in indexed]
+        procs = array("q")
+        for p in self._all_processes(entries):
+            procs.extend((p.pid, p.arrival, p.burst, p.remaining,
+                          NO_VALUE if p.start_time is None else p.start_time,
+                          NO_VALUE if p.completion_time is None else p.completion_time))
+        if self._history_ahead:
+            history_count, history_end = self.history.cursor_at(self.current_burst_start)
+        else:
+            history_count, history_end = self.history.cursor()
+        cost = self.switch_cost
+        io = self.io_model
+        state = {
+            "time": self.time,
+            "quantum": self.quantum,
+            "current_pid": NO_VALUE if self.current is None else self.current.pid,
+            "current_consumed": self.current_consumed,
+            "context_switches": self.context_switches,
+            "burst_start": self.current_burst_start,
+            "burst_pid": NO_VALUE if self.current_burst_pid is None else self.current_burst_pid,
+            "history_count": history_count,
+            "history_end": history_end,
+            "future_seq": future._seq,
+            "source_seq": future._source_seq,
+            "next_pid": future._next_pid,
+            "consumed": future.consumed,
+            "has_source": future._source is not None or future._head is not None,
+            "keep_finished": self.finished_stats is None,
+            "has_history": include_history,
+            "history_spilled": self.history.spilled,
+            "current_slice": NO_VALUE if self._slice is None else self._slice,
+            "policy_id": policy_id(self.ready),
+            "stall": self._stall,
+            "overhead_time": self.overhead_time,
+            "switch_latency": NO_VALUE if cost is None else cost.latency,
+            "cache_penalty": 0 if cost is None else cost.cache_penalty,
+            "cache_window": 0 if cost is None else cost.cache_window,
+            "io_every": NO_VALUE if io is None else io.every,
+            "io_wait": 0 if io is None else io.wait,
+            "io_seq": self._io_seq,
+            "io_finished": self._finished_io,
+            "procs": procs,
+            "ready": array("q", [p.pid for p in self.ready]),
+            "policy": self.ready.state(),
+            "future": array("q", [v for proc, seq in entries for v in (proc.pid, seq)]),
+            "finished": array("q", [p.pid for p in self.finished]),
+            "last_run": array("q", [v for item in self._last_run.items() for v in item]),
+            "io_pids": array("q", sorted(io.pids) if io is not None and io.pids is not None else []),
+            "blocked": array("q", [v for wake, seq, proc in self._blocked for v in (proc.pid, wake, seq)]),
+        }
+        stats = self.finished_stats
+        if stats is not None:
+            state["stats"] = (True, stats.count, stats.total_turnaround, stats.total_waiting,
+                              stats.total_response, stats.makespan, stats.ntat_count,
+                              stats.ntat_mean, stats.ntat_m2)
+        if include_history:
+            state["history_pid"], state["history_start"], state["history_duration"] = \
+                self.history.columns(history_count - self.history.spilled)
+        return encode_snapshot(state)
+
+    def restore(self, snapshot: bytes, reopen_stream: Optional[Callable[[int], Iterable[Tuple[int, int]]]] = None):
+        """
+        Devuelve el planificador al estado de una instantánea.
+        Los procesos que el planificador ya conoce (mismo PID) se actualizan en el
+        sitio, de modo que las referencias externas (p. ej. el diccionario de
+        procesos del presentador o las filas de una 'ProcessTable') siguen siendo válidas.
+        Args:
+            snapshot (bytes): Blob creado por 'snapshot'.
+            reopen_stream: Si la instantánea procede de una traza en streaming, función
+                que recibe el número de registros ya leídos y devuelve el resto de la
+                traza (p. ej. 'lambda skip: iter_trace(path, skip=skip)').
+        Raises:
+            ValueError: Si el blob no es válido, o si falta 'reopen_stream' o el
+                historial no contiene el cursor de la instantánea.
+        """
+        self._restore_state(decode_snapshot(snapshot), reopen_stream)
+        if self.checkpoints is not None:
+            # Las instantáneas registradas pertenecen a otra línea temporal
+            self.checkpoints.clear()
+            self._rebuild_arrival_index()
+
+    def restore_completed(self, snapshot: bytes):
+        """
+        Lleva el planificador, con la carga recién añadida y sin empezar, al final de una
+        ejecución completa de esa misma carga (p. ej. guardada en 'models.run_cache').
+        A diferencia de 'restore', conserva el índice de llegadas y, con
+        'enable_checkpoints', toma antes una instantánea del inicio: 'seek' puede
+        volver atrás repitiendo la simulación desde ahí.
+        """
+        state = decode_snapshot(snapshot)
+        if not state["has_history"] or state["has_source"]:
+            raise ValueError("La instantánea no procede de una ejecución completa con historial.")
+        if self.checkpoints is not None:
+            self.checkpoints.record(self)
+        self._restore_state(state, None)
+
+    def _restore_checkpoint(self, snapshot: bytes):
+        """Restaura una instantánea del índice: la cola de llegadas se reconstruye desde el índice de llegadas."""
+        state = decode_snapshot(snapshot)
+        self._restore_state(state, None, self._arrivals.pending_after(state["time"]))
+
+    def _restore_state(self, state: Dict, reopen_stream: Optional[Callable[[int], Iterable[Tuple[int, int]]]],
+                       pending: Optional[List[Tuple[Process, int]]] = None):
+        """
+        Aplica un estado decodificado. 'pending' son procesos pendientes que la
+        instantánea omitió (ver 'include_future'), con su orden de inserción;
+        vuelven a la cola de llegadas sin ejecutar.
+        """
+        if state["has_source"] and reopen_stream is None:
+            raise ValueError("La instantánea procede de una traza en streaming: indica 'reopen_stream' para reabrirla.")
+        if not state["has_history"] and self.history.end_time() < state["history_end"]:
+            raise ValueError("El historial no llega al instante de la instantánea: usa una tomada con include_history=True.")
+        if state.get("policy_id", policy_id(RoundRobinPolicy)) != policy_id(self.ready): # v1: Round Robin
+            raise ValueError("La instantánea se tomó con otra política de planificación.")
+        known = {p.pid: p for p in self._all_processes()}
+        procs: Dict[int, Process] = {}
+        cols = state["procs"]
+        for i in range(0, len(cols), 6):
+            pid, arrival, burst, remaining, start, completion = cols[i:i + 6]
+            p = known.get(pid)
+            if p is None:
+                p = Process(pid, arrival, burst)
+            else:
+                p.arrival = arrival
+                p.burst = burst
+            p.remaining = remaining
+            p.start_time = None if start == NO_VALUE else start
+            p.completion_time = None if completion == NO_VALUE else completion
+            procs[pid] = p
+
+        self.time = state["time"]
+        self.quantum = state["quantum"]
+        future = state["future"]
+        entries = [(procs[future[i]], future[i + 1]) for i in range(0, len(future), 2)]
+        future_seq = state["future_seq"]
+        if pending:
+            for p, _ in pending:
+                p.remaining = p.burst
+                p.start_time = None
+                p.completion_time = None
+            entries.extend(pending)
+            future_seq = max(future_seq, self._arrivals.next_seq) # No reutilizar órdenes de procesos añadidos después
+        self._future.restore(entries, future_seq, state["source_seq"], state["next_pid"], state["consumed"])
+        self.ready.load([procs[pid] for pid in state["ready"]], state.get("policy", ()))
+        self.current = None if state["current_pid"] == NO_VALUE else procs[state["current_pid"]]
+        self.current_consumed = state["current_consumed"]
+        if "current_slice" in state:
+            self._slice = None if state["current_slice"] == NO_VALUE else state["current_slice"]
+        elif self.current is not None:
+            self._slice = self.ready.time_slice(self.current) # Instantánea anterior a las políticas
+        self._timer = self.ready.next_timer(self.time)
+        self.finished = [procs[pid] for pid in state["finished"]]
+        self.finished_stats = None
+        if not state["keep_finished"]:
+            self.finished_stats = MetricsAccumulator()
+            stats = state["stats"]
+            if stats is not None:
+                (_, self.finished_stats.count, self.finished_stats.total_turnaround,
+                 self.finished_stats.total_waiting, self.finished_stats.total_response,
+                 self.finished_stats.makespan, self.finished_stats.ntat_count,
+                 self.finished_stats.ntat_mean, self.finished_stats.ntat_m2) = stats
+        self.context_switches = state["context_switches"]
+        # Coste de los cambios de contexto (las versiones anteriores a la 3 no lo tienen)
+        self._stall = state.get("stall", 0)
+        self.overhead_time = state.get("overhead_time", 0)
+        if state.get("switch_latency", NO_VALUE) == NO_VALUE:
+            self.switch_cost = None
+        else:
+            self.switch_cost = ContextSwitchCost(state["switch_latency"], state["cache_penalty"], state["cache_window"])
+        last_run = state.get("last_run", ())
+        self._last_run = {last_run[i]: last_run[i + 1] for i in range(0, len(last_run), 2)}
+        # E/S (las versiones anteriores a la 4 no la tienen)
+        if state.get("io_every", NO_VALUE) == NO_VALUE:
+            self.io_model = None
+        else:
+            self.io_model = IOModel(state["io_every"], state["io_wait"], state["io_pids"] or None)
+        self._io_seq = state.get("io_seq", 0)
+        self._finished_io = state.get("io_finished", 0)
+        blocked = state.get("blocked", ())
+        self._blocked = [(blocked[i + 1], blocked[i + 2], procs[blocked[i]]) for i in range(0, len(blocked), 3)]
+        heapq.heapify(self._blocked)
+        self._state = {pid: STATE_FUTURE for pid in self._future._live}
+        self._state.update((pid, STATE_READY) for pid in state["ready"])
+        self._state.update((blocked[i], STATE_BLOCKED) for i in range(0, len(blocked), 3))
+        self._state.update((p.pid, STATE_FINISHED) for p in self.finished)
+        if self.current is not None:
+            self._state[self.current.pid] = STATE_RUNNING
+        if state["has_history"]:
+            self._deferred_history = []
+            self.history.load_columns(state["history_pid"], state["history_start"],
+                                      state["history_duration"], state["history_spilled"])
+            self._history_ahead = False
+        else:
+            # El historial se conserva entero (sirve para volver a avanzar con 'seek') y se
+            # recorta al instante actual cuando la simulación vuelva a avanzar
+            self._history_ahead = True
+        self.current_burst_start = state["burst_start"]
+        self.current_burst_pid = None if state["burst_pid"] == NO_VALUE else state["burst_pid"]
+        if self._event_buffer is not None:
+            self._event_buffer = [] # Los eventos pendientes pertenecen al estado abandonado
+        if state["has_source"]:
+            self._future.attach_source(reopen_stream(state["consumed"]), state["next_pid"], state["source_seq"])
+
+    def enable_checkpoints(self, memory_budget: int = 32 * 1024 * 1024, spacing: int = 256) -> CheckpointIndex:
+        """
+        Activa el índice de instantáneas usado por 'seek', 'edit_process' y
+        'delete_process'. Se toma una instantánea (sin historial, solo su cursor)
+        cada 'spacing' avances; la separación se adapta para no superar
+        'memory_budget' bytes. Las instantáneas no incluyen la cola de llegadas:
+        se reconstruye desde un índice de la carga por llegada, de modo que un
+        cambio en un proceso solo invalida las instantáneas desde su llegada.
+        """
+        self.checkpoints = CheckpointIndex(memory_budget, spacing)
+        self._rebuild_arrival_index()
+        return self.checkpoints
+
+    def _rebuild_arrival_index(self):
+        """Crea el índice de llegadas a partir de los procesos pendientes actuales."""
+        future = self._future
+        self._arrivals = ArrivalIndex()
+        for proc, seq in future.entries():
+            if proc.pid in future._live: # La cabeza de una traza no se indexa (no se puede editar)
+                self._arrivals.add(proc, seq)
+        self._arrivals.next_seq = max(self._arrivals.next_seq, future._seq)
+        # Solo se puede repetir desde t=0 si el índice contiene toda la carga
+        self._arrivals.complete = (self.time == 0 and not (self.ready or self.current or self.finished)
+                                   and future._head is None and self.finished_stats is None)
+
+    def _invalidate_checkpoints(self, since: int):
+        """
+        La simulación cambia a partir del instante 'since': descarta las instantáneas
+        desde ese instante y las ráfagas del historial posteriores al instante actual.
+        """
+        if self.checkpoints is not None:
+            self.checkpoints.discard_after(min(since, self.time) - 1)
+        if self._history_ahead:
+            self.truncate_history_to_present()
+
+    def _rewind_before(self, t: int):
+        """
+        Vuelve a la última instantánea anterior a 't' (o al inicio de la simulación),
+        antes de un cambio en la carga que afecta desde 't'.
+        Raises:
+            ValueError: Si no hay instantánea anterior y el índice no permite repetir desde el inicio.
+        """
+        entry = self.checkpoints.nearest_before(t - 1)
+        if entry is not None:
+            self._restore_checkpoint(entry[1])
+        elif self._arrivals.complete:
+            self._restart()
+        else:
+            raise ValueError(f"No hay una instantánea anterior a t={t} para repetir la simulación.")
+
+    def _restart(self):
+        """
+        Vuelve a t=0 con toda la carga del índice de llegadas pendiente, también la
+        que llega en t=0 (quien llama la admite tras aplicar su cambio).
+        """
+        pending = self._arrivals.pending_after(-math.inf)
+        self._clear_run_state()
+        for p, _ in pending:
+            p.remaining = p.burst
+            p.start_time = None
+            p.completion_time = None
+        self._future.restore(pending, self._arrivals.next_seq, 0, 1, 0)
+        self._state = {p.pid: STATE_FUTURE for p, _ in pending}
+
+    def _indexed(self, pid: int) -> Tuple[int, int, Process]:
+        """Entrada del índice de llegadas de un proceso (requiere 'enable_checkpoints')."""
+        if self._arrivals is None:
+            raise ValueError("Activa 'enable_checkpoints' para editar procesos sin reiniciar la simulación.")
+        entry = self._arrivals.get(pid)
+        if entry is None:
+            raise ValueError(f"El proceso P{pid} no está en el planificador.")
+        return entry
+
+    def edit_process(self, pid: int, arrival: int, burst: int) -> int:
+        """
+        Cambia la llegada y la ráfaga de un proceso y deja la simulación en el mismo
+        instante, con el mismo resultado que repetirla desde el principio con el cambio.
+        Solo se vuelve a simular desde la última instantánea anterior a la llegada
+        afectada (la menor entre la antigua y la nueva): lo anterior no puede cambiar.
+        El proceso conserva su orden de inserción, así que los desempates con otras
+        llegadas simultáneas son los mismos que en una ejecución completa.
+        Returns:
+            int: El instante alcanzado (el siguiente evento si el instante actual queda en CPU IDLE).
+        Raises:
+            ValueError: Si no hay índice de instantáneas, el proceso no existe o la ráfaga no es positiva.
+        """
+        old_arrival, seq, proc = self._indexed(pid)
+        if burst <= 0:
+            raise ValueError("El Burst Time debe ser mayor a 0.")
+        since = min(old_arrival, arrival)
+        target = self.time
+        if since <= self.time:
+            self._rewind_before(since) # Ahora el proceso está pendiente y sin ejecutar
+        self._invalidate_checkpoints(since)
+        self._future.remove(pid)
+        proc.arrival = arrival
+        proc.burst = burst
+        proc.remaining = burst
+        self._future.push(proc, seq)
+        self._arrivals.add(proc, seq)
+        self._move_arrivals() # Tras volver a t=0, lo que llega en t=0 pasa a 'ready'
+        return self.seek(target) if self.time < target else self.time
+
+    def delete_process(self, pid: int) -> int:
+        """
+        Elimina un proceso y deja la simulación en el mismo instante, como si nunca
+        hubiera existido: solo se vuelve a simular desde la última instantánea anterior
+        a su llegada.
+        Returns:
+            int: El instante alcanzado (el siguiente evento si el instante actual queda en CPU IDLE).
+        Raises:
+            ValueError: Si no hay índice de instantáneas o el proceso no existe.
+        """
+        arrival = self._indexed(pid)[0]
+        target = self.time
+        if arrival <= self.time:
+            self._rewind_before(arrival)
+        self.remove(pid)
+        self._move_arrivals()
+        return self.seek(target) if self.time < target else self.time
+
+    @property
+    def history_ahead(self) -> bool:
+        """True si el historial contiene ráfagas posteriores al instante actual (tras 'seek' o 'restore')."""
+        return self._history_ahead
+
+    def truncate_history_to_present(self):
+        """Descarta del historial las ráfagas posteriores al instante actual de la simulación."""
+        self.history.truncate(*self.history.cursor_at(self.current_burst_start))
+        self._history_ahead = False
+
+    def seek(self, t: int) -> int:
+        """
+        Lleva la simulación al instante 't', hacia atrás o hacia delante: restaura la
+        última instantánea anterior a 't' (si retrocede o si está más cerca que el
+        estado actual) y avanza con el motor por eventos. Durante el salto no se
+        notifica a los observadores.
+        El historial no se recorta al retroceder: mientras 't' quede dentro de lo ya
+        simulado, el avance no lo modifica y se puede volver a saltar hacia delante
+        al instante que sea; solo se recorta si la simulación continúa desde aquí.
+        Si 't' cae en un intervalo de CPU IDLE, la simulación queda en la siguiente llegada.
+        Requiere 'enable_checkpoints' para retroceder.
+        Returns:
+            int: El instante alcanzado.
+        Raises:
+            ValueError: Si hay que retroceder y no hay instantáneas.
+        """
+        index = self.checkpoints
+        entry = None if index is None else (index.nearest_before(t) or index.first())
+        if t < self.time:
+            if entry is None:
+                raise ValueError("No hay instantáneas para retroceder: activa 'enable_checkpoints' antes de simular.")
+            self._restore_checkpoint(entry[1])
+        elif entry is not None and self.time < entry[0] <= self.history.end_time():
+            self._restore_checkpoint(entry[1]) # Hacia delante también se salta a la instantánea más cercana
+        replay = self._history_ahead and t <= self.history.end_time()
+        if self._history_ahead and not replay:
+            self.truncate_history_to_present() # Se simula más allá de lo registrado
+        observers, buffer, history = self.observers, self._event_buffer, self.history
+        self.observers, self._event_buffer = [], None
+        if replay:
+            # Lo que se vuelve a simular ya está en el historial (y en el índice de instantáneas)
+            self.history, self.checkpoints, self._history_ahead = ExecutionHistory(max_bursts=0), None, False
+        try:
+            while self.time < t and self.advance_to_next_event(until=t):
+                pass
+        finally:
+            self.observers = observers
+            self._event_buffer = None if buffer is None else []
+            if replay:
+                self.history, self.checkpoints, self._history_ahead = history, index, True
+        return self.time
+
+    @classmethod
+    def from_snapshot(cls, snapshot: bytes, history: Optional[ExecutionHistory] = None,
+                      reopen_stream: Optional[Callable[[int], Iterable[Tuple[int, int]]]] = None,
+                      policy: Optional[SchedulingPolicy] = None) -> "RoundRobinScheduler":
+        """
+        Crea un planificador nuevo en el estado de una instantánea (p. ej. para bifurcar simulaciones).
+        Args:
+            policy (SchedulingPolicy): Instancia nueva de la política con la que se tomó la
+                instantánea. Por defecto se crea la de la instantánea con sus opciones por
+                defecto: las opciones (pesos de 'wrr', niveles de 'mlfq'...) no se guardan,
+                así que una política configurada debe pasarse aquí.
+        Raises:
+            ValueError: Si el blob no es válido o 'policy' no es la de la instantánea.
+        """
+        state = decode_snapshot(snapshot)
+        if policy is None:
+            policy = policy_from_id(state.get("policy_id", policy_id(RoundRobinPolicy))) # v1: Round Robin
+        scheduler = cls(history=history, policy=policy)
+        scheduler._restore_state(state, reopen_stream)
+        return scheduler
+
+    def checkpoint(self, path: str, include_history: bool = True):
+        """Escribe una instantánea en disco de forma atómica (ver 'models.snapshot.write_checkpoint')."""
+        write_checkpoint(path, self.snapshot(include_history))
+
     def reset(self):
         """Reinicia el estado del planificador, manteniendo los procesos."""
+        self._clear_run_state()
+        self._table = None
+        if self.checkpoints is not None:
+            self.checkpoints.clear()
+            self._arrivals.clear()
+
+    def _clear_run_state(self):
+        """Vacía colas, reloj, contadores e historial (parte común de 'reset' y '_restart')."""
         self.time = 0
-        self.future = []
-        self.ready = deque()
+        self._future.clear()
+        self.ready.clear()
+        self._timer = self.ready.next_timer(0)
         self.finished = []
+        self.finished_stats = None
         self.current = None
         self.current_consumed = 0
+        self._slice = None
         self.context_switches = 0
-        self.history = []
+        self._stall = 0
+        self.overhead_time = 0
+        self._last_run = {}
+        self._blocked = []
+        self._io_seq = 0
+        self._finished_io = 0
+        self._state = {}
+        self._history_ahead = False
+        self._deferred_history = []
+        self._rounds_retry = 0
+        self.history.clear()
         self.current_burst_start = 0
         self.current_burst_pid = None
+        if self._event_buffer is not None:
+            self._event_buffer = [] # Descartar eventos pendientes de la simulación anterior
 
     def is_done(self) -> bool:
         """
         Verifica si la simulación ha terminado.
         Returns:
-            bool: True si no quedan procesos en future, ready o current.
+            bool: True si no quedan procesos en future, ready, current o en E/S.
         """
-        return not (self.future or self.ready or self.current)
+        return not (self._future or self.ready or self.current or self._blocked)
 
     def metrics(self):
         """
         Calcula y devuelve métricas de rendimiento de la simulación.
+        Extrae las columnas arrival/burst/start/completion de los procesos terminados
+        y delega el cálculo (vectorizado si NumPy está disponible) en 'models.metrics'.
+        Si todos los procesos vienen de una 'ProcessTable', las columnas se pasan a
+        NumPy directamente desde la tabla. Con E/S, el servicio de cada proceso incluye
+        su tiempo bloqueado, de modo que la espera solo cuenta la cola de listos.
         Returns:
-            dict: Diccionario con las métricas calculadas.
-        """
-        n = len(self.finished)
-        if n == 0:
-            return {}
-        # Calcular sumas para métricas promedio
-        total_turnaround = sum((p.completion_time - p.arrival) for p in self.finished if p.completion_time is not None)
-        total_waiting = sum(((p.completion_time - p.arrival) - p.burst) for p in self.finished if p.completion_time is not None)
-        total_response = sum(((p.start_time - p.arrival) if p.start_time is not None else 0) for p in self.finished)
-        # Makespan (tiempo total de la simulación)
-        makespan = max((p.completion_time for p in self.finished if p.completion_time is not None), default=0)
-        # Calcular NTAT y sus estadísticas
-        ntat_values = []
-        for p in self.finished:
-            if p.completion_time is not None and p.burst > 0:
-                 tat = p.completion_time - p.arrival
-                 ntat = tat / p.burst
-                 ntat_values.append(ntat)
-        avg_ntat = sum(ntat_values) / len(ntat_values) if ntat_values else 0
-        stdev_ntat = 0
-        cv_ntat = 0
-        if len(ntat_values) > 1:
-            variance_ntat = sum((ntat - avg_ntat) ** 2 for ntat in ntat_values) / (len(ntat_values) - 1)
-            stdev_ntat = math.sqrt(variance_ntat)
-            if avg_ntat > 0:
-                cv_ntat = stdev_ntat / avg_ntat * 100
-        return {
-            "avg_turnaround": total_turnaround / n,
-            "avg_waiting": total_waiting / n,
-            "avg_response": total_response / n,
-            "context_switches": self.context_switches,
-            "throughput": n / makespan if makespan > 0 else float('inf'),
-            "makespan": makespan,
-            "avg_ntat": avg_ntat,
-            "stdev_ntat": stdev_ntat,
-            "cv_ntat": cv_ntat
-        }
+            dict: Diccionario con las métricas calculadas, incluidos los
+                  percentiles p50/p95/p99 de turnaround, espera y respuesta
+                  (los percentiles se omiten si los terminados no se retienen),
+                  el tiempo de sobrecarga de los cambios de contexto y la
+                  eficiencia de la CPU (trabajo útil / (trabajo útil + sobrecarga)).
+        """
+        stats = self.finished_stats
+        if stats is not None:
+            metrics = stats.result(self.context_switches)
+            useful = stats.total_turnaround - stats.total_waiting - self._finished_io # Suma de las ráfagas
+        else:
+            finished = self.finished
+            if not finished:
+                return {}
+            columns = None
+            if self._table is not None and self.io_model is None:
+                columns = finished_columns(self._table, len(finished))
+            if columns is not None:
+                metrics = compute_metrics(*columns, self.context_switches)
+                useful = int(columns[1].sum())
+            else:
+                bursts = [p.burst for p in finished]
+                service = bursts
+                if self.io_model is not None:
+                    blocked_time = self.io_model.blocked_time
+                    service = [p.burst + blocked_time(p.pid, p.burst) for p in finished]
+                metrics = compute_metrics(
+                    [p.arrival for p in finished],
+                    service,
+                    [NO_VALUE if p.start_time is None else p.start_time for p in finished],
+                    [p.completion_time for p in finished],
+                    self.context_switches,
+                )
+                useful = sum(bursts)
+        if metrics:
+            metrics.update(overhead_metrics(useful, self.overhead_time))
+        return metrics
 
 # --- PUNTO DE ENTRADA PARA PRUEBAS DEL MODELO (Opcional) ---
 # def main():
@@ -0,0 +1,549 @@
+# models/smp.py
+"""
+Planificador Round Robin multinúcleo (SMP).
+
+Simula N CPUs que comparten el reloj y la cola de llegadas, con dos variantes
+de cola de listos:
+  - 'global': una sola cola FIFO; cada núcleo libre toma el primer proceso.
+  - 'per-core': una cola por núcleo; cada llegada va a la cola del núcleo menos
+    cargado, un proceso expulsado vuelve a la cola de su núcleo y, con robo de
+    trabajo, un núcleo sin trabajo toma el último proceso de la cola más larga.
+Un proceso que reanuda en un núcleo distinto del último en que se ejecutó paga
+'migration_cost' unidades de sobrecarga, y con un 'ContextSwitchCost' cada
+despacho paga además su latencia y recarga de caché (segmentos OVERHEAD_PID
+del historial).
+
+Cada núcleo tiene su propio historial de ráfagas. El avance de los procesos en
+ejecución se contabiliza de forma perezosa (solo al terminar su rodaja) y los
+fines de rodaja se guardan en un min-heap, así que cada evento cuesta
+O(log núcleos) y el motor por eventos sigue siendo rápido con decenas de núcleos.
+"""
+import heapq
+from typing import Dict, List, Optional
+
+from models.history import ExecutionHistory, OVERHEAD_PID
+from models.metrics import compute_metrics, finished_columns, overhead_metrics
+from models.overhead import ContextSwitchCost
+from models.policies import ReadyQueue
+from models.process_table import NO_VALUE, ProcessTable
+from models.scheduler import (
+    EVENT_BURST, EVENT_CONTEXT_SWITCH, EVENT_FINISHED, EVENT_TICK,
+    STATE_FINISHED, STATE_FUTURE, STATE_READY, STATE_RUNNING,
+    ArrivalQueue, EventSource, Process,
+)
+
+# Variantes de cola de listos
+QUEUES_GLOBAL = "global"
+QUEUES_PER_CORE = "per-core"
+
+class SMPScheduler(EventSource):
+    """
+    Round Robin con varias CPUs. Ofrece la misma interfaz de simulación que
+    'RoundRobinScheduler' (add_process, step, advance_to_next_event, run_until_done,
+    metrics, observadores y agrupación de eventos), con 'histories' (un historial
+    por núcleo) en lugar de 'history' y 'running' (el proceso de cada núcleo) en
+    lugar de 'current'. Con un núcleo y cola global produce exactamente el mismo
+    resultado que 'RoundRobinScheduler'.
+    En un mismo instante se resuelven primero las llegadas, después los fines de
+    rodaja (por orden de núcleo) y por último se asignan los núcleos libres.
+    """
+    # 'step' avanza con 'advance_to_next_event', que es quien cuenta los pasos
+    INSTRUMENTED_METHODS = (
+        ("step", "step", None),
+        ("advance_to_next_event", "advance", "steps"),
+        ("_settle", "settle", None),
+        ("_dispatch", "dispatch", None),
+        ("flush_events", "flush", None),
+        ("metrics", "metrics", None),
+    )
+
+    def __init__(self, cores: int = 2, quantum: int = 200, queues: str = QUEUES_GLOBAL,
+                 work_stealing: bool = True, migration_cost: int = 0,
+                 switch_cost: Optional[ContextSwitchCost] = None):
+        """
+        Inicializa el planificador.
+        Args:
+            cores (int): Número de CPUs.
+            quantum (int): Quantum del Round Robin.
+            queues (str): QUEUES_GLOBAL o QUEUES_PER_CORE.
+            work_stealing (bool): Con colas por núcleo, permitir que un núcleo sin
+                trabajo robe procesos de la cola más larga.
+            migration_cost (int): Unidades de sobrecarga al reanudar un proceso en otro núcleo.
+            switch_cost (ContextSwitchCost): Coste de cada despacho (por defecto, gratuito).
+        Raises:
+            ValueError: Si algún parámetro no es válido.
+        """
+        if cores <= 0:
+            raise ValueError("El número de núcleos debe ser positivo.")
+        if queues not in (QUEUES_GLOBAL, QUEUES_PER_CORE):
+            raise ValueError(f"Variante de colas desconocida: {queues!r} (usa '{QUEUES_GLOBAL}' o '{QUEUES_PER_CORE}').")
+        if migration_cost < 0:
+            raise ValueError("El coste de migración no puede ser negativo.")
+        super().__init__()
+        self.cores = cores
+        self.quantum = quantum
+        self.queues = queues
+        self.work_stealing = work_stealing
+        self.migration_cost = migration_cost
+        self.switch_cost = switch_cost
+        self._per_core = queues == QUEUES_PER_CORE
+        self._future = ArrivalQueue()  # Procesos que aún no han llegado (compartida por los núcleos)
+        self._procs: Dict[int, Process] = {}  # Procesos conocidos, en orden de alta (para volver a simular)
+        self._table: Optional[ProcessTable] = None  # Tabla de la que vienen todos los procesos (None si hay otros)
+        # Historial de ráfagas de cada núcleo
+        self.histories = [ExecutionHistory() for _ in range(cores)]
+        self._clear_run_state()
+
+    def _clear_run_state(self):
+        """Vacía colas, reloj, contadores e historiales."""
+        n = self.cores
+        self.time = 0  # Reloj del sistema (común a todos los núcleos)
+        self._future.clear()
+        self._queues = [ReadyQueue() for _ in range(n if self._per_core else 1)]
+        self._waiting = 0  # Procesos en las colas de listos
+        self._load = [0] * n  # Carga de cada núcleo: su cola más su proceso en ejecución (colas por núcleo)
+        self.running: List[Optional[Process]] = [None] * n  # Proceso en ejecución de cada núcleo
+        self._dispatched_at = [0] * n  # Instante del último despacho de cada núcleo
+        self._run_start = [0] * n  # Instante en que el proceso empezó a avanzar (tras la migración)
+        self._accounted = [0] * n  # Hasta dónde está descontado el avance en 'remaining'
+        self._end = [0] * n  # Fin de la rodaja en curso de cada núcleo
+        self._ends: List[tuple] = []  # Min-heap (fin de rodaja, núcleo); entradas obsoletas se descartan al sacarlas
+        self._idle = list(range(n))  # Min-heap de núcleos libres (con marcas para no duplicarlos)
+        self._idle_marked = [True] * n
+        self._wake: List[int] = []  # Núcleos que han recibido trabajo en su cola (colas por núcleo)
+        self._last_core: Dict[int, int] = {}  # pid -> último núcleo en que se ejecutó
+        self._last_run: Dict[int, int] = {}  # pid -> instante en que dejó la CPU (penalización de caché)
+        self.finished: List[Process] = []
+        self.context_switches = 0
+        self.migrations = 0
+        self.migration_time = 0
+        self.steals = 0
+        self._busy = [0] * n  # Unidades de ejecución útil por núcleo
+        self._overhead = [0] * n  # Unidades de sobrecarga por núcleo
+        self._state: Dict[int, str] = {}
+        self._settled = False  # El instante actual ya está resuelto (ver '_settle')
+        for history in self.histories:
+            history.clear()
+        if self._event_buffer is not None:
+            self._event_buffer = [] # Descartar eventos pendientes de la simulación anterior
+
+    # --- Estado visible ---
+    @property
+    def future(self) -> ArrivalQueue:
+        """Vista de los procesos que aún no han llegado, iterable en orden de llegada."""
+        return self._future
+
+    @property
+    def ready(self) -> List[Process]:
+        """Procesos listos: la cola global o, con colas por núcleo, las colas una tras otra."""
+        return [p for queue in self._queues for p in queue]
+
+    def ready_of(self, core: int) -> List[Process]:
+        """Cola de listos de un núcleo (con cola global, la cola común)."""
+        return list(self._queues[core if self._per_core else 0])
+
+    @property
+    def current(self) -> Optional[Process]:
+        """Primer proceso en ejecución (por orden de núcleo), o None si todas las CPUs están libres."""
+        return next((p for p in self.running if p is not None), None)
+
+    def state_of(self, pid: int) -> Optional[str]:
+        """Estado del proceso en O(1) (ver 'RoundRobinScheduler.state_of')."""
+        return self._state.get(pid)
+
+    def contains(self, pid: int) -> bool:
+        """Indica en O(1) si el planificador conoce el proceso."""
+        return pid in self._state
+
+    @property
+    def history_ahead(self) -> bool:
+        """Siempre False: los historiales nunca contienen ráfagas posteriores al instante actual."""
+        return False
+
+    def truncate_history_to_present(self):
+        """Sin efecto (ver 'history_ahead')."""
+
+    def set_quantum(self, q: int):
+        """Cambia el quantum; se aplica a partir del siguiente despacho de cada núcleo."""
+        self.quantum = q
+
+    # --- Carga de procesos ---
+    def add_process(self, proc: Process):
+        """Añade un proceso: a la cola de listos si ya ha llegado o a la cola de llegadas si no."""
+        self._procs[proc.pid] = proc
+        self._table = None
+        if proc.arrival <= self.time:
+            self._admit(proc)
+            self._settled = False
+        else:
+            self._future.push(proc)
+            self._state[proc.pid] = STATE_FUTURE
+
+    def load_table(self, table: ProcessTable):
+        """Carga todas las filas de una 'ProcessTable' (como 'RoundRobinScheduler.load_table')."""
+        only_source = not self._procs
+        for row in table.rows():
+            self.add_process(row)
+        if only_source and len(table):
+            self._table = table
+
+    def _admit(self, proc: Process):
+        """Pone en cola un proceso que acaba de llegar."""
+        self._state[proc.pid] = STATE_READY
+        self._waiting += 1
+        if not self._per_core:
+            self._queues[0].append(proc)
+            return
+        # Núcleo menos cargado (el de menor índice en caso de empate)
+        load = self._load
+        core = load.index(min(load))
+        load[core] += 1
+        self._queues[core].append(proc)
+        if self.running[core] is None:
+            self._wake.append(core)
+
+    # --- Notificaciones ---
+    def _notify_tick(self):
+        if self._event_buffer is not None:
+            self._queue_event((EVENT_TICK, self.time))
+            return
+        for o in self.observers:
+            o.on_tick(self.time)
+
+    def _notify_context_switch(self, pid: int, core: int):
+        if self._event_buffer is not None:
+            self._queue_event((EVENT_CONTEXT_SWITCH, pid, self.time, core))
+            return
+        for o in self.observers:
+            o.on_context_switch(pid, self.time)
+
+    def _notify_finished(self, proc: Process):
+        if self._event_buffer is not None:
+            self._queue_event((EVENT_FINISHED, proc, self.time))
+            return
+        for o in self.observers:
+            o.on_process_finished(proc, self.time)
+
+    def _record_burst(self, core: int, pid: int, start: int, duration: int):
+        """Guarda una ráfaga en el historial del núcleo y la notifica."""
+        if duration <= 0:
+            return
+        self.histories[core].append(pid, start, duration)
+        if self._event_buffer is not None:
+            self._queue_event((EVENT_BURST, pid, start, duration, core))
+            return
+        for o in self.observers:
+            o.on_core_burst(core, pid, start, duration)
+
+    def flush_events(self):
+        """Descuenta el avance de los procesos en ejecución y entrega los eventos acumulados."""
+        self.sync_running()
+        super().flush_events()
+
+    def sync_running(self):
+        """
+        Actualiza 'remaining' de los procesos en ejecución hasta el instante actual
+        (el motor solo lo descuenta al terminar cada rodaja). O(núcleos).
+        """
+        time = self.time
+        accounted = self._accounted
+        for core, proc in enumerate(self.running):
+            if proc is not None and time > accounted[core]:
+                proc.remaining -= time - accounted[core]
+                accounted[core] = time
+
+    # --- Núcleos ---
+    def _free(self, core: int):
+        """Marca un núcleo como libre (con colas por núcleo, primero atenderá su propia cola)."""
+        if not self._idle_marked[core]:
+            self._idle_marked[core] = True
+            heapq.heappush(self._idle, core)
+        if self._per_core:
+            self._wake.append(core)
+
+    def _pop_idle(self) -> Optional[int]:
+        """Extrae el núcleo libre de menor índice (None si no hay)."""
+        idle, marked, running = self._idle, self._idle_marked, self.running
+        while idle:
+            core = heapq.heappop(idle)
+            marked[core] = False
+            if running[core] is None:
+                return core
+        return None
+
+    def _dispatch(self, core: int, proc: Process):
+        """Entrega un núcleo a un proceso y programa el fin de su rodaja."""
+        time = self.time
+        self._waiting -= 1
+        last = self._last_core.get(proc.pid)
+        stall = self.migration_cost if last is not None and last != core else 0
+        if stall:
+            self.migrations += 1
+            self.migration_time += stall
+        cost = self.switch_cost
+        if cost is not None:
+            left = self._last_run.pop(proc.pid, None)
+            stall += cost.cost(None if left is None else time - left)
+        self.running[core] = proc
+        self._state[proc.pid] = STATE_RUNNING
+        self.context_switches += 1
+        if proc.start_time is None:
+            proc.start_time = time
+        self._dispatched_at[core] = time
+        start = time + stall
+        self._run_start[core] = start
+        self._accounted[core] = start
+        end = start + min(proc.remaining, self.quantum)
+        self._end[core] = end
+        heapq.heappush(self._ends, (end, core))
+        self._notify_context_switch(proc.pid, core)
+
+    def _end_slice(self, core: int):
+        """Fin de la rodaja de un núcleo: el proceso termina o vuelve a la cola."""
+        proc = self.running[core]
+        time = self.time
+        start = self._run_start[core]
+        stall = start - self._dispatched_at[core]
+        if stall > 0:
+            self._overhead[core] += stall
+            self._record_burst(core, OVERHEAD_PID, self._dispatched_at[core], stall)
+        proc.remaining -= time - self._accounted[core]
+        self._busy[core] += time - start
+        self._record_burst(core, proc.pid, start, time - start)
+        self._last_core[proc.pid] = core
+        self.running[core] = None
+        if proc.remaining == 0:
+            proc.completion_time = time
+            if self._per_core:
+                self._load[core] -= 1
+            self.finished.append(proc)
+            self._state[proc.pid] = STATE_FINISHED
+            self._notify_finished(proc)
+        else:
+            # Round Robin: al final de la cola (la del propio núcleo si hay colas por núcleo)
+            self._state[proc.pid] = STATE_READY
+            self._waiting += 1
+            if self.switch_cost is not None:
+                self._last_run[proc.pid] = time
+            if self._per_core:
+                self._queues[core].append(proc)
+            else:
+                self._queues[0].append(proc)
+        self._free(core)
+
+    def _assign_idle_cores(self):
+        """Entrega los núcleos libres a los procesos en cola."""
+        if not self._per_core:
+            queue = self._queues[0]
+            while self._waiting:
+                core = self._pop_idle()
+                if core is None:
+                    break
+                self._dispatch(core, queue.popleft())
+            return
+        queues, running = self._queues, self.running
+        if self._wake:
+            for core in sorted(set(self._wake)):
+                if running[core] is None and queues[core]:
+                    self._dispatch(core, queues[core].popleft())
+            self._wake.clear()
+        if self.work_stealing:
+            # Los núcleos libres tienen la cola vacía: lo que espera está en colas de núcleos ocupados
+            while self._waiting:
+                core = self._pop_idle()
+                if core is None:
+                    break
+                load = self._load
+                # Cola más larga: la carga de un núcleo con cola es su cola más su proceso
+                victim = load.index(max(load))
+                load[victim] -= 1
+                load[core] += 1
+                self.steals += 1
+                self._dispatch(core, queues[victim].pop())
+
+    def _settle(self):
+        """Resuelve el instante actual: llegadas, fines de rodaja y asignación de núcleos."""
+        self._settled = True
+        for proc in self._future.pop_due(self.time):
+            self._admit(proc)
+        ends, end_of, running = self._ends, self._end, self.running
+        while ends and ends[0][0] <= self.time:
+            end, core = heapq.heappop(ends)
+            if running[core] is not None and end_of[core] == end:
+                self._end_slice(core)
+        self._assign_idle_cores()
+
+    def _next_end(self) -> Optional[int]:
+        """Próximo fin de rodaja (descarta las entradas obsoletas de la cima del heap)."""
+        ends, end_of, running = self._ends, self._end, self.running
+        while ends:
+            end, core = ends[0]
+            if running[core] is not None and end_of[core] == end:
+                return end
+            heapq.heappop(ends)
+        return None
+
+    # --- Motores ---
+    def step(self) -> bool:
+        """
+        Ejecuta un paso de la simulación (una unidad de tiempo en todos los núcleos,
+        o el salto hasta la próxima llegada si todas las CPUs están libres).
+        Returns:
+            bool: True si la simulación puede continuar, False si ha terminado.
+        """
+        return self.advance_to_next_event(until=self.time + 1)
+
+    def advance_to_next_event(self, until: Optional[int] = None) -> bool:
+        """
+        Motor orientado a eventos: salta al siguiente fin de rodaja o llegada en
+        cualquier núcleo. Produce los mismos historiales y métricas que 'step'.
+        Args:
+            until (int): Si se indica, el reloj no avanza más allá de este instante
+                (los saltos con todas las CPUs libres hasta la próxima llegada sí pueden superarlo).
+        Returns:
+            bool: True si la simulación puede continuar, False si ha terminado.
+        """
+        if not self._settled:
+            self._settle()
+        target = self._next_end()
+        if target is None:
+            if not self._future:
+                return False
+            target = self._future.peek().arrival # Todas las CPUs libres: saltar a la próxima llegada
+        else:
+            if self._future:
+                target = min(target, self._future.peek().arrival)
+            if until is not None:
+                target = min(target, max(until, self.time + 1))
+        self.time = target
+        self._notify_tick()
+        self._settle()
+        return True
+
+    def run_until_done(self, mode: str = "event"):
+        """
+        Ejecuta la simulación hasta que no queden procesos.
+        Args:
+            mode (str): "tick" (unidad a unidad) o "event" (de evento en evento);
+                "analytic" equivale a "event" (la forma cerrada es de una sola CPU).
+        Raises:
+            ValueError: Si el modo no es ninguno de los anteriores.
+        """
+        if mode == "tick":
+            advance = self.step
+        elif mode in ("event", "analytic"):
+            advance = self.advance_to_next_event
+        else:
+            raise ValueError(f"Modo de ejecución desconocido: {mode!r}")
+        while advance():
+            pass
+        self.flush_events()
+
+    def is_done(self) -> bool:
+        """True si no quedan procesos pendientes, en cola ni en ejecución."""
+        return not (self._future or self._waiting or any(p is not None for p in self.running))
+
+    # --- Cambios con la simulación en curso ---
+    def _restart(self):
+        """Vuelve a t=0 con todos los procesos pendientes y sin ejecutar."""
+        self._clear_run_state()
+        for proc in self._procs.values():
+            proc.remaining = proc.burst
+            proc.start_time = None
+            proc.completion_time = None
+            self._future.push(proc)
+            self._state[proc.pid] = STATE_FUTURE
+
+    def _replay_to(self, t: int) -> int:
+        """Avanza con el motor por eventos hasta 't' sin notificar a los observadores."""
+        observers, buffer = self.observers, self._event_buffer
+        self.observers, self._event_buffer = [], None
+        try:
+            while self.time < t and self.advance_to_next_event(until=t):
+                pass
+        finally:
+            self.observers = observers
+            self._event_buffer = None if buffer is None else []
+        self.sync_running()
+        return self.time
+
+    def seek(self, t: int) -> int:
+        """
+        Lleva la simulación al instante 't'. Hacia atrás se vuelve a simular desde
+        t=0 (el planificador multinúcleo no guarda instantáneas).
+        Returns:
+            int: El instante alcanzado.
+        """
+        if t < self.time:
+            self._restart()
+        return self._replay_to(t)
+
+    def edit_process(self, pid: int, arrival: int, burst: int) -> int:
+        """
+        Cambia la llegada y la ráfaga de un proceso y vuelve a simular desde t=0 hasta
+        el instante actual, con el mismo resultado que una ejecución completa con el cambio.
+        Returns:
+            int: El instante alcanzado.
+        Raises:
+            ValueError: Si el proceso no existe o la ráfaga no es positiva.
+        """
+        proc = self._procs.get(pid)
+        if proc is None:
+            raise ValueError(f"El proceso P{pid} no está en el planificador.")
+        if burst <= 0:
+            raise ValueError("El Burst Time debe ser mayor a 0.")
+        target = self.time
+        proc.arrival = arrival
+        proc.burst = burst
+        self._restart()
+        return self._replay_to(target)
+
+    def delete_process(self, pid: int) -> int:
+        """
+        Elimina un proceso y vuelve a simular desde t=0 hasta el instante actual.
+        Returns:
+            int: El instante alcanzado.
+        Raises:
+            ValueError: Si el proceso no existe.
+        """
+        if self._procs.pop(pid, None) is None:
+            raise ValueError(f"El proceso P{pid} no está en el planificador.")
+        target = self.time
+        self._restart()
+        return self._replay_to(target)
+
+    def reset(self):
+        """Reinicia el planificador y olvida los procesos (como 'RoundRobinScheduler.reset')."""
+        self._clear_run_state()
+        self._procs = {}
+        self._table = None
+
+    # --- Resultados ---
+    def metrics(self):
+        """
+        Métricas de 'RoundRobinScheduler.metrics' más las propias del modo multinúcleo:
+        número de núcleos, utilización de cada núcleo (ejecución útil / makespan) y
+        su media, migraciones, tiempo total de migración y robos de trabajo, además
+        de la sobrecarga total (migraciones y cambios de contexto) y la eficiencia de la CPU.
+        """
+        finished = self.finished
+        if not finished:
+            return {}
+        columns = finished_columns(self._table, len(finished)) if self._table is not None else None
+        if columns is None:
+            columns = ([p.arrival for p in finished], [p.burst for p in finished],
+                       [NO_VALUE if p.start_time is None else p.start_time for p in finished],
+                       [p.completion_time for p in finished])
+        metrics = compute_metrics(*columns, self.context_switches)
+        span = metrics["makespan"]
+        utilization = [busy / span if span > 0 else 0.0 for busy in self._busy]
+        metrics.update({
+            "cores": self.cores,
+            "core_utilization": utilization,
+            "avg_core_utilization": sum(utilization) / self.cores,
+            "migrations": self.migrations,
+            "migration_time": self.migration_time,
+            "steals": self.steals,
+        })
+        metrics.update(overhead_metrics(sum(self._busy), sum(self._overhead)))
+        return metrics
@@ -0,0 +1,152 @@
+# models/snapshot.py
+"""
+Codificación binaria de las instantáneas (snapshots) del planificador.
+
+Formato: cabecera mágica + versión, seguida de un cuerpo comprimido con zlib que
+contiene una cabecera de enteros (reloj, contadores, cursores) y una serie de
+secciones de enteros int64 little-endian, cada una precedida por su longitud.
+El planificador construye y consume el diccionario de estado; este módulo solo
+lo serializa y escribe los puntos de control en disco de forma atómica.
+"""
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Dict
+
+SNAPSHOT_MAGIC = b"RRSNAP01"
+SNAPSHOT_VERSION = 4
+
+# Campos enteros escalares del estado, en el orden en que se serializan
+# (la versión 1 termina en "history_spilled")
+_SCALAR_FIELDS_V1 = (
+    "time", "quantum", "current_pid", "current_consumed", "context_switches",
+    "burst_start", "burst_pid", "history_count", "history_end",
+    "future_seq", "source_seq", "next_pid", "consumed", "has_source",
+    "keep_finished", "has_history", "history_spilled",
+)
+_SCALAR_FIELDS_V2 = _SCALAR_FIELDS_V1 + ("current_slice", "policy_id")
+# Versión 3: coste de los cambios de contexto (sobrecarga en curso, acumulada y configuración)
+_SCALAR_FIELDS_V3 = _SCALAR_FIELDS_V2 + ("stall", "overhead_time", "switch_latency", "cache_penalty", "cache_window")
+# Versión 4: modelo de E/S, orden de bloqueo y tiempo bloqueado de los terminados no retenidos
+_SCALAR_FIELDS = _SCALAR_FIELDS_V3 + ("io_every", "io_wait", "io_seq", "io_finished")
+# Secciones de enteros: (pid, arrival, burst, remaining, start, completion) por proceso,
+# órdenes de las colas, opcionalmente las columnas del historial, el estado
+# propio de la política de planificación (versión 2), los pares (pid, instante)
+# en que cada proceso dejó la CPU (versión 3), los PIDs con E/S y los
+# procesos bloqueados como (pid, fin de la E/S, orden) (versión 4)
+_ARRAY_FIELDS_V1 = (
+    "procs", "ready", "future", "finished",
+    "history_pid", "history_start", "history_duration",
+)
+_ARRAY_FIELDS_V2 = _ARRAY_FIELDS_V1 + ("policy",)
+_ARRAY_FIELDS_V3 = _ARRAY_FIELDS_V2 + ("last_run",)
+_ARRAY_FIELDS = _ARRAY_FIELDS_V3 + ("io_pids", "blocked")
+_HEADER = struct.Struct("<8sI")
+_SCALARS = struct.Struct("<" + "q" * len(_SCALAR_FIELDS))
+_SCALARS_V3 = struct.Struct("<" + "q" * len(_SCALAR_FIELDS_V3))
+_SCALARS_V2 = struct.Struct("<" + "q" * len(_SCALAR_FIELDS_V2))
+_SCALARS_V1 = struct.Struct("<" + "q" * len(_SCALAR_FIELDS_V1))
+_LENGTH = struct.Struct("<Q")
+# Estado del acumulador de métricas de los terminados no retenidos
+_STATS = struct.Struct("<?qqqqqqdd")
+# Nivel de zlib: el más rápido, ya que las instantáneas se toman durante la simulación
+_COMPRESSION_LEVEL = 1
+
+def _to_bytes(values: array) -> bytes:
+    """Serializa un array de int64 en little-endian."""
+    if sys.byteorder != "little":
+        values = array("q", values)
+        values.byteswap()
+    return values.tobytes()
+
+def _from_bytes(data: bytes) -> array:
+    """Reconstruye un array de int64 serializado con '_to_bytes'."""
+    values = array("q")
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+def encode_snapshot(state: Dict[str, Any]) -> bytes:
+    """
+    Serializa el diccionario de estado del planificador.
+    Args:
+        state (dict): Campos de '_SCALAR_FIELDS' (enteros), de '_ARRAY_FIELDS'
+            ('array' de int64) y 'stats' (tupla de '_STATS' o None).
+    Returns:
+        bytes: El blob comprimido.
+    """
+    parts = [_SCALARS.pack(*(int(state[name]) for name in _SCALAR_FIELDS))]
+    stats = state.get("stats")
+    parts.append(_STATS.pack(*stats) if stats is not None else _STATS.pack(False, 0, 0, 0, 0, 0, 0, 0.0, 0.0))
+    for name in _ARRAY_FIELDS:
+        data = _to_bytes(state.get(name, array("q")))
+        parts.append(_LENGTH.pack(len(data)))
+        parts.append(data)
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION) + zlib.compress(b"".join(parts), _COMPRESSION_LEVEL)
+
+def decode_snapshot(blob: bytes) -> Dict[str, Any]:
+    """
+    Deserializa un blob creado por 'encode_snapshot'. Las instantáneas de la
+    versión 1 no incluyen 'current_slice', 'policy_id' ni 'policy'; el
+    planificador los deduce (Round Robin). Las de las versiones 1 y 2 tampoco
+    incluyen el coste de los cambios de contexto (no tenían sobrecarga), ni las
+    anteriores a la 4 el modelo de E/S (no tenían E/S).
+    Raises:
+        ValueError: Si el blob no es una instantánea válida o su versión no es compatible.
+    """
+    if len(blob) < _HEADER.size:
+        raise ValueError("Instantánea vacía o truncada.")
+    magic, version = _HEADER.unpack_from(blob)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("El blob no es una instantánea del planificador.")
+    if version == SNAPSHOT_VERSION:
+        scalar_fields, scalars, array_fields = _SCALAR_FIELDS, _SCALARS, _ARRAY_FIELDS
+    elif version == 3:
+        scalar_fields, scalars, array_fields = _SCALAR_FIELDS_V3, _SCALARS_V3, _ARRAY_FIELDS_V3
+    elif version == 2:
+        scalar_fields, scalars, array_fields = _SCALAR_FIELDS_V2, _SCALARS_V2, _ARRAY_FIELDS_V2
+    elif version == 1:
+        scalar_fields, scalars, array_fields = _SCALAR_FIELDS_V1, _SCALARS_V1, _ARRAY_FIELDS_V1
+    else:
+        raise ValueError(f"Versión de instantánea no soportada: {version}")
+    try:
+        body = zlib.decompress(blob[_HEADER.size:])
+    except zlib.error as e:
+        raise ValueError(f"Instantánea corrupta: {e}")
+    try:
+        state: Dict[str, Any] = dict(zip(scalar_fields, scalars.unpack_from(body)))
+        offset = scalars.size
+        stats = _STATS.unpack_from(body, offset)
+        state["stats"] = stats if stats[0] else None
+        offset += _STATS.size
+        for name in array_fields:
+            (length,) = _LENGTH.unpack_from(body, offset)
+            offset += _LENGTH.size
+            if length % 8 or offset + length > len(body):
+                raise ValueError(f"Instantánea corrupta: sección {name!r} truncada.")
+            state[name] = _from_bytes(body[offset:offset + length])
+            offset += length
+    except struct.error as e:
+        raise ValueError(f"Instantánea corrupta: {e}")
+    return state
+
+def write_checkpoint(path: str, blob: bytes):
+    """
+    Escribe un punto de control en disco de forma atómica: se escribe un fichero
+    temporal junto al destino y se sustituye con 'os.replace', de modo que una
+    caída durante la escritura conserva el punto de control anterior.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def read_checkpoint(path: str) -> bytes:
+    """Lee un punto de control escrito con 'write_checkpoint'."""
+    with open(path, "rb") as f:
+        return f.read()
@@ -0,0 +1,163 @@
+# models/sweep.py
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from models.io_model import make_io_model
+from models.overhead import make_switch_cost
+from models.policies import make_policy
+from models.scheduler import RoundRobinScheduler
+from models.process_table import ProcessTable
+from models.run_cache import RunCache, admission_order, export_run, import_run, workload_key
+from models.workload import make_workload
+
+# Motor usado por defecto: el más rápido disponible
+DEFAULT_ENGINE = "analytic"
+
+# Carga de trabajo del proceso trabajador (se recibe una sola vez en el inicializador)
+_worker_table: Optional[ProcessTable] = None
+_worker_engine = DEFAULT_ENGINE
+_worker_policy = "rr"
+_worker_switch_cost: Optional[str] = None
+_worker_io: Optional[str] = None
+_worker_export = False  # Devolver también la instantánea final (para la caché del proceso principal)
+
+def _admitted(table: ProcessTable) -> Tuple[List[int], List[int], List[int]]:
+    """Columnas arrival y burst y PIDs de la tabla en orden de admisión (ver 'models.run_cache')."""
+    order = admission_order(table.arrival)
+    arrival, burst, pid = table.arrival, table.burst, table.pid
+    return [arrival[i] for i in order], [burst[i] for i in order], [pid[i] for i in order]
+
+def run_workload(table: ProcessTable, quantum: int, engine: str = DEFAULT_ENGINE,
+                 policy: str = "rr", switch_cost: Optional[str] = None,
+                 cache: Optional[RunCache] = None, io: Optional[str] = None) -> RoundRobinScheduler:
+    """
+    Simula una carga de trabajo completa y devuelve el planificador terminado.
+    Args:
+        table (ProcessTable): Procesos a simular (se reinician antes de empezar).
+        quantum (int): Quantum del Round Robin.
+        engine (str): Motor de ejecución de 'RoundRobinScheduler.run_until_done'.
+        policy (str): Especificación de la política (ver 'models.policies.make_policy').
+        switch_cost (str): Especificación del coste de los cambios de contexto
+            (ver 'models.overhead.make_switch_cost'; por defecto, gratuitos).
+        cache (RunCache): Caché de ejecuciones; si ya contiene esta carga con las mismas
+            opciones, el planificador se devuelve en su estado final sin simular.
+            Por defecto no se usa ninguna.
+        io (str): Especificación del modelo de E/S (ver 'models.io_model.make_io_model';
+            por defecto, sin E/S).
+    """
+    table.reset()
+    scheduler = RoundRobinScheduler(quantum=quantum, policy=make_policy(policy),
+                                    switch_cost=make_switch_cost(switch_cost), io_model=make_io_model(io))
+    scheduler.load_table(table)
+    if cache is None:
+        scheduler.run_until_done(mode=engine)
+        return scheduler
+    arrival, burst, pids = _admitted(table)
+    key = workload_key(arrival, burst, quantum, policy, switch_cost, pids, io)
+    run = cache.get(key)
+    if run is not None:
+        import_run(scheduler, run.snapshot, pids)
+        return scheduler
+    scheduler.run_until_done(mode=engine)
+    cache.put(key, scheduler.metrics(), export_run(scheduler, pids))
+    return scheduler
+
+def _as_table(workload: Union[ProcessTable, str, Iterable[Tuple[int, int]]]) -> ProcessTable:
+    """Acepta una 'ProcessTable', una especificación de carga sintética o pares (arrival, burst)."""
+    if isinstance(workload, ProcessTable):
+        return workload
+    if isinstance(workload, str):
+        return make_workload(workload)
+    return ProcessTable.from_pairs(workload)
+
+def _init_worker(pid: bytes, arrival: bytes, burst: bytes, engine: str, policy: str, switch_cost: Optional[str],
+                 export: bool = False, io: Optional[str] = None):
+    """Reconstruye la tabla compacta, con sus PIDs, en el proceso trabajador (una vez por trabajador)."""
+    global _worker_table, _worker_engine, _worker_policy, _worker_switch_cost, _worker_export, _worker_io
+    columns = []
+    for data in (pid, arrival, burst):
+        column = array("q")
+        column.frombytes(data)
+        columns.append(column)
+    pids, arrivals, bursts = columns
+    _worker_table = ProcessTable.from_columns(arrivals, bursts, pid=pids)
+    _worker_engine = engine
+    _worker_policy = policy
+    _worker_switch_cost = switch_cost
+    _worker_export = export
+    _worker_io = io
+
+def _run_quantum(quantum: int) -> Tuple[Dict[str, Any], Optional[bytes]]:
+    """
+    Tarea del trabajador: simula la carga compartida con un quantum.
+    Returns:
+        tuple: Métricas e instantánea final con PIDs canónicos (None si no se pidió).
+    """
+    table = _worker_table
+    scheduler = run_workload(table, quantum, _worker_engine, _worker_policy, _worker_switch_cost, None, _worker_io)
+    snapshot = export_run(scheduler, _admitted(table)[2]) if _worker_export else None
+    return scheduler.metrics(), snapshot
+
+def sweep_quantum(workload: Union[ProcessTable, str, Iterable[Tuple[int, int]]], quanta: Sequence[int],
+                  workers: Optional[int] = None, engine: str = DEFAULT_ENGINE,
+                  policy: str = "rr", switch_cost: Optional[str] = None,
+                  cache: Optional[RunCache] = None, io: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Ejecuta la misma carga de trabajo con varios quantums en paralelo.
+    La carga se envía a cada trabajador una sola vez, como columnas compactas
+    (bytes de 'array'), y cada tarea solo transporta su quantum. Los quantums
+    que ya están en la caché (o repetidos en 'quanta') no se vuelven a simular.
+    Args:
+        workload: 'ProcessTable', pares (arrival, burst) o la especificación de una carga
+            sintética (ver 'models.workload.parse_spec'), p. ej. 'count=50000,burst=pareto'.
+        quanta: Quantums a evaluar.
+        workers (int): Procesos del pool (por defecto, número de CPUs).
+                       Con 1 se ejecuta en el proceso actual.
+        engine (str): Motor de simulación.
+        policy (str): Especificación de la política; se envía como texto a los trabajadores.
+        switch_cost (str): Especificación del coste de los cambios de contexto (también
+            como texto); con coste, las métricas reflejan la sobrecarga de los quantums pequeños.
+        cache (RunCache): Caché de ejecuciones consultada y actualizada (por defecto, ninguna).
+        io (str): Especificación del modelo de E/S (también como texto; por defecto, sin E/S).
+    Returns:
+        List[dict]: Una fila por quantum, en el orden de 'quanta', con la clave
+                    'quantum' más las claves de 'RoundRobinScheduler.metrics'.
+    """
+    if any(q <= 0 for q in quanta):
+        raise ValueError("Todos los quantums deben ser positivos.")
+    make_policy(policy) # Validar las especificaciones antes de lanzar los trabajadores
+    make_switch_cost(switch_cost)
+    make_io_model(io)
+    table = _as_table(workload)
+    results: Dict[int, Dict[str, Any]] = {}
+    keys: Dict[int, str] = {}
+    if cache is not None:
+        # Los trabajadores reconstruyen la tabla con sus mismos PIDs
+        arrival, burst, pids = _admitted(table)
+        for q in dict.fromkeys(quanta):
+            keys[q] = workload_key(arrival, burst, q, policy, switch_cost, pids, io)
+            run = cache.get(keys[q])
+            if run is not None:
+                results[q] = run.metrics
+    missing = [q for q in dict.fromkeys(quanta) if q not in results]
+    workers = min(workers or os.cpu_count() or 1, max(1, len(missing)))
+    if workers == 1:
+        # Copia de la tabla: la simulación escribe el estado de los procesos en sus columnas
+        local = ProcessTable.from_columns(table.arrival, table.burst, pid=table.pid)
+        pids = _admitted(local)[2]
+        for q in missing:
+            scheduler = run_workload(local, q, engine, policy, switch_cost, None, io)
+            results[q] = scheduler.metrics()
+            if cache is not None:
+                cache.put(keys[q], results[q], export_run(scheduler, pids))
+    elif missing:
+        initargs = (table.pid.tobytes(), table.arrival.tobytes(), table.burst.tobytes(), engine, policy,
+                    switch_cost, cache is not None, io)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+            for q, (metrics, snapshot) in zip(missing, pool.map(_run_quantum, missing)):
+                results[q] = metrics
+                if cache is not None:
+                    cache.put(keys[q], metrics, snapshot)
+    return [{"quantum": q, **results[q]} for q in quanta]
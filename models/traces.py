@@ -0,0 +1,138 @@
+# models/traces.py
+import csv
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Iterable, Iterator, List, Tuple
+
+from models.process_table import ProcessTable
+
+# Conjunto de procesos de ejemplo (arrival, burst) usado por la GUI y la línea de comandos
+SAMPLE_WORKLOAD: List[Tuple[int, int]] = [(100, 200), (300, 500), (600, 200), (800, 600), (1000, 700), (1100, 300)]
+
+# Formato binario de trazas: cabecera mágica + pares (arrival, burst) int64 little-endian
+BINARY_MAGIC = b"RRTRACE1"
+_BINARY_RECORD = struct.Struct("<qq")
+
+def _pairs_from_csv(path: str) -> Iterator[Tuple[int, int]]:
+    """
+    Lee pares (arrival, burst) de un CSV.
+    Acepta una cabecera con columnas 'arrival' y 'burst' (en cualquier posición)
+    o, sin cabecera, las dos primeras columnas de cada fila.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        arrival_col, burst_col = 0, 1
+        for row in reader:
+            if not row or row[0].lstrip().startswith("#"):
+                continue
+            names = [c.strip().lower() for c in row]
+            if "arrival" in names and "burst" in names:
+                arrival_col, burst_col = names.index("arrival"), names.index("burst")
+                continue
+            yield int(row[arrival_col]), int(row[burst_col])
+
+def _pair_from_record(record) -> Tuple[int, int]:
+    """Convierte un registro JSON ([arrival, burst] u objeto con esas claves) en un par."""
+    if isinstance(record, dict):
+        return int(record["arrival"]), int(record["burst"])
+    return int(record[0]), int(record[1])
+
+def _pairs_from_json(path: str) -> Iterator[Tuple[int, int]]:
+    """Lee pares (arrival, burst) de un documento JSON (lista o {"processes": [...]})."""
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data["processes"]
+    for record in data:
+        yield _pair_from_record(record)
+
+def _pairs_from_jsonl(path: str) -> Iterator[Tuple[int, int]]:
+    """Lee pares (arrival, burst) de un fichero JSON Lines (un registro por línea)."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield _pair_from_record(json.loads(line))
+
+def read_workload(path: str) -> ProcessTable:
+    """
+    Carga una carga de trabajo completa en una 'ProcessTable'.
+    El formato se deduce de la extensión: .csv, .json, .jsonl o .rrb.
+    Los PIDs se asignan de forma consecutiva desde 1 en el orden del fichero.
+    Raises:
+        ValueError: Si la extensión no es reconocida.
+    """
+    return ProcessTable.from_pairs(iter_trace(path))
+
+def write_binary_trace(path: str, pairs: Iterable[Tuple[int, int]]) -> int:
+    """
+    Escribe pares (arrival, burst) en el formato binario de trazas (.rrb).
+    Returns:
+        int: Número de registros escritos.
+    """
+    count = 0
+    pack = _BINARY_RECORD.pack
+    with open(path, "wb") as f:
+        f.write(BINARY_MAGIC)
+        for arrival, burst in pairs:
+            f.write(pack(arrival, burst))
+            count += 1
+    return count
+
+def _pairs_from_binary(path: str, skip: int = 0) -> Iterator[Tuple[int, int]]:
+    """
+    Recorre una traza binaria mapeándola en memoria: el sistema operativo
+    carga las páginas a medida que se leen, sin copiar el fichero completo.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= len(BINARY_MAGIC):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+                raise ValueError(f"{path!r} no es una traza binaria válida.")
+            offset = len(BINARY_MAGIC) + skip * _BINARY_RECORD.size
+            view = memoryview(mm)[offset:]
+            try:
+                yield from _BINARY_RECORD.iter_unpack(view)
+            finally:
+                view.release()
+
+def iter_trace(path: str, skip: int = 0) -> Iterator[Tuple[int, int]]:
+    """
+    Lee una traza de forma perezosa, devolviendo pares (arrival, burst) uno a uno.
+    Formatos: .csv y .jsonl (en streaming), .rrb (binario mapeado en memoria)
+    y .json (se carga completo, al ser un único documento).
+    Args:
+        path (str): Ruta de la traza.
+        skip (int): Registros iniciales a omitir (para reanudar una lectura).
+    Raises:
+        ValueError: Si la extensión no es reconocida.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".rrb":
+        return _pairs_from_binary(path, skip)
+    if ext == ".csv":
+        pairs = _pairs_from_csv(path)
+    elif ext == ".jsonl":
+        pairs = _pairs_from_jsonl(path)
+    elif ext == ".json":
+        pairs = _pairs_from_json(path)
+    else:
+        raise ValueError(f"Formato de traza no soportado: {ext or path!r}")
+    return itertools.islice(pairs, skip, None)
+
+def main(argv=None) -> int:
+    """Convierte una traza .csv/.json/.jsonl al formato binario: python -m models.traces ENTRADA SALIDA.rrb"""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
+        print("Uso: python -m models.traces ENTRADA SALIDA.rrb", file=sys.stderr)
+        return 2
+    count = write_binary_trace(args[1], iter_trace(args[0]))
+    print(f"{count} registros escritos en {args[1]}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
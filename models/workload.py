@@ -0,0 +1,253 @@
+# models/workload.py
+"""
+Generador de cargas de trabajo sintéticas (vectorizado con NumPy).
+
+Produce directamente las columnas (arrival, burst) de entrada del planificador,
+ordenadas por arrival y con un generador aleatorio con semilla (resultados
+reproducibles). Llegadas:
+  - 'poisson': tiempos entre llegadas exponenciales (tasa constante).
+  - 'bursty': ráfagas de llegadas muy próximas separadas por pausas largas
+    (tamaño medio de ráfaga 'cluster' e intensidad 'intensity' dentro de ella).
+  - 'diurnal': Poisson no homogéneo con tasa sinusoidal (periodo 'period' y
+    amplitud relativa 'amplitude'), generado por aclarado (thinning).
+Ráfagas de CPU ('mean' es la media en todas): 'exponential', 'lognormal'
+(dispersión 'sigma'), 'pareto' (cola pesada de índice 'alpha' > 1) y 'bimodal'
+(una fracción 'long_fraction' de procesos largos; los cortos duran 'short_ratio'
+veces la media).
+La tasa de llegadas se deduce de la carga objetivo de una CPU ('load' = tasa x
+media de ráfaga), salvo que se indique 'rate'.
+
+Uso (desde la raíz del repositorio):
+    python -m models.workload 1000000 carga.rrb --arrival bursty --burst pareto --seed 7
+"""
+import argparse
+import math
+import sys
+from array import array
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from models.process_table import ProcessTable
+from models.traces import BINARY_MAGIC
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional para el resto del simulador
+    np = None
+
+ARRIVAL_PATTERNS = ("poisson", "bursty", "diurnal")
+BURST_DISTRIBUTIONS = ("exponential", "lognormal", "pareto", "bimodal")
+
+# Parámetros por defecto de 'generate' (también las claves válidas de una especificación textual)
+DEFAULTS: Dict[str, Any] = {
+    "count": 1000,
+    "seed": 1,
+    "arrival": "poisson",
+    "burst": "exponential",
+    "mean": 200.0,
+    "load": 0.8,
+    "rate": None,
+    "cluster": 20.0,
+    "intensity": 10.0,
+    "period": None,
+    "amplitude": 0.8,
+    "sigma": 1.0,
+    "alpha": 2.5,
+    "long_fraction": 0.2,
+    "short_ratio": 0.25,
+}
+
+# Procesos por bloque al convertir las columnas en pares de Python (ver 'iter_pairs')
+_PAIR_CHUNK = 1 << 16
+
+def _require_numpy():
+    """Falla con un mensaje claro si NumPy no está disponible."""
+    if np is None:
+        raise RuntimeError("El generador de cargas de trabajo requiere NumPy (pip install numpy).")
+
+def _arrival_times(rng, count: int, pattern: str, rate: float, options: Dict[str, Any]):
+    """Instantes de llegada (float, ordenados) con la tasa media 'rate'."""
+    if pattern == "poisson":
+        return np.cumsum(rng.exponential(1.0 / rate, count))
+    if pattern == "bursty":
+        cluster = float(options["cluster"])
+        intensity = float(options["intensity"])
+        if cluster < 1 or intensity < 1:
+            raise ValueError("'cluster' e 'intensity' deben ser al menos 1.")
+        # Dentro de una ráfaga las llegadas son 'intensity' veces más frecuentes; la pausa
+        # entre ráfagas compensa para que la tasa media siga siendo 'rate'
+        inner = 1.0 / (rate * intensity)
+        pause = cluster / rate - (cluster - 1) * inner
+        gaps = rng.exponential(inner, count)
+        starts = rng.random(count) < 1.0 / cluster # Tamaños de ráfaga geométricos de media 'cluster'
+        gaps[starts] = rng.exponential(pause, int(starts.sum()))
+        return np.cumsum(gaps)
+    if pattern == "diurnal":
+        amplitude = float(options["amplitude"])
+        if not 0 <= amplitude <= 1:
+            raise ValueError("'amplitude' debe estar entre 0 y 1.")
+        period = options["period"]
+        period = float(period) if period is not None else max(count / rate / 4, 1.0) # Cuatro ciclos por defecto
+        peak = rate * (1 + amplitude)
+        times = np.empty(0)
+        offset = 0.0
+        while len(times) < count:
+            # Candidatos con la tasa máxima; se aceptan con probabilidad tasa(t) / tasa máxima
+            need = count - len(times)
+            candidates = offset + np.cumsum(rng.exponential(1.0 / peak, int(need * (1 + amplitude) * 1.1) + 16))
+            offset = candidates[-1]
+            accept = rng.random(len(candidates)) * (1 + amplitude) < 1 + amplitude * np.sin(2 * math.pi * candidates / period)
+            times = np.concatenate((times, candidates[accept][:need]))
+        return times
+    raise ValueError(f"Patrón de llegadas desconocido: {pattern!r} (disponibles: {', '.join(ARRIVAL_PATTERNS)})")
+
+def _burst_times(rng, count: int, distribution: str, mean: float, options: Dict[str, Any]):
+    """Ráfagas de CPU (float) con media 'mean'."""
+    if distribution == "exponential":
+        return rng.exponential(mean, count)
+    if distribution == "lognormal":
+        sigma = float(options["sigma"])
+        return rng.lognormal(math.log(mean) - sigma * sigma / 2, sigma, count)
+    if distribution == "pareto":
+        alpha = float(options["alpha"])
+        if alpha <= 1:
+            raise ValueError("'alpha' debe ser mayor que 1 (media finita).")
+        scale = mean * (alpha - 1) / alpha # Mínimo de la Pareto con esa media
+        return (rng.pareto(alpha, count) + 1) * scale
+    if distribution == "bimodal":
+        fraction = float(options["long_fraction"])
+        ratio = float(options["short_ratio"])
+        if not 0 < fraction < 1 or not 0 < ratio < 1:
+            raise ValueError("'long_fraction' y 'short_ratio' deben estar entre 0 y 1.")
+        short = mean * ratio
+        long = (mean - (1 - fraction) * short) / fraction
+        modes = np.where(rng.random(count) < fraction, long, short)
+        return rng.gamma(4.0, modes / 4.0) # Dos modos bien separados alrededor de cada media
+    raise ValueError(f"Distribución de ráfagas desconocida: {distribution!r} (disponibles: {', '.join(BURST_DISTRIBUTIONS)})")
+
+def generate(count: int = DEFAULTS["count"], seed: Optional[int] = DEFAULTS["seed"], **options) -> Tuple[Any, Any]:
+    """
+    Genera una carga de trabajo sintética.
+    Args:
+        count (int): Número de procesos.
+        seed (int): Semilla del generador (None = no reproducible).
+        **options: Resto de claves de 'DEFAULTS' (arrival, burst, mean, load, rate...).
+    Returns:
+        Tuple[ndarray, ndarray]: Columnas int64 (arrival, burst), ordenadas por arrival
+        empezando en t=0, con ráfagas de al menos una unidad.
+    Raises:
+        ValueError: Si alguna opción no es válida.
+        RuntimeError: Si NumPy no está instalado.
+    """
+    _require_numpy()
+    unknown = set(options) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Opciones de carga desconocidas: {', '.join(sorted(unknown))}")
+    options = {**DEFAULTS, **options}
+    count = int(count)
+    mean = float(options["mean"])
+    if count < 0:
+        raise ValueError("El número de procesos no puede ser negativo.")
+    if mean < 1:
+        raise ValueError("La ráfaga media debe ser al menos 1.")
+    rate = options["rate"]
+    rate = float(rate) if rate is not None else float(options["load"]) / mean
+    if rate <= 0:
+        raise ValueError("La tasa de llegadas (o la carga) debe ser positiva.")
+    rng = np.random.default_rng(seed)
+    if count == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    arrivals = _arrival_times(rng, count, str(options["arrival"]).lower(), rate, options)
+    bursts = _burst_times(rng, count, str(options["burst"]).lower(), mean, options)
+    arrivals -= arrivals[0] # La primera llegada en t=0
+    # Tiempo discreto: llegadas truncadas (siguen ordenadas) y ráfagas de al menos una unidad
+    return arrivals.astype(np.int64), np.maximum(np.rint(bursts), 1).astype(np.int64)
+
+def generate_table(count: int = DEFAULTS["count"], seed: Optional[int] = DEFAULTS["seed"], **options) -> ProcessTable:
+    """Genera una carga (ver 'generate') directamente como 'ProcessTable' (PIDs desde 1)."""
+    arrivals, bursts = generate(count, seed, **options)
+    pids = _to_array(np.arange(1, len(arrivals) + 1, dtype=np.int64))
+    return ProcessTable.from_columns(_to_array(arrivals), _to_array(bursts), pid=pids)
+
+def _to_array(values) -> array:
+    """Copia una columna int64 de NumPy en un 'array' sin pasar por objetos de Python."""
+    column = array("q")
+    column.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+    return column
+
+def iter_pairs(arrivals, bursts) -> Iterator[Tuple[int, int]]:
+    """
+    Recorre las columnas como pares (arrival, burst) de enteros de Python, por bloques.
+    Sirve de fuente perezosa para 'RoundRobinScheduler.attach_arrival_stream': la
+    carga queda conectada al instante y cada proceso se crea cuando llega.
+    """
+    for i in range(0, len(arrivals), _PAIR_CHUNK):
+        yield from zip(arrivals[i:i + _PAIR_CHUNK].tolist(), bursts[i:i + _PAIR_CHUNK].tolist())
+
+def parse_spec(spec: str) -> Dict[str, Any]:
+    """
+    Convierte una especificación textual 'clave=valor,...' en opciones de 'generate',
+    p. ej. 'count=100000,arrival=bursty,burst=pareto,alpha=1.8,seed=7'. Al ser texto,
+    se puede pasar en la línea de comandos o a los trabajadores de un barrido.
+    Raises:
+        ValueError: Si alguna clave o valor no es válido.
+    """
+    options: Dict[str, Any] = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        key, value = key.strip().lower(), value.strip()
+        if not sep:
+            raise ValueError(f"Opción de carga inválida: {item!r} (se esperaba clave=valor)")
+        if key not in DEFAULTS:
+            raise ValueError(f"Opción de carga desconocida: {key!r} (disponibles: {', '.join(DEFAULTS)})")
+        if key in ("arrival", "burst"):
+            options[key] = value.lower()
+            continue
+        try:
+            number = float(value)
+        except ValueError:
+            raise ValueError(f"Valor inválido para la opción {key!r}: {value!r}")
+        options[key] = int(number) if key in ("count", "seed") else number
+    return options
+
+def make_workload(spec: str) -> ProcessTable:
+    """Genera la 'ProcessTable' descrita por una especificación textual (ver 'parse_spec')."""
+    return generate_table(**parse_spec(spec))
+
+def main(argv=None) -> int:
+    """Genera una carga y la escribe como traza (.rrb binario o .csv)."""
+    parser = argparse.ArgumentParser(prog="python -m models.workload",
+                                     description="Generador de cargas de trabajo sintéticas.")
+    parser.add_argument("count", type=int, help="Número de procesos.")
+    parser.add_argument("output", help="Fichero de salida (.rrb o .csv).")
+    parser.add_argument("--seed", type=int, default=DEFAULTS["seed"], help="Semilla del generador.")
+    parser.add_argument("--arrival", choices=ARRIVAL_PATTERNS, default=DEFAULTS["arrival"], help="Patrón de llegadas.")
+    parser.add_argument("--burst", choices=BURST_DISTRIBUTIONS, default=DEFAULTS["burst"], help="Distribución de las ráfagas.")
+    parser.add_argument("--mean", type=float, default=DEFAULTS["mean"], help="Ráfaga media.")
+    parser.add_argument("--load", type=float, default=DEFAULTS["load"], help="Carga objetivo de una CPU (tasa x ráfaga media).")
+    parser.add_argument("--options", default="", metavar="CLAVE=VALOR,...",
+                        help="Otras opciones de la distribución, p. ej. 'alpha=1.8' o 'cluster=50,intensity=20'.")
+    args = parser.parse_args(argv)
+    try:
+        options = parse_spec(args.options)
+        options.update(arrival=args.arrival, burst=args.burst, mean=args.mean, load=args.load)
+        arrivals, bursts = generate(args.count, args.seed, **options)
+    except (ValueError, RuntimeError) as e:
+        parser.error(str(e))
+    if args.output.lower().endswith(".rrb"):
+        records = np.empty((len(arrivals), 2), dtype="<i8")
+        records[:, 0] = arrivals
+        records[:, 1] = bursts
+        with open(args.output, "wb") as f:
+            f.write(BINARY_MAGIC)
+            f.write(records.tobytes())
+    else:
+        with open(args.output, "w") as f:
+            f.write("arrival,burst\n")
+            np.savetxt(f, np.column_stack((arrivals, bursts)), fmt="%d", delimiter=",")
+    print(f"{len(arrivals)} procesos escritos en {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,16 @@
 # presenters/rr_presenter.py
+import time
 import tkinter as tk
-from typing import Optional, List, Dict, Any, Tuple
-from models.scheduler import RoundRobinScheduler, Process, SchedulerObserver
+from typing import Optional, List, Dict, Any, Tuple, Union
+from models.scheduler import (RoundRobinScheduler, Process, SchedulerObserver,
+                              EVENT_TICK, EVENT_CONTEXT_SWITCH, EVENT_FINISHED)
+from models.process_table import ProcessRow
+from models.policies import RoundRobinPolicy
+from models.run_cache import RunCache, export_run, import_run, pending_workload, scheduler_key
+from models.smp import SMPScheduler, QUEUES_GLOBAL, QUEUES_PER_CORE
+from models.traces import SAMPLE_WORKLOAD
+from models.workload import generate_table
+from models.instrumentation import Instrumentation, ProfileCapture, format_stats
 from views.tkinter_view import RRViewInterface
 
 class RRPresenter(SchedulerObserver):
@@ -9,31 +18,97 @@ class RRPresenter(SchedulerObserver):
     Presentador que coordina la lógica de la aplicación.
     Se suscribe al modelo (RoundRobinScheduler) y actualiza la vista (RRViewInterface).
     """
-    def __init__(self, model: RoundRobinScheduler, view: RRViewInterface):
-        self.model = model
+    # Máximo de eventos del modelo acumulados antes de actualizar la UI
+    EVENT_BATCH_SIZE = 4096
+    # Ritmo de la simulación automática: cuadros por segundo de la UI y fracción
+    # de cada cuadro dedicada a avanzar el modelo (el resto queda para Tk)
+    TARGET_FPS = 30
+    FRAME_BUDGET_FRACTION = 0.6
+    # Segundos de retraso que se pueden recuperar como máximo (evita ráfagas tras una pausa larga)
+    MAX_CATCHUP_S = 0.25
+    # Intervalo de actualización de la velocidad medida
+    SPEED_REPORT_INTERVAL_S = 0.5
+    # Instrumentación (desactivada por defecto): refresco del panel y fichero del perfil de cProfile
+    STATS_REFRESH_MS = 500
+    PROFILE_PATH = "rr_profile.pstats"
+    # Ejecuciones completas recordadas (Reset + Start con la misma carga y quantum no vuelve a simular)
+    RUN_CACHE_ENTRIES = 16
+    # Métodos del presentador y de la vista medidos con la instrumentación activa: (método, fase)
+    INSTRUMENTED_METHODS = (
+        ("_schedule_tick", "frame"),
+        ("_update_queues", "queues"),
+        ("_redraw_gantt", "gantt"),
+    )
+    INSTRUMENTED_VIEW_METHODS = (
+        ("refresh_process_table", "table"),
+        ("update_queues_display", "queues"),
+        ("draw_static_gantt", "gantt"),
+        ("draw_execution_burst", "gantt"),
+        ("redraw_gantt_bursts", "gantt"),
+        ("update_gantt_time_line", "gantt"),
+        ("log_message", "log"),
+    )
+
+    def __init__(self, model: Union[RoundRobinScheduler, SMPScheduler], view: RRViewInterface):
         self.view = view
-        self.model.subscribe(self) # Suscribirse a eventos del modelo
 
         # Estado de la aplicación
         self.running = False
-        self.tick_delay_ms = 350  # Retraso entre pasos en modo automático
+        self.target_speed = self.view.get_ticks_per_second()  # Unidades simuladas por segundo (modo automático)
+        # Estado del bucle por cuadros
+        self._last_frame_time = 0.0
+        self._sim_credit = 0.0  # Unidades de tiempo simulado pendientes de ejecutar
+        self._speed_window_start = 0.0
+        self._speed_window_units = 0
         self.after_id = None # Para cancelar after en Tkinter
-        self.processes: Dict[int, Process] = {} # Diccionario {pid: Process}
+        self.processes: Dict[int, Union[Process, ProcessRow]] = {} # Diccionario {pid: Process o fila de ProcessTable}
         self.next_pid = 1  # Siguiente PID disponible
+        self.instrumentation: Optional[Instrumentation] = None  # Medidas de la UI (ver 'handle_toggle_instrumentation')
+        self._stats_after_id = None
+        self.profile = ProfileCapture()
+        self.run_cache = RunCache(max_entries=self.RUN_CACHE_ENTRIES)
+        self._run_key: Optional[Tuple[str, List[int]]] = None  # Clave de caché y PIDs de la ejecución en curso
+        self.model = None
 
         # Inicializar la vista con el estado
+        self._install_model(model)
+        self.horizon = 0  # Instante más avanzado simulado (límite de la línea de tiempo)
         self.view.set_initial_state(True)
         self.view.set_running_state(False)
         # self.view.refresh_process_table(self.processes, self.model) # Inicialmente vacío
 
+    def _install_model(self, model: Union[RoundRobinScheduler, SMPScheduler]):
+        """Conecta un planificador (de una CPU o multinúcleo) al presentador y al Gantt."""
+        if self.model is not None and self.model.instrumentation is not None:
+            self.model.enable_instrumentation(False) # Restaura también los métodos de observador medidos
+        self.model = model
+        self.model.subscribe(self) # Suscribirse a eventos del modelo
+        if self.instrumentation is not None:
+            self.model.enable_instrumentation()
+        # Recibir los eventos agrupados: un único 'on_events' por lote de pasos
+        self.model.set_event_batching(max_events=self.EVENT_BATCH_SIZE)
+        self.view.set_gantt_history(self._gantt_lanes())
+        # Activar la pirámide de ocupación desde el principio: se mantiene de forma
+        # incremental y el Gantt con poco zoom no tiene que construirla de golpe.
+        for history in (model.histories if isinstance(model, SMPScheduler) else [model.history]):
+            history.pyramid()
+        if isinstance(model, RoundRobinScheduler):
+            # Instantáneas periódicas para poder saltar a cualquier instante con la línea de tiempo
+            # (el planificador multinúcleo vuelve a simular desde t=0)
+            self.model.enable_checkpoints()
+
+    def _gantt_lanes(self):
+        """Historial que dibuja el Gantt: uno por núcleo en el planificador multinúcleo."""
+        return self.model.histories if isinstance(self.model, SMPScheduler) else self.model.history
+
     # --- Métodos para manejar eventos de la Vista ---
     def handle_set_speed(self):
         try:
             ticks_per_second = self.view.get_ticks_per_second()
             if ticks_per_second <= 0:
                 raise ValueError("Ticks por segundo debe ser positivo.")
-            self.tick_delay_ms = int(1000 / ticks_per_second)
-            self.view.log_message(f"Velocidad establecida a {ticks_per_second} ticks/segundo (Retraso: {self.tick_delay_ms} ms/tick).")
+            self.target_speed = ticks_per_second
+            self.view.log_message(f"Velocidad objetivo establecida a {ticks_per_second} unidades/segundo.")
         except (tk.TclError, ValueError) as e:
             self.view.show_message("Error", f"Valor inválido para Ticks/Segundo: {e}", "error")
             # Revertir valor en la vista si es necesario
@@ -51,7 +126,7 @@ class RRPresenter(SchedulerObserver):
             # Redibujar Gantt
             self.view.clear_gantt()
             self.view.draw_static_gantt(self.model.time, new_scale)
-            self.view.redraw_gantt_bursts(self.model.history, new_scale)
+            self.view.redraw_gantt_bursts(self._gantt_lanes(), new_scale)
             # Re-dibujar la línea de tiempo actual si no es el estado inicial
             if not self.view.initial_state and self.model.time > 0:
                 self.view.update_gantt_time_line(self.model.time, new_scale)
@@ -70,6 +145,8 @@ class RRPresenter(SchedulerObserver):
             p = Process(pid=pid, arrival=arrival, burst=burst)
             self.processes[pid] = p
             self.model.add_process(p)
+            self._run_key = None # La ejecución en curso ya no corresponde a la carga
+            self._sync_timeline()
             self.view.log_message(f"Proceso P{pid} añadido (Arrival={arrival}, Burst={burst})")
             self.view.refresh_process_table(self.processes, self.model)
             # Habilitar botones si es el primer proceso
@@ -82,9 +159,6 @@ class RRPresenter(SchedulerObserver):
         proc = self.processes.get(pid)
         if proc is None:
             return
-        if proc.start_time is not None:
-            self.view.show_message("Editar Proceso", "No se puede editar un proceso que ya ha iniciado.", "warning")
-            return
         if self.running:
              self.view.show_message("Editar Proceso", "Pausa la simulación para editar procesos.", "warning")
              return
@@ -94,16 +168,15 @@ class RRPresenter(SchedulerObserver):
             return
         new_arr, new_burst = new_values
 
-        # Actualizar proceso
-        proc.arrival = new_arr
-        proc.burst = new_burst
-        proc.remaining = proc.burst # Reiniciar tiempo restante
-        # Eliminar del planificador y volver a añadir
-        self._remove_proc_from_scheduler(proc.pid)
-        self.model.add_process(proc)
+        # Repetir la simulación solo desde la última instantánea anterior a la llegada afectada
+        started = time.perf_counter()
+        try:
+            self.model.edit_process(pid, new_arr, new_burst)
+        except ValueError as e:
+            self.view.show_message("Editar Proceso", str(e), "error")
+            return
         self.view.log_message(f"Proceso P{pid} editado: Arrival={proc.arrival}, Burst={proc.burst}")
-        self.view.refresh_process_table(self.processes, self.model)
-        self.handle_reset() # Reiniciar simulación para reflejar cambios
+        self._after_workload_change(started)
 
     def handle_delete_process(self, pid: int):
         proc = self.processes.get(pid)
@@ -118,16 +191,43 @@ class RRPresenter(SchedulerObserver):
         confirm = self.view.confirm_action("Confirmar Eliminación", f"¿Estás seguro de que quieres eliminar el proceso P{pid}?")
         if not confirm: return
 
-        # Eliminar del planificador y del diccionario
-        self._remove_proc_from_scheduler(pid)
+        # Eliminar del planificador (repitiendo solo lo afectado) y del diccionario
+        started = time.perf_counter()
+        self.model.delete_process(pid)
         del self.processes[pid]
         self.view.log_message(f"Proceso P{pid} eliminado.")
-        self.view.refresh_process_table(self.processes, self.model)
-        self.handle_reset() # Reiniciar simulación
+        self._after_workload_change(started)
+
+    def handle_set_cores(self):
+        """Cambia el número de CPUs (o el tipo de colas) sustituyendo el planificador."""
+        try:
+            cores = self.view.get_cores()
+            if cores <= 0:
+                raise ValueError("El número de CPUs debe ser positivo.")
+        except (tk.TclError, ValueError) as e:
+            self.view.show_message("Error", f"Valor inválido para CPUs: {e}", "error")
+            return
+        per_core = self.view.get_per_core_queues()
+        smp = isinstance(self.model, SMPScheduler)
+        if (cores == 1 and not smp) or (smp and cores == self.model.cores and self.model.queues == (QUEUES_PER_CORE if per_core else QUEUES_GLOBAL)):
+            return
+        if self.running: self.handle_pause()
+        quantum = self.view.get_quantum()
+        if cores > 1:
+            queues = QUEUES_PER_CORE if per_core else QUEUES_GLOBAL
+            self._install_model(SMPScheduler(cores=cores, quantum=quantum, queues=queues))
+            description = f"{cores} CPUs ({'colas por núcleo' if per_core else 'cola global'})"
+        else:
+            self._install_model(RoundRobinScheduler(quantum=quantum))
+            description = "1 CPU"
+        self._run_key = None
+        self.handle_reset()
+        self.view.log_message(f"Planificador cambiado a {description}.")
 
     def handle_set_quantum(self):
         q = self.view.get_quantum()
-        self.model.set_quantum(q)
+        self._apply_quantum(q)
+        self._sync_timeline()
         self.view.log_message(f"Quantum establecido a {q}.")
 
     def handle_load_sample(self):
@@ -138,9 +238,8 @@ class RRPresenter(SchedulerObserver):
                 "warning"
             )
             return
-        sample = [(100, 200), (300, 500), (600, 200), (800, 600), (1000, 700), (1100, 300)]
         self.next_pid = 1
-        for arr, b in sample:
+        for arr, b in SAMPLE_WORKLOAD:
             pid = self.next_pid
             self.next_pid += 1
             p = Process(pid=pid, arrival=arr, burst=b)
@@ -150,17 +249,112 @@ class RRPresenter(SchedulerObserver):
         self.view.log_message("Procesos de ejemplo cargados.")
         self.view.set_running_state(self.running) # Actualiza estado de botones
 
+    def handle_generate_workload(self):
+        """Genera una carga sintética (ver 'models.workload') y la carga en bloque en el modelo."""
+        if self.processes or self.running:
+            self.view.show_message(
+                "Acción no permitida",
+                "Para generar una carga de trabajo, primero debes usar 'Clear All' para limpiar el estado actual.",
+                "warning"
+            )
+            return
+        options = self.view.get_generate_options()
+        if options is None: # Cancelado
+            return
+        try:
+            table = generate_table(**options)
+        except (ValueError, RuntimeError) as e:
+            self.view.show_message("Error", f"No se pudo generar la carga de trabajo: {e}", "error")
+            return
+        # Las filas de la tabla hacen de procesos: el modelo escribe su estado en las columnas
+        self.processes = dict(zip(table.pid, table.rows()))
+        self.next_pid = len(table) + 1
+        self.model.load_table(table)
+        self.view.refresh_process_table(self.processes, self.model)
+        self.view.log_message(f"Carga sintética generada: {len(table)} procesos "
+                              f"(llegadas {options['arrival']}, ráfagas {options['burst']}, semilla {options['seed']}).")
+        self.view.set_running_state(self.running)
+
+    def handle_toggle_instrumentation(self, enabled: bool):
+        """
+        Activa o desactiva los temporizadores y contadores del modelo, del presentador
+        y de la vista (ver models/instrumentation.py) y el panel que los muestra.
+        Desactivada no añade ningún coste.
+        """
+        if enabled == (self.instrumentation is not None):
+            return
+        if enabled:
+            instrumentation = Instrumentation()
+            for name, phase in self.INSTRUMENTED_METHODS:
+                instrumentation.wrap(self, name, phase)
+            for name, phase in self.INSTRUMENTED_VIEW_METHODS:
+                instrumentation.wrap(self.view, name, phase)
+            self.view.instrument(instrumentation) # Llamadas a Tk: elementos del canvas y filas de la tabla
+            self.instrumentation = instrumentation
+            self.model.enable_instrumentation()
+            self.view.log_message("Instrumentación activada.")
+            self._refresh_stats()
+        else:
+            self.instrumentation.uninstall()
+            self.instrumentation = None
+            self.model.enable_instrumentation(False)
+            if self._stats_after_id and hasattr(self.view, 'after_cancel'):
+                self.view.after_cancel(self._stats_after_id)
+            self._stats_after_id = None
+            self.view.show_stats(None)
+            self.view.log_message("Instrumentación desactivada.")
+
+    def handle_toggle_profile(self, enabled: bool):
+        """Inicia o detiene la captura con cProfile; al detenerla guarda el perfil y resume lo más costoso."""
+        if enabled == self.profile.active:
+            return
+        if enabled:
+            self.profile.start()
+            self.view.log_message("Perfilado con cProfile iniciado.")
+            return
+        try:
+            summary = self.profile.stop(path=self.PROFILE_PATH, limit=10)
+        except OSError as e:
+            self.view.show_message("Error", f"No se pudo guardar el perfil: {e}", "error")
+            return
+        self.view.log_message(f"Perfil guardado en {self.PROFILE_PATH} (python -m pstats {self.PROFILE_PATH}).")
+        self.view.log_message(summary)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Estadísticas de ejecución: las del modelo ('stats' del planificador) y, con la
+        instrumentación activa, las del presentador y la vista.
+        """
+        return {
+            "model": self.model.stats(),
+            "ui": self.instrumentation.stats() if self.instrumentation is not None else None,
+            "profiling": self.profile.active,
+        }
+
+    def _refresh_stats(self):
+        """Actualiza periódicamente el panel de estadísticas mientras la instrumentación esté activa."""
+        if self.instrumentation is None:
+            return
+        stats = self.stats()
+        self.view.show_stats(format_stats(stats["model"], "Modelo") + "\n\n" + format_stats(stats["ui"], "Interfaz"))
+        if hasattr(self.view, 'after'):
+            self._stats_after_id = self.view.after(self.STATS_REFRESH_MS, self._refresh_stats)
+
     def handle_start(self):
         if self.running: return
         if not self.processes:
             self.view.show_message("Sin Procesos", "Agrega procesos antes de iniciar la simulación.", "warning")
             return
         self._ensure_scheduler_has_procs()
-        self.model.set_quantum(self.view.get_quantum())
+        self._apply_quantum(self.view.get_quantum())
+        if self._start_from_cache():
+            return
+        self._continue_from_present()
         self.running = True
         self.view.set_running_state(True)
         self.view.set_initial_state(False)
         self.view.log_message("Simulación iniciada.")
+        self._start_frame_loop()
         self._schedule_tick() # Iniciar bucle de simulación
 
     def handle_pause(self):
@@ -187,7 +381,9 @@ class RRPresenter(SchedulerObserver):
             self.view.show_message("Fin de Simulación", "No hay más procesos para ejecutar.", "info")
             return
         self._ensure_scheduler_has_procs()
-        self.model.set_quantum(self.view.get_quantum())
+        self._apply_quantum(self.view.get_quantum())
+        self._run_key = self._identify_run() or self._run_key
+        self._continue_from_present()
         steps_to_execute = self.view.get_ticks_per_second()
         steps_executed = 0
         active = True
@@ -195,23 +391,45 @@ class RRPresenter(SchedulerObserver):
         while steps_executed < steps_to_execute and active:
             active = self.model.step()
             steps_executed += 1
+        self.model.flush_events() # Entregar a la UI los eventos del lote
         # Actualizar vistas (ya se hará por notificaciones Observer, pero podemos forzarlo)
         self._update_views()
         # self.view.update_queues_display(self.model.time, self.model.current.pid if self.model.current else None, [p.pid for p in self.model.ready])
         if not active:
             self.view.log_message("Simulación finalizada.")
             self._show_metrics()
+            self._cache_finished_run()
             self.view.set_running_state(False) # Deshabilitar botones
             self.view.set_initial_state(True)
             # self.view.clear_gantt_time_line() # O borrar "tline" directamente
             self.view.clear_gantt() # Limpiar todo el Gantt?
             self.view.draw_static_gantt(self.model.time, self.view.canvas_time_scale) # Redibujar estático
-            self.view.redraw_gantt_bursts(self.model.history, self.view.canvas_time_scale) # Redibujar ráfagas
+            self.view.redraw_gantt_bursts(self._gantt_lanes(), self.view.canvas_time_scale) # Redibujar ráfagas
+
+    def handle_seek(self):
+        """Salta al instante elegido en la línea de tiempo (hacia atrás o hacia delante)."""
+        if self.running:
+            self.handle_pause()
+        target = self.view.get_seek_time()
+        try:
+            reached = self.model.seek(target)
+        except ValueError as e:
+            self.view.show_message("Línea de Tiempo", str(e), "warning")
+            return
+        self.horizon = max(self.horizon, reached)
+        self.view.set_timeline(reached, self.horizon)
+        self._redraw_gantt()
+        self._update_views()
+        self.view.update_metrics_display(self.model.metrics() if self.model.is_done() else {})
+        self.view.set_initial_state(self.model.is_done())
+        self.view.log_message(f"Salto a t={reached}." if reached == target else
+                              f"Salto a t={reached} (siguiente evento tras t={target}).")
 
     def handle_reset(self):
         """Reinicia la simulación, manteniendo los procesos definidos."""
         if self.running: self.handle_pause()
         self.model.reset()
+        self._run_key = None
         for p in self.processes.values():
             p.remaining = p.burst
             p.start_time = None
@@ -221,10 +439,12 @@ class RRPresenter(SchedulerObserver):
         # Limpiar y redibujar Gantt
         self.view.clear_gantt()
         self.view.draw_static_gantt(0, self.view.canvas_time_scale) # Dibujar con tiempo 0
+        self.horizon = 0
+        self.view.set_timeline(0, 0)
         # self.view.set_canvas_scroll(...) # Reset scroll si es necesario
 
         self.view.refresh_process_table(self.processes, self.model)
-        self.view.update_queues_display(0, None, []) # Resetear estado
+        self._update_queues(0) # Resetear estado
         self.view.update_metrics_display({}) # Limpiar métricas
         self.view.set_running_state(False) # Resetear botones
         self.view.log_message("Simulación reiniciada. Los procesos han sido preservados.")
@@ -237,13 +457,16 @@ class RRPresenter(SchedulerObserver):
         self.processes.clear()
         self.next_pid = 1
         self.model.reset()
+        self._run_key = None
 
         # Limpiar y redibujar Gantt
         self.view.clear_gantt()
         self.view.draw_static_gantt(0, self.view.canvas_time_scale)
+        self.horizon = 0
+        self.view.set_timeline(0, 0)
 
         self.view.refresh_process_table(self.processes, self.model)
-        self.view.update_queues_display(0, None, [])
+        self._update_queues(0)
         self.view.update_metrics_display({})
         self.view.set_running_state(False)
         self.view.log_message("All data cleared. Application reset to initial state.")
@@ -251,22 +474,9 @@ class RRPresenter(SchedulerObserver):
         self.view.log_message("Application fully cleared.")
 
     # --- Métodos auxiliares para gestión de procesos ---
-    def _remove_proc_from_scheduler(self, pid: int):
-        """Elimina un proceso de todas las estructuras internas del planificador."""
-        self.model.future = [p for p in self.model.future if p.pid != pid]
-        self.model.ready = [p for p in self.model.ready if p.pid != pid] # Deque a lista para filtrar
-        self.model.ready = type(self.model.ready)(self.model.ready) # Convertir de nuevo a deque si es necesario
-        self.model.finished = [p for p in self.model.finished if p.pid != pid]
-        if self.model.current and self.model.current.pid == pid:
-            self.model.current = None
-
     def _proc_in_scheduler(self, pid: int) -> bool:
-        """Verifica si un proceso está en alguna de las colas del planificador."""
-        if self.model.current and self.model.current.pid == pid: return True
-        if any(p.pid == pid for p in self.model.ready): return True
-        if any(p.pid == pid for p in self.model.future): return True
-        if any(p.pid == pid for p in self.model.finished): return True
-        return False
+        """Verifica si un proceso está en alguna de las colas del planificador (O(1))."""
+        return self.model.contains(pid)
 
     def _ensure_scheduler_has_procs(self):
         """
@@ -279,41 +489,177 @@ class RRPresenter(SchedulerObserver):
                     p.remaining = p.burst # Reiniciar si no ha comenzado
                 self.model.add_process(p)
 
+    def _continue_from_present(self):
+        """
+        Si se saltó hacia atrás, descarta las ráfagas posteriores del historial antes de
+        seguir simulando (la continuación se vuelve a registrar) y redibuja el Gantt.
+        """
+        if self.model.history_ahead:
+            self.model.truncate_history_to_present()
+            self.horizon = self.model.time
+            self._redraw_gantt()
+
+    def _after_workload_change(self, started: float):
+        """Redibuja todo tras editar o eliminar un proceso: la simulación se repitió hasta el instante actual."""
+        self._run_key = None # La ejecución en curso ya no corresponde a la carga
+        if self.model.time > 0:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.view.log_message(f"Simulación actualizada hasta t={self.model.time} en {elapsed_ms:.0f} ms.")
+        self.horizon = self.model.time # Lo simulado después dejó de ser válido
+        self.view.set_timeline(self.model.time, self.horizon)
+        self._redraw_gantt()
+        self._update_views()
+        done = self.model.is_done() and self.model.time > 0
+        self.view.update_metrics_display(self.model.metrics() if done else {})
+        self.view.set_initial_state(self.model.time == 0 or done)
+
+    def _sync_timeline(self):
+        """
+        Ajusta la línea de tiempo tras un cambio en la carga: si se había saltado hacia
+        atrás, el modelo ya descartó lo simulado después del instante actual.
+        """
+        if self.horizon > self.model.time and not self.model.history_ahead:
+            self.horizon = self.model.time
+            self.view.set_timeline(self.model.time, self.horizon)
+            self._redraw_gantt()
+
+    def _apply_quantum(self, q: int):
+        """Aplica el quantum de la vista; si cambia a mitad de ejecución, esta ya no se guarda en la caché."""
+        if q != self.model.quantum:
+            self._run_key = None
+        self.model.set_quantum(q)
+
+    def _identify_run(self) -> Optional[Tuple[str, List[int]]]:
+        """
+        Clave de caché (ver 'models.run_cache') de la ejecución que está a punto de empezar.
+        Returns:
+            tuple: (clave, PIDs en orden de admisión), o None si la simulación ya avanzó
+            o el planificador no es el de una CPU con Round Robin clásico.
+        """
+        model = self.model
+        if (not isinstance(model, RoundRobinScheduler) or type(model.policy) is not RoundRobinPolicy
+                or model.switch_cost is not None or model.io_model is not None):
+            return None
+        procs = pending_workload(model)
+        if not procs:
+            return None
+        return scheduler_key(procs, model.quantum), [p.pid for p in procs]
+
+    def _start_from_cache(self) -> bool:
+        """
+        Al empezar desde t=0, si la misma carga ya se simuló con el mismo quantum, lleva
+        el modelo al resultado guardado y lo muestra al instante ('seek' permite volver atrás).
+        Returns:
+            bool: True si el resultado salió de la caché.
+        """
+        run_key = self._identify_run()
+        if run_key is None: # Ya empezada: se conserva la clave con la que empezó
+            return False
+        self._run_key = run_key
+        key, pids = run_key
+        run = self.run_cache.get(key)
+        if run is None:
+            return False
+        import_run(self.model, run.snapshot, pids)
+        self._run_key = None
+        self.horizon = self.model.time
+        self.view.set_timeline(self.model.time, self.horizon)
+        self._redraw_gantt()
+        self._update_views()
+        self.view.log_message(f"Resultado recuperado de la caché: simulación completa hasta t={self.model.time}.")
+        self._show_metrics()
+        self.view.set_running_state(False)
+        self.view.set_initial_state(True)
+        return True
+
+    def _cache_finished_run(self):
+        """Guarda en la caché la ejecución que acaba de terminar, si empezó en t=0 sin cambios por el camino."""
+        if self._run_key is not None and self.model.is_done():
+            key, pids = self._run_key
+            self.run_cache.put(key, self.model.metrics(), export_run(self.model, pids))
+        self._run_key = None
+
+    def _redraw_gantt(self):
+        """Redibuja el Gantt completo (eje, ráfagas y línea de tiempo) en el instante actual."""
+        scale = self.view.canvas_time_scale
+        self.view.clear_gantt()
+        self.view.draw_static_gantt(self.model.time, scale)
+        self.view.redraw_gantt_bursts(self._gantt_lanes(), scale)
+        self.view.update_gantt_time_line(self.model.time, scale)
+
     # --- Métodos de control de simulación (auxiliares) ---
+    def _start_frame_loop(self):
+        """Reinicia el estado del bucle por cuadros antes de empezar la simulación automática."""
+        now = time.perf_counter()
+        self._last_frame_time = now
+        self._sim_credit = 0.0
+        self._speed_window_start = now
+        self._speed_window_units = 0
+
     def _schedule_tick(self):
-        """Ejecuta pasos de simulación en bucle automático y actualiza la UI."""
+        """
+        Ejecuta un cuadro de la simulación automática.
+        Avanza el modelo (con el motor por eventos) hasta cubrir el tiempo simulado que
+        corresponde a la velocidad objetivo, sin exceder el presupuesto de tiempo del
+        cuadro; después renderiza una única vez y programa el siguiente cuadro, de modo
+        que la UI se mantiene fluida con cualquier velocidad.
+        """
         if not self.running:
             return
-        steps_per_ui_update = self.view.get_ticks_per_second()
-        steps_executed = 0
+        frame_interval = 1.0 / self.TARGET_FPS
+        frame_start = time.perf_counter()
+        elapsed = min(frame_start - self._last_frame_time, self.MAX_CATCHUP_S)
+        self._last_frame_time = frame_start
+        # Crédito de tiempo simulado para este cuadro (acotado si la simulación no da abasto)
+        self._sim_credit = min(self._sim_credit + self.target_speed * elapsed, self.target_speed * self.MAX_CATCHUP_S)
+        target_time = self.model.time + int(self._sim_credit)
+        deadline = frame_start + frame_interval * self.FRAME_BUDGET_FRACTION
+        start_time = self.model.time
         active = True
-        # Ejecutar varios pasos antes de actualizar la UI para mejorar rendimiento
-        while steps_executed < steps_per_ui_update and active:
-            active = self.model.step()
-            steps_executed += 1
-        # self._update_views() # Ya se hará por notificaciones Observer
-        # self.view.update_queues_display(self.model.time, self.model.current.pid if self.model.current else None, [p.pid for p in self.model.ready])
+        while active and self.model.time < target_time:
+            active = self.model.advance_to_next_event(until=target_time)
+            if time.perf_counter() >= deadline:
+                break
+        advanced = self.model.time - start_time
+        self._sim_credit -= advanced
+        self.model.flush_events() # Renderizar una vez por cuadro
+        self._report_speed(advanced)
         if not active:
             self.view.log_message("Simulación finalizada.")
             self.running = False
             self.view.set_running_state(False)
             self._show_metrics()
+            self._cache_finished_run()
             self.view.set_initial_state(True)
-            # self.view.clear_gantt_time_line()
             return
-        # Programar el siguiente tick usando `after` de la vista
-        # Se necesita acceso al método `after` de Tkinter, asumimos `view` es `RRAppTk`
+        # Programar el siguiente cuadro usando `after` de la vista
         if hasattr(self.view, 'after'):
-            self.after_id = self.view.after(self.tick_delay_ms, self._schedule_tick)
-        else:
-            # Manejo alternativo si la vista no tiene acceso directo a `after`
-            # Por ejemplo, usando una cola de eventos o callbacks
-            pass
+            delay_ms = max(1, int((frame_interval - (time.perf_counter() - frame_start)) * 1000))
+            self.after_id = self.view.after(delay_ms, self._schedule_tick)
+
+    def _report_speed(self, advanced: int):
+        """Acumula las unidades simuladas y muestra periódicamente la velocidad real frente a la objetivo."""
+        self._speed_window_units += advanced
+        now = time.perf_counter()
+        window = now - self._speed_window_start
+        if window >= self.SPEED_REPORT_INTERVAL_S:
+            self.view.update_speed_display(self.target_speed, self._speed_window_units / window)
+            self._speed_window_start = now
+            self._speed_window_units = 0
 
     def _update_views(self):
         """Actualiza las vistas de la tabla y otras partes de la UI."""
         self.view.refresh_process_table(self.processes, self.model)
-        self.view.update_queues_display(self.model.time, self.model.current.pid if self.model.current else None, [p.pid for p in self.model.ready])
+        self._update_queues(self.model.time)
+
+    def _update_queues(self, time: int):
+        """Muestra el proceso en CPU (o en cada núcleo) y la cola de listos."""
+        running = None
+        if isinstance(self.model, SMPScheduler):
+            running = [p.pid if p else None for p in self.model.running]
+        current = self.model.current
+        self.view.update_queues_display(time, current.pid if current else None,
+                                        [p.pid for p in self.model.ready], running)
 
     def _show_metrics(self):
         """Calcula y muestra las métricas de rendimiento."""
@@ -331,26 +677,25 @@ class RRPresenter(SchedulerObserver):
         # self.view.refresh_gantt_header(time) # Ya se hace draw_static_gantt
         self.view.draw_static_gantt(time, self.view.canvas_time_scale)
         self.view.update_gantt_time_line(time, self.view.canvas_time_scale)
-        self.view.update_queues_display(time, self.model.current.pid if self.model.current else None, [p.pid for p in self.model.ready])
+        self.horizon = max(self.horizon, time)
+        self.view.set_timeline(time, self.horizon)
+        self._update_queues(time)
 
     def on_context_switch(self, pid: Optional[int], time: int):
         """
         Recibe notificación de un cambio de contexto.
         Añade mensaje al log y actualiza la UI.
         """
-        self.view.log_message(f"[t={time}] Cambio de contexto -> {'CPU IDLE' if pid is None else f'P{pid}'}")
+        self.view.log_message(self._context_switch_message(pid, time))
         self.view.refresh_process_table(self.processes, self.model)
-        # self.view.update_queues_display(self.model.time, self.model.current.pid if self.model.current else None, [p.pid for p in self.model.ready])
 
     def on_process_finished(self, proc: Process, time: int):
         """
         Recibe notificación de que un proceso ha terminado.
         Añade mensaje al log y actualiza la UI.
         """
-        tat = proc.completion_time - proc.arrival if proc.completion_time is not None else "N/A"
-        self.view.log_message(f"[t={time}] P{proc.pid} finalizado. Turnaround={tat}.")
+        self.view.log_message(self._finished_message(proc, time))
         self.view.refresh_process_table(self.processes, self.model)
-        # self.view.update_queues_display(self.model.time, self.model.current.pid if self.model.current else None, [p.pid for p in self.model.ready])
 
     def on_execution_burst(self, pid: Optional[int], start_time: int, duration: int):
         """
@@ -358,3 +703,45 @@ class RRPresenter(SchedulerObserver):
         Dibuja la barra en el Gantt.
         """
         self.view.draw_execution_burst(pid, start_time, duration, self.view.canvas_time_scale)
+
+    def on_core_burst(self, core: int, pid: Optional[int], start_time: int, duration: int):
+        """Ráfaga de un núcleo (planificador multinúcleo): se dibuja en su carril del Gantt."""
+        self.view.draw_execution_burst(pid, start_time, duration, self.view.canvas_time_scale, core)
+
+    def on_events(self, batch: List[tuple]):
+        """
+        Recibe un lote de eventos del modelo y actualiza la UI una sola vez:
+        dibuja las ráfagas, añade los mensajes al log en una única escritura,
+        refresca la tabla si hubo cambios y redibuja el encabezado y la línea
+        de tiempo solo para el último tick del lote.
+        """
+        last_tick = None
+        log_lines = []
+        scale = self.view.canvas_time_scale
+        for event in batch:
+            kind = event[0]
+            if kind == EVENT_TICK:
+                last_tick = event[1]
+            elif kind == EVENT_CONTEXT_SWITCH:
+                log_lines.append(self._context_switch_message(event[1], event[2], *event[3:]))
+            elif kind == EVENT_FINISHED:
+                log_lines.append(self._finished_message(event[1], event[2]))
+            else:
+                self.view.draw_execution_burst(event[1], event[2], event[3], scale, *event[4:])
+        if log_lines:
+            self.view.log_message("\n".join(log_lines))
+            self.view.refresh_process_table(self.processes, self.model)
+        if last_tick is not None:
+            self.on_tick(last_tick)
+
+    @staticmethod
+    def _context_switch_message(pid: Optional[int], time: int, core: Optional[int] = None) -> str:
+        """Texto del log para un cambio de contexto (con el núcleo, si es multinúcleo)."""
+        cpu = "CPU" if core is None else f"CPU{core}"
+        return f"[t={time}] Cambio de contexto -> {f'{cpu} IDLE' if pid is None else f'P{pid}' if core is None else f'P{pid} en {cpu}'}"
+
+    @staticmethod
+    def _finished_message(proc: Process, time: int) -> str:
+        """Texto del log para un proceso terminado."""
+        tat = proc.completion_time - proc.arrival if proc.completion_time is not None else "N/A"
+        return f"[t={time}] P{proc.pid} finalizado. Turnaround={tat}."
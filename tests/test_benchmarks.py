@@ -0,0 +1,9 @@
+# tests/test_benchmarks.py
+"""El benchmark de motores cuenta los mismos eventos con cualquier motor."""
+from benchmarks.engines import ENGINES, measure_case
+
+def test_events_do_not_depend_on_engine():
+    case = {"name": "test", "count": 200, "load": 0.9, "quantum": 20, "size": "small"}
+    results = [measure_case(case, engine, trace=False) for engine in ENGINES]
+    assert len({(r["events"], r["context_switches"], r["simulated_units"]) for r in results}) == 1
+    assert results[0]["events"] == results[0]["context_switches"] + case["count"]
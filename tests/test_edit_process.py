@@ -0,0 +1,67 @@
+# tests/test_edit_process.py
+"""
+'edit_process' y 'delete_process' a mitad de simulación dejan el planificador
+igual que una ejecución nueva de la carga ya cambiada, llevada al mismo instante.
+"""
+import random
+
+import pytest
+
+from models.io_model import make_io_model
+from models.policies import make_policy
+from models.scheduler import Process, RoundRobinScheduler
+
+POLICIES = [("rr", None), ("wrr:weights=1:3/2:2", None), ("mlfq:levels=3,boost_interval=150", None),
+            ("srtf", None), ("vrr", "every=6,wait=15,pids=1/2/5")]
+
+def make(workload, quantum, policy, io, spacing=None):
+    scheduler = RoundRobinScheduler(quantum=quantum, policy=make_policy(policy), io_model=make_io_model(io))
+    if spacing is not None:
+        scheduler.enable_checkpoints(spacing=spacing)
+    for pid, (arrival, burst) in workload.items():
+        scheduler.add_process(Process(pid, arrival, burst))
+    return scheduler
+
+def state(scheduler):
+    finished = [(p.pid, p.start_time, p.completion_time) for p in scheduler.finished]
+    return scheduler.time, scheduler.history.columns(), finished, scheduler.context_switches
+
+def fresh(workload, quantum, policy, io, t):
+    scheduler = make(workload, quantum, policy, io)
+    scheduler.seek(t)
+    return scheduler
+
+@pytest.mark.parametrize("policy, io", POLICIES)
+@pytest.mark.parametrize("seed", range(6))
+def test_random_edits_match_fresh_run(policy, io, seed):
+    rng = random.Random(seed)
+    workload = {pid: (rng.randint(0, 200), rng.randint(1, 60)) for pid in range(1, rng.randint(3, 15) + 1)}
+    quantum = rng.choice((3, 10, 25))
+    scheduler = make(workload, quantum, policy, io, spacing=rng.choice((1, 4, 16)))
+    for _ in range(6):
+        scheduler.seek(scheduler.time + rng.randint(1, 120))
+        pid = rng.choice(sorted(workload))
+        if rng.random() < 0.3 and len(workload) > 1:
+            del workload[pid]
+            reached = scheduler.delete_process(pid)
+        else:
+            workload[pid] = (rng.randint(0, 250), rng.randint(1, 60))
+            reached = scheduler.edit_process(pid, *workload[pid])
+        assert state(scheduler) == state(fresh(workload, quantum, policy, io, reached))
+    scheduler.run_until_done(mode="event")
+    expected = make(workload, quantum, policy, io)
+    expected.run_until_done(mode="event")
+    assert state(scheduler) == state(expected)
+    assert scheduler.metrics() == expected.metrics()
+
+def test_edit_requires_checkpoints():
+    scheduler = make({1: (0, 10)}, 5, "rr", None)
+    with pytest.raises(ValueError):
+        scheduler.edit_process(1, 0, 20)
+
+def test_edit_unknown_pid_and_bad_burst_are_rejected():
+    scheduler = make({1: (0, 10)}, 5, "rr", None, spacing=1)
+    with pytest.raises(ValueError):
+        scheduler.delete_process(7)
+    with pytest.raises(ValueError):
+        scheduler.edit_process(1, 0, 0)
@@ -0,0 +1,105 @@
+# tests/test_engine_parity.py
+"""
+Paridad de los motores de 'RoundRobinScheduler': 'tick' (step), 'event'
+(advance_to_next_event) y 'analytic' (advance_rounds) deben producir el mismo
+historial, los mismos terminados, los mismos cambios de contexto y las mismas
+métricas sobre cargas aleatorias con semilla.
+"""
+import random
+
+import pytest
+
+from models.history import ExecutionHistory
+from models.io_model import make_io_model
+from models.policies import make_policy
+from models.scheduler import Process, RoundRobinScheduler
+
+ENGINES = ("tick", "event", "analytic")
+QUANTA = (1, 2, 3, 7, 20, 50, 200)
+
+def random_workload(rng: random.Random):
+    """Carga aleatoria: llegadas dispersas, en ráfaga (mismos instantes) o todas en t=0."""
+    n = rng.randint(1, 30)
+    shape = rng.randrange(3)
+    if shape == 0:
+        return [(rng.randint(0, 400), rng.randint(1, 120)) for _ in range(n)]
+    if shape == 1:
+        return [(rng.choice((0, 10, 50)), rng.randint(1, 60)) for _ in range(n)]
+    return [(0, rng.randint(1, 300)) for _ in range(n)]
+
+def run(workload, quantum: int, engine: str, policy: str = "rr", merge: bool = True, until_step: int = 0,
+        io: str = None):
+    """Simula la carga y devuelve (historial, terminados, cambios de contexto, métricas, reloj)."""
+    scheduler = RoundRobinScheduler(quantum=quantum, policy=make_policy(policy),
+                                    history=ExecutionHistory(merge=merge), io_model=make_io_model(io))
+    for pid, (arrival, burst) in enumerate(workload, 1):
+        scheduler.add_process(Process(pid, arrival, burst))
+    if until_step and engine != "tick":
+        # Avance por tramos con 'until' (como el bucle por cuadros de la interfaz)
+        advance = scheduler.advance_rounds if engine == "analytic" else scheduler.advance_to_next_event
+        target, active = 0, True
+        while active:
+            target += until_step
+            while active and scheduler.time < target:
+                active = advance(until=target)
+        scheduler.flush_events()
+    else:
+        scheduler.run_until_done(mode=engine)
+    finished = [(p.pid, p.start_time, p.completion_time) for p in scheduler.finished]
+    return list(scheduler.history), finished, scheduler.context_switches, scheduler.metrics(), scheduler.time
+
+@pytest.mark.parametrize("seed", range(40))
+def test_engines_match_on_random_workloads(seed):
+    rng = random.Random(seed)
+    workload = random_workload(rng)
+    quantum = rng.choice(QUANTA)
+    expected = run(workload, quantum, "tick")
+    for engine in ENGINES[1:]:
+        assert run(workload, quantum, engine) == expected, engine
+
+@pytest.mark.parametrize("seed", range(20))
+def test_engines_match_without_merging(seed):
+    rng = random.Random(1000 + seed)
+    workload = random_workload(rng)
+    quantum = rng.choice(QUANTA)
+    expected = run(workload, quantum, "tick", merge=False)
+    for engine in ENGINES[1:]:
+        assert run(workload, quantum, engine, merge=False) == expected, engine
+
+@pytest.mark.parametrize("seed", range(20))
+def test_stepwise_advance_with_until_matches(seed):
+    rng = random.Random(2000 + seed)
+    workload = random_workload(rng)
+    quantum = rng.choice(QUANTA)
+    until_step = rng.choice((1, 5, 37, 400))
+    expected = run(workload, quantum, "tick")
+    for engine in ENGINES[1:]:
+        assert run(workload, quantum, engine, until_step=until_step) == expected, engine
+
+@pytest.mark.parametrize("policy", ["mlfq:levels=3,boost_interval=300", "srtf", "wrr:weights=1:3/2:2"])
+@pytest.mark.parametrize("seed", range(8))
+def test_engines_match_with_other_policies(policy, seed):
+    rng = random.Random(3000 + seed)
+    workload = random_workload(rng)
+    quantum = rng.choice(QUANTA)
+    expected = run(workload, quantum, "tick", policy)
+    for engine in ENGINES[1:]:
+        assert run(workload, quantum, engine, policy) == expected, engine
+
+@pytest.mark.parametrize("policy", ["rr", "vrr", "wrr:weights=1:3/2:2", "mlfq:levels=3,boost_interval=300", "srtf"])
+@pytest.mark.parametrize("seed", range(6))
+def test_engines_match_with_io(policy, seed):
+    rng = random.Random(4000 + seed)
+    workload = random_workload(rng)
+    quantum = rng.choice(QUANTA)
+    io = f"every={rng.randint(1, 40)},wait={rng.randint(1, 80)}"
+    if rng.random() < 0.5:
+        io += ",pids=" + "/".join(str(pid) for pid in range(1, len(workload) + 1, 2))
+    expected = run(workload, quantum, "tick", policy, io=io)
+    for engine in ENGINES[1:]:
+        assert run(workload, quantum, engine, policy, io=io) == expected, engine
+        assert run(workload, quantum, engine, policy, until_step=37, io=io) == expected, engine
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        RoundRobinScheduler().run_until_done(mode="warp")
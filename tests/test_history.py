@@ -0,0 +1,71 @@
+# tests/test_history.py
+"""Historial de ráfagas por columnas: fusión, retención, descarga a disco y consultas."""
+import pytest
+
+from models.history import IDLE_CODE, ExecutionHistory
+
+def fill(history, bursts):
+    for pid, start, duration in bursts:
+        history.append(pid, start, duration)
+    return history
+
+# Ráfagas contiguas de 10 unidades alternando PIDs 1, 2, 3 (e IDLE cada siete)
+BURSTS = [(None if i % 7 == 6 else i % 3 + 1, 10 * i, 10) for i in range(40)]
+
+def test_adjacent_bursts_of_same_pid_are_merged():
+    history = fill(ExecutionHistory(), [(1, 0, 5), (1, 5, 3), (2, 8, 2), (2, 12, 4), (None, 16, 2), (None, 18, 1)])
+    assert list(history) == [(1, 0, 8), (2, 8, 2), (2, 12, 4), (None, 16, 3)]
+    unmerged = fill(ExecutionHistory(merge=False), [(1, 0, 5), (1, 5, 3)])
+    assert list(unmerged) == [(1, 0, 5), (1, 5, 3)]
+
+def test_max_bursts_keeps_the_latest():
+    history = fill(ExecutionHistory(max_bursts=5), BURSTS)
+    assert list(history) == BURSTS[-5:]
+    assert len(history) == 5 and history.spilled == 35
+    assert history.cursor() == (40, 400)
+    assert history[0] == BURSTS[35] and history[-1] == BURSTS[-1]
+    with pytest.raises(IndexError):
+        history[5]
+
+def test_max_span_keeps_recent_time_window():
+    history = fill(ExecutionHistory(max_span=25), BURSTS)
+    # Ráfagas que terminan después de 400 - 25
+    assert list(history) == [b for b in BURSTS if b[1] + b[2] > 375]
+    assert history.spilled == 37
+
+def test_eviction_compacts_long_histories():
+    bursts = [(i % 5, 3 * i, 3) for i in range(5000)]
+    history = fill(ExecutionHistory(merge=False, max_bursts=100), bursts)
+    assert list(history) == bursts[-100:]
+    assert len(history.columns()[0]) == 100
+    assert history.spilled == 4900
+
+def test_range_and_cursor_at_after_eviction():
+    history = fill(ExecutionHistory(max_bursts=10), BURSTS)
+    assert list(history.range(0, 1000)) == BURSTS[-10:]
+    assert list(history.range(305, 325)) == BURSTS[30:33]
+    assert list(history.range(0, 300)) == [] # Todo lo anterior se ha descartado
+    assert history.cursor_at(100) == (30, 0) # Antes de la primera retenida: solo lo descartado
+    assert history.cursor_at(325) == (33, 325)
+    history.truncate(*history.cursor_at(325))
+    assert list(history)[-1] == (BURSTS[32][0], 320, 5)
+    with pytest.raises(ValueError):
+        history.truncate(10, 100) # Cursor dentro de lo descargado
+
+def test_spilled_bursts_are_read_back(tmp_path):
+    path = str(tmp_path / "history.rrh")
+    history = fill(ExecutionHistory(max_bursts=4, spill_path=path), BURSTS)
+    assert list(history.iter_all()) == BURSTS
+    # Las columnas retenidas se cargan en otro historial con el mismo cursor
+    restored = ExecutionHistory()
+    restored.load_columns(*history.columns(), spilled=history.spilled)
+    assert list(restored) == list(history) and restored.cursor() == history.cursor()
+    assert restored.columns()[0][-1] == (IDLE_CODE if BURSTS[-1][0] is None else BURSTS[-1][0])
+    history.clear()
+    assert list(history.iter_all()) == []
+
+def test_count_range_is_within_one():
+    history = fill(ExecutionHistory(max_bursts=30), BURSTS)
+    for t0, t1 in ((0, 400), (105, 106), (150, 250), (333, 390), (390, 1000), (500, 600)):
+        exact = len(list(history.range(t0, t1)))
+        assert abs(history.count_range(t0, t1) - exact) <= 1, (t0, t1)
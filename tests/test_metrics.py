@@ -0,0 +1,57 @@
+# tests/test_metrics.py
+"""Métricas: la lectura directa de las columnas de una 'ProcessTable' coincide con la de los procesos."""
+import random
+
+import pytest
+
+from models import metrics as metrics_module
+from models.process_table import ProcessTable
+from models.scheduler import Process, RoundRobinScheduler
+from models.smp import SMPScheduler
+
+def workload(seed: int, n: int = 300):
+    rng = random.Random(seed)
+    return [(rng.randint(0, 5000), rng.randint(1, 200)) for _ in range(n)]
+
+def run(scheduler, pairs, table: bool):
+    if table:
+        scheduler.load_table(ProcessTable.from_pairs(pairs))
+    else:
+        for pid, (arrival, burst) in enumerate(pairs, 1):
+            scheduler.add_process(Process(pid, arrival, burst))
+    scheduler.run_until_done()
+    return scheduler.metrics()
+
+@pytest.mark.parametrize("make", [lambda: RoundRobinScheduler(quantum=20),
+                                  lambda: SMPScheduler(cores=3, quantum=20)])
+@pytest.mark.parametrize("seed", range(5))
+def test_table_columns_match_process_objects(make, seed):
+    pairs = workload(seed)
+    assert run(make(), pairs, table=True) == pytest.approx(run(make(), pairs, table=False))
+
+def test_removed_row_falls_back_to_finished():
+    scheduler = RoundRobinScheduler(quantum=20)
+    scheduler.load_table(ProcessTable.from_pairs(workload(7)))
+    scheduler.run_until_done()
+    # La fila eliminada conserva su finalización en la tabla, pero ya no está en 'finished'
+    removed = scheduler.finished[0]
+    scheduler.remove(removed.pid)
+    finished = scheduler.finished
+    expected = metrics_module.compute_metrics([p.arrival for p in finished], [p.burst for p in finished],
+                                              [p.start_time for p in finished],
+                                              [p.completion_time for p in finished], scheduler.context_switches)
+    assert {key: scheduler.metrics()[key] for key in expected} == pytest.approx(expected)
+
+def test_added_process_disables_table_path():
+    pairs = workload(3)
+    scheduler = RoundRobinScheduler(quantum=20)
+    scheduler.load_table(ProcessTable.from_pairs(pairs))
+    scheduler.add_process(Process(len(pairs) + 1, 10, 50))
+    scheduler.run_until_done()
+    assert scheduler.metrics() == pytest.approx(run(RoundRobinScheduler(quantum=20), pairs + [(10, 50)], table=False))
+
+def test_python_fallback_matches_numpy(monkeypatch):
+    pairs = workload(11)
+    expected = run(RoundRobinScheduler(quantum=20), pairs, table=True)
+    monkeypatch.setattr(metrics_module, "np", None)
+    assert run(RoundRobinScheduler(quantum=20), pairs, table=True) == pytest.approx(expected)
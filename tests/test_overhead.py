@@ -0,0 +1,74 @@
+# tests/test_overhead.py
+"""Coste de los cambios de contexto: totales calculados a mano con los tres motores."""
+import pytest
+
+from models.history import OVERHEAD_PID
+from models.overhead import ContextSwitchCost, make_switch_cost
+from models.scheduler import Process, RoundRobinScheduler
+
+ENGINES = ("tick", "event", "analytic")
+
+def run(engine, cost, workload=((0, 10), (0, 10)), quantum=5, keep_finished=True):
+    scheduler = RoundRobinScheduler(quantum=quantum, switch_cost=cost)
+    if keep_finished:
+        for pid, (arrival, burst) in enumerate(workload, 1):
+            scheduler.add_process(Process(pid, arrival, burst))
+    else:
+        scheduler.attach_arrival_stream(iter(workload), keep_finished=False)
+    scheduler.run_until_done(mode=engine)
+    return scheduler
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_fixed_latency_totals(engine):
+    scheduler = run(engine, ContextSwitchCost(latency=2))
+    # Cuatro despachos de 2 unidades antes de cada rodaja de 5
+    assert list(scheduler.history) == [
+        (OVERHEAD_PID, 0, 2), (1, 2, 5), (OVERHEAD_PID, 7, 2), (2, 9, 5),
+        (OVERHEAD_PID, 14, 2), (1, 16, 5), (OVERHEAD_PID, 21, 2), (2, 23, 5),
+    ]
+    metrics = scheduler.metrics()
+    assert scheduler.overhead_time == metrics["overhead_time"] == 8
+    assert metrics["cpu_efficiency"] == pytest.approx(20 / 28)
+    assert metrics["context_switches"] == 4
+    assert [p.completion_time for p in scheduler.finished] == [21, 28]
+    # La espera incluye la sobrecarga de los despachos: turnaround - ráfaga
+    assert metrics["avg_waiting"] == pytest.approx(((21 - 10) + (28 - 10)) / 2)
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_cache_penalty_grows_with_time_away(engine):
+    scheduler = run(engine, ContextSwitchCost(latency=1, cache_penalty=10, cache_window=20))
+    # Despachos: P1 y P2 en frío (1 + 10); P1 tras 16 unidades fuera (1 + 10*16//20 = 9);
+    # P2 tras 14 (1 + 10*14//20 = 8)
+    overhead = [(start, duration) for pid, start, duration in scheduler.history if pid == OVERHEAD_PID]
+    assert overhead == [(0, 11), (16, 11), (32, 9), (46, 8)]
+    assert scheduler.overhead_time == 39 and scheduler.time == 59
+    assert scheduler.metrics()["cpu_efficiency"] == pytest.approx(20 / 59)
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_streamed_run_reports_the_same_overhead(engine):
+    cost = ContextSwitchCost(latency=3)
+    workload = ((0, 12), (2, 7), (30, 4))
+    expected = run(engine, cost, workload).metrics()
+    metrics = run(engine, cost, workload, keep_finished=False).metrics()
+    assert metrics["overhead_time"] == expected["overhead_time"] == 3 * expected["context_switches"]
+    useful = 12 + 7 + 4
+    assert metrics["cpu_efficiency"] == pytest.approx(expected["cpu_efficiency"])
+    assert expected["cpu_efficiency"] == pytest.approx(useful / (useful + expected["overhead_time"]))
+
+def test_free_switches_leave_no_overhead():
+    for engine in ENGINES:
+        scheduler = run(engine, None)
+        assert OVERHEAD_PID not in [pid for pid, _, _ in scheduler.history]
+        metrics = scheduler.metrics()
+        assert metrics["overhead_time"] == 0 and metrics["cpu_efficiency"] == 1.0
+
+def test_make_switch_cost():
+    assert make_switch_cost(None) is None and make_switch_cost("0") is None and make_switch_cost(" ") is None
+    cost = make_switch_cost("latency=2,cache=20,window=500")
+    assert (cost.latency, cost.cache_penalty, cost.cache_window) == (2, 20, 500)
+    assert make_switch_cost(cost.spec()).spec() == cost.spec()
+    assert make_switch_cost("3").latency == 3
+    assert cost.cost(None) == 22 and cost.cost(0) == 2 and cost.cost(250) == 12 and cost.cost(10_000) == 22
+    for spec in ("speed=2", "latency=x", "-1", "window=0"):
+        with pytest.raises(ValueError):
+            make_switch_cost(spec)
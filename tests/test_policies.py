@@ -0,0 +1,94 @@
+# tests/test_policies.py
+"""Comportamiento propio de cada política (la paridad entre motores está en test_engine_parity)."""
+import pytest
+
+from models.history import ExecutionHistory
+from models.io_model import make_io_model
+from models.policies import make_policy
+from models.scheduler import Process, RoundRobinScheduler
+
+def run(policy: str, workload, quantum: int = 10, io: str = None):
+    scheduler = RoundRobinScheduler(quantum=quantum, policy=make_policy(policy),
+                                    history=ExecutionHistory(merge=False), io_model=make_io_model(io))
+    for pid, (arrival, burst) in enumerate(workload, 1):
+        scheduler.add_process(Process(pid, arrival, burst))
+    scheduler.run_until_done(mode="event")
+    return scheduler
+
+def test_wrr_slices_are_proportional_to_weights():
+    scheduler = run("wrr:weights=1:3", [(0, 60), (0, 60)])
+    assert list(scheduler.history)[:4] == [(1, 0, 30), (2, 30, 10), (1, 40, 30), (2, 70, 10)]
+    assert [p.pid for p in scheduler.finished] == [1, 2]
+
+def test_wrr_without_weights_is_round_robin():
+    workload = [(0, 35), (3, 12), (8, 50)]
+    assert list(run("wrr", workload).history) == list(run("rr", workload).history)
+
+def test_srtf_preempts_longer_job():
+    scheduler = run("srtf", [(0, 50), (5, 10)])
+    assert list(scheduler.history) == [(1, 0, 5), (2, 5, 10), (1, 15, 45)]
+
+def test_mlfq_demotes_after_allotment():
+    scheduler = run("mlfq:levels=2", [(0, 40), (15, 5)])
+    # El proceso 1 agota la asignación del nivel 0 (10) y baja al nivel 1 (20); la llegada
+    # al nivel 0 lo expulsa y, al volver, solo recibe lo que le faltaba de esa asignación
+    assert list(scheduler.history) == [(1, 0, 10), (1, 10, 5), (2, 15, 5), (1, 20, 15), (1, 35, 10)]
+
+def test_wrr_carries_deficit_after_io():
+    workload, io = [(0, 40), (0, 100)], "every=15,wait=1,pids=1"
+    # P1 se bloquea tras 5 unidades de su segunda rodaja: los 5 que le faltaban pasan a la siguiente
+    assert list(run("rr", workload, io=io).history)[:5] == [(1, 0, 10), (2, 10, 10), (1, 20, 5), (2, 25, 10), (1, 35, 10)]
+    assert list(run("wrr", workload, io=io).history)[:5] == [(1, 0, 10), (2, 10, 10), (1, 20, 5), (2, 25, 10), (1, 35, 15)]
+
+def test_vrr_gives_priority_to_processes_back_from_io():
+    workload, io = [(0, 20), (0, 60), (0, 60)], "every=4,wait=6,pids=1"
+    rr = run("rr", workload, io=io)
+    assert list(rr.history)[:4] == [(1, 0, 4), (2, 4, 10), (3, 14, 10), (1, 24, 4)]
+    vrr = run("vrr", workload, io=io)
+    # Al volver de la E/S, P1 pasa por delante de P3 con lo que le quedaba de quantum (6, luego 2)
+    assert list(vrr.history)[:6] == [(1, 0, 4), (2, 4, 10), (1, 14, 4), (3, 18, 10), (1, 28, 2), (2, 30, 10)]
+    assert vrr.finished[0].completion_time < rr.finished[0].completion_time
+
+def test_vrr_and_wrr_without_io_are_round_robin():
+    workload = [(0, 35), (3, 12), (8, 50)]
+    expected = list(run("rr", workload).history)
+    assert list(run("vrr", workload).history) == expected
+    assert list(run("wrr", workload).history) == expected
+
+def test_io_wait_is_not_counted_as_waiting():
+    scheduler = run("rr", [(0, 12)], quantum=100, io="every=4,wait=10")
+    assert list(scheduler.history) == [(1, 0, 4), (1, 14, 4), (1, 28, 4)]
+    metrics = scheduler.metrics()
+    assert metrics["avg_turnaround"] == 32 and metrics["avg_waiting"] == 0
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        make_policy("fifo")
+
+SNAPSHOT_POLICIES = ["rr", "wrr", "wrr:weights=1:3/2:2", "vrr", "mlfq", "mlfq:levels=2,boost_interval=50", "srtf"]
+
+@pytest.mark.parametrize("io", [None, "every=7,wait=9,pids=1/3"])
+@pytest.mark.parametrize("policy", SNAPSHOT_POLICIES)
+def test_from_snapshot_round_trip_continues_like_uninterrupted_run(policy, io):
+    workload = [(0, 35), (3, 12), (8, 50), (8, 20), (40, 9)]
+    expected = run(policy, workload, io=io)
+    scheduler = RoundRobinScheduler(quantum=10, policy=make_policy(policy),
+                                    history=ExecutionHistory(merge=False), io_model=make_io_model(io))
+    for pid, (arrival, burst) in enumerate(workload, 1):
+        scheduler.add_process(Process(pid, arrival, burst))
+    while scheduler.time < 30:
+        scheduler.advance_to_next_event()
+    snapshot = scheduler.snapshot()
+    # Sin opciones en la especificación, la política se reconstruye a partir de la instantánea
+    explicit = ":" in policy
+    restored = RoundRobinScheduler.from_snapshot(snapshot, history=ExecutionHistory(merge=False),
+                                                 policy=make_policy(policy) if explicit else None)
+    assert type(restored.policy) is type(scheduler.policy)
+    restored.run_until_done(mode="event")
+    assert list(restored.history) == list(expected.history)
+    assert restored.metrics() == expected.metrics()
+
+def test_from_snapshot_rejects_a_different_policy():
+    snapshot = run("mlfq", [(0, 30), (2, 10)]).snapshot()
+    with pytest.raises(ValueError):
+        RoundRobinScheduler.from_snapshot(snapshot, policy=make_policy("srtf"))
@@ -0,0 +1,100 @@
+# tests/test_run_cache.py
+"""Caché de ejecuciones completas: aciertos con otros PIDs, políticas por PID y barridos."""
+import random
+from array import array
+
+import pytest
+
+from models.process_table import ProcessTable
+from models.run_cache import RunCache, admission_order, workload_key
+from models.sweep import run_workload, sweep_quantum
+from models.workload import generate_table
+
+def summary(scheduler):
+    finished = [(p.pid, p.start_time, p.completion_time) for p in scheduler.finished]
+    return (list(scheduler.history), finished, scheduler.context_switches, scheduler.metrics(),
+            scheduler.time, scheduler.overhead_time)
+
+def table(arrival, burst, pids=None):
+    if pids is None:
+        return ProcessTable.from_pairs(zip(arrival, burst))
+    return ProcessTable.from_columns(array("q", arrival), array("q", burst), pid=array("q", pids))
+
+@pytest.mark.parametrize("seed", range(20))
+def test_cached_run_matches_simulation(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 60)
+    arrival = [rng.randint(0, 500) for _ in range(n)]
+    burst = [rng.randint(1, 80) for _ in range(n)]
+    quantum = rng.choice((1, 5, 20, 100))
+    policy = rng.choice(("rr", "wrr:default_weight=2", "mlfq", "srtf"))
+    cost = rng.choice((None, "2", "latency=1,cache=5,window=50"))
+    cache = RunCache()
+    expected = summary(run_workload(table(arrival, burst), quantum, "event", policy, cost))
+    assert summary(run_workload(table(arrival, burst), quantum, "analytic", policy, cost, cache=cache)) == expected
+    assert summary(run_workload(table(arrival, burst), quantum, "event", policy, cost, cache=cache)) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+    # La misma carga con otros PIDs también acierta (los PIDs se guardan canónicos)
+    pids = list(range(1000, 1000 + n))
+    rng.shuffle(pids)
+    cached = run_workload(table(arrival, burst, pids), quantum, "event", policy, cost, cache=cache)
+    assert cache.hits == 2
+    assert summary(cached) == summary(run_workload(table(arrival, burst, pids), quantum, "event", policy, cost))
+
+def test_pid_dependent_policy_does_not_collide():
+    arrival, burst = [0, 0, 0], [90, 90, 90]
+    policy = "wrr:weights=1:3"
+    cache = RunCache()
+    for pids in ([1, 2, 3], [2, 1, 3], [7, 8, 9]):
+        cached = run_workload(table(arrival, burst, pids), 10, policy=policy, cache=cache)
+        assert summary(cached) == summary(run_workload(table(arrival, burst, pids), 10, policy=policy))
+    assert (cache.hits, cache.misses) == (0, 3)
+    run_workload(table(arrival, burst, [2, 1, 3]), 10, policy=policy, cache=cache)
+    assert cache.hits == 1
+    with pytest.raises(ValueError):
+        workload_key(arrival, burst, 10, policy)
+
+def test_default_is_uncached():
+    first = run_workload(table([0, 5], [30, 30]), 10)
+    second = run_workload(table([0, 5], [30, 30]), 10)
+    assert first is not second and summary(first) == summary(second)
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sweep_reuses_cached_quanta(workers):
+    workload = generate_table(2000, seed=4, mean=50, load=0.9)
+    pairs = list(zip(workload.arrival, workload.burst))
+    quanta = [10, 50, 10, 200]
+    plain = sweep_quantum(ProcessTable.from_pairs(pairs), quanta, workers=1)
+    cache = RunCache()
+    assert sweep_quantum(ProcessTable.from_pairs(pairs), quanta, workers=workers, cache=cache) == plain
+    assert (cache.misses, len(cache)) == (3, 3)
+    assert sweep_quantum(ProcessTable.from_pairs(pairs), quanta, workers=workers, cache=cache) == plain
+    assert cache.hits == 3
+    scheduler = run_workload(ProcessTable.from_pairs(pairs), 50, cache=cache)
+    assert cache.hits == 4 and {"quantum": 50, **scheduler.metrics()} == plain[1]
+
+def test_disk_cache_survives_and_ignores_junk(tmp_path):
+    pairs = [(0, 40), (3, 25), (3, 60), (90, 10)]
+    rows = sweep_quantum(ProcessTable.from_pairs(pairs), [30], workers=1, cache=RunCache(directory=str(tmp_path)))
+    reopened = RunCache(directory=str(tmp_path))
+    assert sweep_quantum(ProcessTable.from_pairs(pairs), [30], workers=1, cache=reopened) == rows
+    assert reopened.hits == 1
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"junk")
+    corrupted = RunCache(directory=str(tmp_path))
+    assert sweep_quantum(ProcessTable.from_pairs(pairs), [30], workers=1, cache=corrupted) == rows
+    assert corrupted.misses == 1
+
+def test_lru_eviction():
+    cache = RunCache(max_entries=2)
+    for q in (1, 2, 3):
+        cache.put(str(q), {}, b"x" * q)
+    assert len(cache) == 2 and "1" not in cache and cache.nbytes == 5
+    cache.get("2")
+    cache.put("4", {}, b"")
+    assert "2" in cache and "3" not in cache
+    cache = RunCache(max_bytes=10)
+    cache.put("a", {}, b"x" * 6)
+    cache.put("b", {}, b"x" * 6)
+    assert len(cache) == 1 and "b" in cache
+    assert admission_order([3, 1, 1, 0]) == [3, 1, 2, 0]
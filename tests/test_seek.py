@@ -0,0 +1,127 @@
+# tests/test_seek.py
+"""
+'seek' y el índice de instantáneas: saltar a cualquier instante (hacia atrás,
+hacia delante, más allá del final, tras aclarar o descartar instantáneas) deja
+el planificador como una ejecución directa hasta ese instante.
+"""
+import random
+
+import pytest
+
+from models.checkpoints import CheckpointIndex
+from models.io_model import make_io_model
+from models.policies import make_policy
+from models.scheduler import Process, RoundRobinScheduler
+
+def random_workload(rng):
+    return [(rng.randint(0, 300), rng.randint(1, 80)) for _ in range(rng.randint(2, 20))]
+
+def make(workload, quantum=7, policy="rr", io=None, **checkpoints):
+    scheduler = RoundRobinScheduler(quantum=quantum, policy=make_policy(policy), io_model=make_io_model(io))
+    if checkpoints:
+        scheduler.enable_checkpoints(**checkpoints)
+    procs = [Process(pid, arrival, burst) for pid, (arrival, burst) in enumerate(workload, 1)]
+    for proc in procs:
+        scheduler.add_process(proc)
+    return scheduler, procs
+
+def state(scheduler, procs):
+    """Estado observable en el instante actual (el historial, recortado a él)."""
+    if scheduler.history_ahead:
+        scheduler.truncate_history_to_present()
+    return (scheduler.time, scheduler.context_switches, scheduler.history.columns(),
+            [(p.pid, scheduler.state_of(p.pid), p.remaining, p.start_time, p.completion_time) for p in procs])
+
+def straight(workload, t, **options):
+    scheduler, procs = make(workload, **options)
+    while scheduler.time < t and scheduler.advance_to_next_event(until=t):
+        pass
+    return state(scheduler, procs)
+
+@pytest.mark.parametrize("policy, io", [("rr", None), ("mlfq:boost_interval=100", None), ("vrr", "every=5,wait=12")])
+@pytest.mark.parametrize("seed", range(5))
+def test_seek_backward_and_forward_match_straight_run(policy, io, seed):
+    rng = random.Random(seed)
+    workload = random_workload(rng)
+    options = dict(policy=policy, io=io)
+    scheduler, procs = make(workload, spacing=rng.choice((1, 3, 10)), **options)
+    scheduler.run_until_done(mode="event")
+    end = scheduler.time
+    targets = [rng.randint(0, end) for _ in range(8)]
+    for t in targets: # Hacia atrás y hacia delante
+        reached = scheduler.seek(t)
+        assert reached >= t
+        assert state(scheduler, procs) == straight(workload, reached, **options)
+    # El historial se conserva tras retroceder: volver al final reproduce la ejecución completa
+    scheduler, procs = make(workload, spacing=4, **options)
+    scheduler.run_until_done(mode="event")
+    final = state(scheduler, procs)
+    for t in sorted(targets, reverse=True):
+        scheduler.seek(t)
+    scheduler.seek(end)
+    assert state(scheduler, procs) == final
+
+@pytest.mark.parametrize("seed", range(5))
+def test_each_seek_matches_straight_run(seed):
+    rng = random.Random(100 + seed)
+    workload = random_workload(rng)
+    scheduler, procs = make(workload, spacing=2)
+    scheduler.run_until_done(mode="event")
+    for t in [rng.randint(0, scheduler.time) for _ in range(5)]:
+        scheduler, procs = make(workload, spacing=2)
+        scheduler.run_until_done(mode="event")
+        reached = scheduler.seek(t)
+        assert state(scheduler, procs) == straight(workload, reached)
+        # Y, desde ahí, la simulación continúa igual que la ejecución directa
+        scheduler.run_until_done(mode="event")
+        assert state(scheduler, procs) == straight(workload, float("inf"))
+
+def test_seek_past_the_end_stops_at_completion():
+    workload = [(0, 30), (5, 12), (60, 8)]
+    scheduler, procs = make(workload, spacing=1)
+    reached = scheduler.seek(10_000)
+    assert scheduler.is_done()
+    assert state(scheduler, procs) == straight(workload, reached)
+    assert reached == max(p.completion_time for p in procs)
+
+def test_seek_backward_without_checkpoints_is_rejected():
+    scheduler, _ = make([(0, 30)])
+    scheduler.run_until_done(mode="event")
+    with pytest.raises(ValueError):
+        scheduler.seek(5)
+
+def test_seek_after_thinning():
+    rng = random.Random(7)
+    workload = random_workload(rng)
+    # Presupuesto diminuto: cada instantánea nueva obliga a aclarar el índice
+    scheduler, procs = make(workload, spacing=1, memory_budget=1)
+    scheduler.run_until_done(mode="event")
+    index = scheduler.checkpoints
+    assert index.spacing > 1 and len(index) <= 3
+    for t in (scheduler.time // 3, scheduler.time // 2, 1):
+        reached = scheduler.seek(t)
+        assert state(scheduler, procs) == straight(workload, reached)
+
+def test_seek_after_discard_after():
+    rng = random.Random(11)
+    workload = random_workload(rng)
+    scheduler, procs = make(workload, spacing=1)
+    scheduler.run_until_done(mode="event")
+    end = scheduler.time
+    index = scheduler.checkpoints
+    index.discard_after(end // 2)
+    assert index.nearest_before(end)[0] <= end // 2
+    for t in (end - 1, end // 4, 3 * end // 4):
+        reached = scheduler.seek(t)
+        assert state(scheduler, procs) == straight(workload, reached)
+
+def test_checkpoint_index_thin_and_discard():
+    index = CheckpointIndex(memory_budget=10**9, spacing=1)
+    index._times, index._blobs = list(range(0, 100, 10)), [b"x" * 4] * 10
+    index.nbytes = 40
+    index._thin()
+    assert index._times == [0, 20, 40, 60, 80] and index.nbytes == 20 and index.spacing == 2
+    index.discard_after(40)
+    assert index._times == [0, 20, 40] and index.nbytes == 12
+    assert index.nearest_before(39)[0] == 20 and index.nearest_before(-1) is None
+    assert index.first()[0] == 0
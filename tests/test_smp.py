@@ -0,0 +1,32 @@
+# tests/test_smp.py
+"""Planificador multinúcleo: motores equivalentes y validación del modo."""
+import random
+
+import pytest
+
+from models.scheduler import Process
+from models.smp import QUEUES_GLOBAL, QUEUES_PER_CORE, SMPScheduler
+
+def run(mode: str, workload, queues: str):
+    scheduler = SMPScheduler(cores=3, quantum=15, queues=queues, migration_cost=2)
+    for pid, (arrival, burst) in enumerate(workload, 1):
+        scheduler.add_process(Process(pid, arrival, burst))
+    scheduler.run_until_done(mode=mode)
+    finished = sorted((p.pid, p.start_time, p.completion_time) for p in scheduler.finished)
+    return [list(h) for h in scheduler.histories], finished, scheduler.metrics()
+
+@pytest.mark.parametrize("queues", [QUEUES_GLOBAL, QUEUES_PER_CORE])
+@pytest.mark.parametrize("seed", range(6))
+def test_engines_match(queues, seed):
+    rng = random.Random(seed)
+    workload = [(rng.randint(0, 300), rng.randint(1, 90)) for _ in range(rng.randint(1, 25))]
+    expected = run("tick", workload, queues)
+    assert run("event", workload, queues) == expected
+    assert run("analytic", workload, queues) == expected
+
+def test_unknown_mode_is_rejected():
+    scheduler = SMPScheduler(cores=2)
+    scheduler.add_process(Process(1, 0, 10))
+    with pytest.raises(ValueError):
+        scheduler.run_until_done(mode="warp")
+    assert scheduler.time == 0
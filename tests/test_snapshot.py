@@ -0,0 +1,140 @@
+# tests/test_snapshot.py
+"""Códec de las instantáneas (models/snapshot.py) y reanudación desde ellas."""
+import os
+import struct
+import zlib
+from array import array
+
+import pytest
+
+from models import snapshot as codec
+from models.history import ExecutionHistory
+from models.io_model import make_io_model
+from models.overhead import make_switch_cost
+from models.policies import make_policy
+from models.scheduler import Process, RoundRobinScheduler
+from models.snapshot import decode_snapshot, encode_snapshot, read_checkpoint, write_checkpoint
+
+WORKLOAD = [(0, 35), (3, 12), (8, 50), (8, 20), (40, 9), (90, 30)]
+
+def make(policy="rr", switch_cost=None, io=None, quantum=10):
+    scheduler = RoundRobinScheduler(quantum=quantum, policy=make_policy(policy), history=ExecutionHistory(merge=False),
+                                    switch_cost=make_switch_cost(switch_cost), io_model=make_io_model(io))
+    for pid, (arrival, burst) in enumerate(WORKLOAD, 1):
+        scheduler.add_process(Process(pid, arrival, burst))
+    return scheduler
+
+def advance(scheduler, t):
+    while scheduler.time < t and scheduler.advance_to_next_event(until=t):
+        pass
+
+def outcome(scheduler):
+    return (list(scheduler.history), [(p.pid, p.start_time, p.completion_time) for p in scheduler.finished],
+            scheduler.context_switches, scheduler.metrics())
+
+def encode_old(state, version):
+    """Codifica el estado con el formato de una versión anterior."""
+    scalar_fields, array_fields = {
+        1: (codec._SCALAR_FIELDS_V1, codec._ARRAY_FIELDS_V1),
+        2: (codec._SCALAR_FIELDS_V2, codec._ARRAY_FIELDS_V2),
+        3: (codec._SCALAR_FIELDS_V3, codec._ARRAY_FIELDS_V3),
+    }[version]
+    parts = [struct.pack("<" + "q" * len(scalar_fields), *(state[name] for name in scalar_fields)),
+             codec._STATS.pack(False, 0, 0, 0, 0, 0, 0, 0.0, 0.0)]
+    for name in array_fields:
+        data = codec._to_bytes(state[name])
+        parts += [codec._LENGTH.pack(len(data)), data]
+    return codec._HEADER.pack(codec.SNAPSHOT_MAGIC, version) + zlib.compress(b"".join(parts))
+
+@pytest.mark.parametrize("options", [{}, {"policy": "mlfq", "switch_cost": "latency=1,cache=5,window=20"},
+                                     {"policy": "vrr", "io": "every=4,wait=7,pids=1/3"}])
+def test_encode_decode_round_trip(options):
+    scheduler = make(**options)
+    advance(scheduler, 47)
+    state = decode_snapshot(scheduler.snapshot())
+    assert decode_snapshot(encode_snapshot(state)) == state
+    assert state["time"] == 47 and state["policy_id"] != 0
+
+@pytest.mark.parametrize("version", [1, 2, 3])
+def test_older_versions_still_restore(version):
+    expected = make()
+    expected.run_until_done(mode="event")
+    scheduler = make()
+    advance(scheduler, 47)
+    blob = encode_old(decode_snapshot(scheduler.snapshot()), version)
+    assert struct.unpack_from("<I", blob, len(codec.SNAPSHOT_MAGIC))[0] == version
+    state = decode_snapshot(blob)
+    assert ("policy_id" in state) == (version >= 2) and ("stall" in state) == (version >= 3)
+    assert "io_every" not in state
+    restored = make()
+    restored.restore(blob)
+    restored.run_until_done(mode="event")
+    assert outcome(restored) == outcome(expected)
+
+def corrupt_blobs():
+    scheduler = make()
+    advance(scheduler, 20)
+    blob = scheduler.snapshot()
+    header = codec._HEADER.size
+    body = zlib.decompress(blob[header:])
+    return {
+        "vacío": b"",
+        "cabecera truncada": blob[:header - 1],
+        "magia": b"NOTASNAP" + blob[8:],
+        "versión": codec._HEADER.pack(codec.SNAPSHOT_MAGIC, 99) + blob[header:],
+        "zlib truncado": blob[:len(blob) // 2],
+        "zlib corrupto": blob[:header] + bytes(b ^ 0xFF for b in blob[header:]),
+        "cuerpo truncado": blob[:header] + zlib.compress(body[:40]),
+        "sección truncada": blob[:header] + zlib.compress(body[:-3]),
+    }
+
+@pytest.mark.parametrize("name", list(corrupt_blobs()))
+def test_corrupt_or_truncated_blob_raises_value_error(name):
+    blob = corrupt_blobs()[name]
+    with pytest.raises(ValueError):
+        decode_snapshot(blob)
+    with pytest.raises(ValueError):
+        make().restore(blob)
+
+def test_write_checkpoint_replaces_atomically(tmp_path, monkeypatch):
+    path = str(tmp_path / "run.snap")
+    write_checkpoint(path, b"first")
+    write_checkpoint(path, b"second")
+    assert read_checkpoint(path) == b"second"
+    assert os.listdir(tmp_path) == ["run.snap"]
+
+    def crash(src, dst):
+        raise OSError("caída simulada antes de sustituir el fichero")
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(OSError):
+        write_checkpoint(path, b"third")
+    assert read_checkpoint(path) == b"second" # El punto de control anterior sigue intacto
+
+@pytest.mark.parametrize("options", [{}, {"policy": "wrr:weights=1:3/2:2", "switch_cost": "2"},
+                                     {"policy": "mlfq:boost_interval=40", "io": "every=6,wait=9"},
+                                     {"policy": "srtf", "switch_cost": "latency=1,cache=8,window=30"}])
+@pytest.mark.parametrize("t", [1, 33, 95, 160])
+def test_restored_run_continues_like_uninterrupted(tmp_path, options, t):
+    expected = make(**options)
+    expected.run_until_done(mode="event")
+    scheduler = make(**options)
+    advance(scheduler, t)
+    path = str(tmp_path / "run.snap")
+    scheduler.checkpoint(path)
+    # Planificador nuevo con la misma carga: los procesos se emparejan por PID
+    restored = make(**options)
+    restored.restore(read_checkpoint(path))
+    assert restored.time == scheduler.time
+    restored.run_until_done(mode="tick")
+    assert outcome(restored) == outcome(expected)
+
+def test_snapshot_without_history_needs_the_history():
+    scheduler = make()
+    advance(scheduler, 60)
+    blob = scheduler.snapshot(include_history=False)
+    with pytest.raises(ValueError):
+        make().restore(blob)
+    advance(scheduler, 120)
+    scheduler.restore(blob) # Mismo planificador: el historial contiene el cursor
+    assert scheduler.time == 60 and scheduler.history_ahead
+    assert decode_snapshot(blob)["history_pid"] == array("q")
@@ -0,0 +1,30 @@
+# tests/test_sweep.py
+"""El barrido de quantums ('sweep_quantum') da las mismas métricas que 'run_workload' con cada quantum."""
+from array import array
+
+import pytest
+
+from models.process_table import ProcessTable
+from models.run_cache import RunCache
+from models.sweep import run_workload, sweep_quantum
+
+def table():
+    # PIDs no consecutivos: la política ponderada decide según ellos
+    return ProcessTable.from_columns(array("q", [0, 1, 2]), array("q", [20, 9, 14]), pid=array("q", [10, 20, 30]))
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("policy, io", [("wrr:weights=10:5", None), ("rr", "every=3,wait=4,pids=20")])
+def test_sweep_keeps_pids(workers, policy, io):
+    quanta = [2, 5]
+    rows = sweep_quantum(table(), quanta, workers=workers, policy=policy, io=io)
+    for q, row in zip(quanta, rows):
+        expected = run_workload(table(), q, policy=policy, io=io).metrics()
+        assert row == {"quantum": q, **expected}
+
+def test_sweep_cache_hits_match_run_workload():
+    cache = RunCache()
+    first = sweep_quantum(table(), [2], workers=1, policy="wrr:weights=10:5", cache=cache)
+    scheduler = run_workload(table(), 2, policy="wrr:weights=10:5", cache=cache)
+    assert cache.hits == 1
+    assert first == [{"quantum": 2, **scheduler.metrics()}]
+    assert [p.pid for p in scheduler.finished] == [p.pid for p in run_workload(table(), 2, policy="wrr:weights=10:5").finished]
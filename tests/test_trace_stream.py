@@ -0,0 +1,111 @@
+# tests/test_trace_stream.py
+"""
+Simulación de trazas en streaming (.rrb y .csv): mismo resultado que la carga en
+memoria, y '--checkpoint' / '--resume' continúan la traza donde se quedó.
+"""
+import csv
+import json
+import random
+
+import pytest
+
+from models.cli import main
+from models.history import ExecutionHistory
+from models.scheduler import RoundRobinScheduler
+from models.snapshot import decode_snapshot, read_checkpoint
+from models.traces import iter_trace, read_workload, write_binary_trace
+
+def workload(seed=3, count=400):
+    rng = random.Random(seed)
+    arrivals = sorted(rng.randint(0, 20 * count) for _ in range(count))
+    return [(arrival, rng.randint(1, 60)) for arrival in arrivals]
+
+@pytest.fixture(params=[".rrb", ".csv"])
+def trace(request, tmp_path):
+    path = str(tmp_path / f"trace{request.param}")
+    pairs = workload()
+    if request.param == ".rrb":
+        write_binary_trace(path, pairs)
+    else:
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["arrival", "burst"])
+            writer.writerows(pairs)
+    return path
+
+def in_memory(path):
+    scheduler = RoundRobinScheduler(quantum=15)
+    scheduler.load_table(read_workload(path))
+    scheduler.run_until_done(mode="event")
+    return scheduler
+
+def streamed(path):
+    scheduler = RoundRobinScheduler(quantum=15)
+    scheduler.attach_arrival_stream(iter_trace(path), keep_finished=False)
+    return scheduler
+
+def common(metrics, expected):
+    """Las métricas en streaming no incluyen percentiles y pueden diferir en el último decimal."""
+    return metrics == pytest.approx({key: expected[key] for key in metrics})
+
+@pytest.mark.parametrize("engine", ["tick", "event", "analytic"])
+def test_streamed_trace_matches_in_memory(trace, engine):
+    expected = in_memory(trace)
+    scheduler = streamed(trace)
+    scheduler.run_until_done(mode=engine)
+    assert list(scheduler.history) == list(expected.history)
+    assert scheduler.context_switches == expected.context_switches
+    assert scheduler.future.consumed == len(workload())
+    assert common(scheduler.metrics(), expected.metrics())
+
+def test_streamed_snapshot_resumes_mid_trace(trace, tmp_path):
+    expected = streamed(trace)
+    expected.run_until_done(mode="event")
+    for t in (1, 777, 4000):
+        scheduler = streamed(trace)
+        while scheduler.time < t and scheduler.advance_to_next_event(until=t):
+            pass
+        path = str(tmp_path / "run.snap")
+        scheduler.checkpoint(path)
+        state = decode_snapshot(read_checkpoint(path))
+        assert state["has_source"] and 0 < state["consumed"] < len(workload())
+        restored = RoundRobinScheduler(quantum=15)
+        with pytest.raises(ValueError):
+            restored.restore(read_checkpoint(path)) # La traza debe reabrirse
+        restored.restore(read_checkpoint(path), reopen_stream=lambda skip: iter_trace(trace, skip=skip))
+        restored.run_until_done(mode="event")
+        assert list(restored.history) == list(expected.history)
+        assert restored.metrics() == expected.metrics()
+
+def run_cli(trace, tmp_path, label, *extra):
+    metrics_out = tmp_path / f"{label}-metrics.json"
+    history_out = tmp_path / f"{label}-history.json"
+    assert main([trace, "--stream", "--quantum", "15", "--engine", "event", "--metrics-out", str(metrics_out),
+                 "--history-out", str(history_out), *extra]) == 0
+    return json.loads(metrics_out.read_text()), json.loads(history_out.read_text())
+
+def test_cli_stream_matches_in_memory(trace, tmp_path):
+    stream_metrics, stream_history = run_cli(trace, tmp_path, "stream")
+    assert main([trace, "--quantum", "15", "--engine", "event", "--metrics-out", str(tmp_path / "memory.json"),
+                 "--history-out", str(tmp_path / "memory-history.json")]) == 0
+    assert stream_history == json.loads((tmp_path / "memory-history.json").read_text())
+    assert common(stream_metrics, json.loads((tmp_path / "memory.json").read_text()))
+
+def test_cli_checkpoint_and_resume(trace, tmp_path):
+    expected_metrics, _ = run_cli(trace, tmp_path, "full")
+    # '--checkpoint' deja al terminar un punto de control de la traza completa
+    checkpoint = str(tmp_path / "final.snap")
+    metrics, _ = run_cli(trace, tmp_path, "checkpointed", "--checkpoint", checkpoint)
+    assert metrics == expected_metrics
+    assert decode_snapshot(read_checkpoint(checkpoint))["consumed"] == len(workload())
+    # Punto de control a mitad de traza, con el mismo historial que usa la CLI, y '--resume'
+    scheduler = RoundRobinScheduler(quantum=15, history=ExecutionHistory(max_bursts=0))
+    scheduler.attach_arrival_stream(iter_trace(trace), keep_finished=False)
+    while scheduler.time < 3000 and scheduler.advance_to_next_event(until=3000):
+        pass
+    middle = str(tmp_path / "middle.snap")
+    scheduler.checkpoint(middle)
+    metrics_out = tmp_path / "resumed.json"
+    assert main([trace, "--stream", "--quantum", "15", "--engine", "event", "--resume", middle,
+                 "--metrics-out", str(metrics_out)]) == 0
+    assert json.loads(metrics_out.read_text()) == expected_metrics
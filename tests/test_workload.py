@@ -0,0 +1,108 @@
+# tests/test_workload.py
+"""Generador de cargas sintéticas: reproducibilidad, distribuciones pedidas y validación."""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from models.workload import ARRIVAL_PATTERNS, BURST_DISTRIBUTIONS, generate, iter_pairs, make_workload, parse_spec
+
+COUNT = 20000
+
+@pytest.mark.parametrize("arrival", ARRIVAL_PATTERNS)
+@pytest.mark.parametrize("burst", BURST_DISTRIBUTIONS)
+def test_same_seed_gives_same_workload(arrival, burst):
+    a = generate(2000, seed=7, arrival=arrival, burst=burst)
+    b = generate(2000, seed=7, arrival=arrival, burst=burst)
+    assert np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1])
+    c = generate(2000, seed=8, arrival=arrival, burst=burst)
+    assert not np.array_equal(a[1], c[1])
+
+@pytest.mark.parametrize("arrival", ARRIVAL_PATTERNS)
+def test_columns_are_sorted_discrete_and_start_at_zero(arrival):
+    arrivals, bursts = generate(3000, seed=3, arrival=arrival, burst="pareto", alpha=1.5)
+    assert arrivals.dtype == np.int64 and bursts.dtype == np.int64
+    assert len(arrivals) == len(bursts) == 3000
+    assert arrivals[0] == 0 and np.all(np.diff(arrivals) >= 0)
+    assert bursts.min() >= 1
+
+@pytest.mark.parametrize("burst", BURST_DISTRIBUTIONS)
+def test_burst_mean_matches_request(burst):
+    _, bursts = generate(COUNT, seed=11, burst=burst, mean=300)
+    # Pareto (alpha=2.5) tiene varianza finita, pero converge más despacio
+    assert bursts.mean() == pytest.approx(300, rel=0.1)
+
+@pytest.mark.parametrize("arrival", ARRIVAL_PATTERNS)
+def test_arrival_rate_follows_target_load(arrival):
+    # Las ráfagas de llegadas tienen mucha varianza: hace falta una muestra mayor
+    count = 10 * COUNT
+    arrivals, _ = generate(count, seed=5, arrival=arrival, mean=100, load=0.5)
+    # Carga 0.5 con ráfaga media 100: una llegada cada 200 unidades de media
+    assert arrivals[-1] / (count - 1) == pytest.approx(200, rel=0.05)
+
+def test_explicit_rate_overrides_load():
+    arrivals, _ = generate(COUNT, seed=5, rate=0.1, load=0.9)
+    assert arrivals[-1] / (COUNT - 1) == pytest.approx(10, rel=0.05)
+
+def test_bursty_arrivals_are_clustered():
+    poisson, _ = generate(COUNT, seed=2, arrival="poisson")
+    bursty, _ = generate(COUNT, seed=2, arrival="bursty", cluster=50, intensity=20)
+    def dispersion(times):
+        gaps = np.diff(times).astype(float)
+        return gaps.std() / gaps.mean()
+    # Exponencial: coeficiente de variación 1; las ráfagas lo disparan
+    assert dispersion(poisson) == pytest.approx(1, abs=0.1)
+    assert dispersion(bursty) > 2
+
+def test_pareto_has_heavier_tail_than_exponential():
+    _, exponential = generate(COUNT, seed=4, burst="exponential")
+    _, pareto = generate(COUNT, seed=4, burst="pareto", alpha=1.5)
+    assert pareto.max() > 5 * exponential.max()
+    # El mínimo de la Pareto es mean * (alpha - 1) / alpha
+    assert pareto.min() == round(200 * 0.5 / 1.5)
+
+def test_bimodal_long_fraction():
+    _, bursts = generate(COUNT, seed=6, burst="bimodal", mean=200, long_fraction=0.1, short_ratio=0.25)
+    # Cortos de media 50 y largos de media 1550: la frontera en 500 separa los dos modos
+    assert (bursts > 500).mean() == pytest.approx(0.1, abs=0.02)
+
+def test_empty_workload():
+    arrivals, bursts = generate(0)
+    assert len(arrivals) == len(bursts) == 0
+
+@pytest.mark.parametrize("options", [
+    {"count": -1},
+    {"mean": 0.5},
+    {"load": 0},
+    {"rate": -1},
+    {"arrival": "uniform"},
+    {"burst": "normal"},
+    {"arrival": "bursty", "cluster": 0.5},
+    {"arrival": "bursty", "intensity": 0},
+    {"arrival": "diurnal", "amplitude": 1.5},
+    {"burst": "pareto", "alpha": 1},
+    {"burst": "bimodal", "long_fraction": 1},
+    {"burst": "bimodal", "short_ratio": 0},
+    {"unknown": 1},
+])
+def test_invalid_options_are_rejected(options):
+    options = {"count": 100, **options}
+    with pytest.raises(ValueError):
+        generate(**options)
+
+def test_parse_spec():
+    assert parse_spec("count=100, arrival=Bursty,burst=pareto,alpha=1.8,seed=7,") == {
+        "count": 100, "arrival": "bursty", "burst": "pareto", "alpha": 1.8, "seed": 7}
+    assert parse_spec("") == {}
+
+@pytest.mark.parametrize("spec", ["count", "size=10", "mean=abc"])
+def test_parse_spec_rejects_invalid_items(spec):
+    with pytest.raises(ValueError):
+        parse_spec(spec)
+
+def test_make_workload_builds_table_with_sequential_pids():
+    table = make_workload("count=500,seed=9,burst=lognormal")
+    arrivals, bursts = generate(500, seed=9, burst="lognormal")
+    assert len(table) == 500
+    assert list(table.pid) == list(range(1, 501))
+    assert list(table.arrival) == arrivals.tolist() and list(table.burst) == bursts.tolist()
+    assert list(iter_pairs(arrivals, bursts)) == list(zip(arrivals.tolist(), bursts.tolist()))
@@ -1,20 +1,27 @@
 # views/tkinter_view.py
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from typing import List, Optional, Tuple, Any, Dict
+from typing import List, Optional, Tuple, Any, Dict, Iterable
+from bisect import bisect_left
 import math
 
 # Asumiendo que los modelos se importan correctamente desde el directorio padre
 # Si ejecutas este archivo directamente, es posible que necesites ajustes
 from models.scheduler import Process # <-- Añadido esta importación
+from models.scheduler import STATE_FUTURE, STATE_READY, STATE_RUNNING, STATE_FINISHED
+from models.history import OVERHEAD_PID
+from models.workload import ARRIVAL_PATTERNS, BURST_DISTRIBUTIONS, DEFAULTS as WORKLOAD_DEFAULTS
 
 class RRViewInterface:
     """Interfaz que define los métodos que el Presentador puede llamar en la Vista."""
     def get_quantum(self) -> int: raise NotImplementedError
+    def get_cores(self) -> int: raise NotImplementedError
+    def get_per_core_queues(self) -> bool: raise NotImplementedError
     def get_ticks_per_second(self) -> int: raise NotImplementedError
     def get_arrival_burst(self) -> Tuple[int, int]: raise NotImplementedError # Or handle errors differently
     def get_selected_pid(self) -> Optional[int]: raise NotImplementedError
     def get_new_arrival_burst(self, pid: int, old_arrival: int, old_burst: int) -> Optional[Tuple[int, int]]: raise NotImplementedError
+    def get_generate_options(self) -> Optional[Dict[str, Any]]: raise NotImplementedError
     def get_gantt_zoom(self) -> int: raise NotImplementedError
     def get_canvas_time_scale_base(self) -> float: raise NotImplementedError
 
@@ -28,15 +35,22 @@ class RRViewInterface:
     def ask_string(self, title: str, prompt: str, initialvalue: str = "") -> Optional[str]: raise NotImplementedError
 
     def refresh_process_table(self, processes: Dict[int, Process], scheduler_state: Any): raise NotImplementedError # Pass necessary state
-    def update_queues_display(self, time: int, current_pid: Optional[int], ready_pids: List[int]): raise NotImplementedError
+    def update_queues_display(self, time: int, current_pid: Optional[int], ready_pids: List[int],
+                              running: Optional[List[Optional[int]]] = None): raise NotImplementedError
     def update_metrics_display(self, metrics: Dict[str, Any]): raise NotImplementedError
+    def update_speed_display(self, target: float, achieved: float): raise NotImplementedError
     def log_message(self, message: str): raise NotImplementedError
+    def show_stats(self, text: Optional[str]): raise NotImplementedError # None oculta el panel
+    def instrument(self, instrumentation): raise NotImplementedError # Medir las llamadas a Tk (ver models/instrumentation.py)
 
     def draw_static_gantt(self, time: int, scale: float): raise NotImplementedError
-    def draw_execution_burst(self, pid: Optional[int], start_time: int, duration: int, scale: float): raise NotImplementedError
+    def draw_execution_burst(self, pid: Optional[int], start_time: int, duration: int, scale: float, lane: int = 0): raise NotImplementedError
     def update_gantt_time_line(self, time: int, scale: float): raise NotImplementedError
     def clear_gantt(self): raise NotImplementedError
-    def redraw_gantt_bursts(self, history: List[Tuple[Optional[int], int, int]], scale: float): raise NotImplementedError
+    def set_gantt_history(self, history): raise NotImplementedError # Un historial o una lista (un carril por núcleo)
+    def redraw_gantt_bursts(self, history: Iterable[Tuple[Optional[int], int, int]], scale: float): raise NotImplementedError
+    def set_timeline(self, time: int, horizon: int): raise NotImplementedError
+    def get_seek_time(self) -> int: raise NotImplementedError
 
     def toggle_full_gantt_view(self, gantt_only: bool): raise NotImplementedError # Logic moved to Presenter
 
@@ -49,6 +63,13 @@ class RRApp(tk.Tk, RRViewInterface):
     Esta clase se enfoca solo en la presentación y captura de eventos del usuario.
     La lógica se delega al Presentador.
     """
+    # Píxeles mínimos por ráfaga visible; por debajo, el Gantt se dibuja agregado por columnas
+    LOD_MIN_PX_PER_BURST = 3
+    # Con más procesos que este límite y la simulación en marcha, la tabla se
+    # refresca como mucho una vez cada TABLE_REFRESH_INTERVAL_MS
+    TABLE_LIVE_REFRESH_LIMIT = 500
+    TABLE_REFRESH_INTERVAL_MS = 500
+
     def __init__(self, presenter):
         """Inicializa la ventana principal y todos los componentes de la UI."""
         super().__init__()
@@ -64,13 +85,30 @@ class RRApp(tk.Tk, RRViewInterface):
         self.gantt_only = False
         self.canvas_time_scale = 5.0 # Valor inicial, se actualizará
         self.canvas_time_scale_base = 5.0 # Valor base para zoom
+        # Estado del Gantt virtualizado: solo se dibuja lo visible en la región desplazada
+        self._gantt_history = None # Historial de ráfagas (ExecutionHistory o iterable de tuplas)
+        self._gantt_lanes = 1 # Carriles del Gantt: uno por núcleo
+        self._gantt_time = 0 # Último tiempo dibujado en el encabezado
+        self._gantt_render_pending = False
+        self._gantt_lod = False # True si la región visible se dibuja agregada por columnas de píxel
+        # Estado de la tabla incremental: valores mostrados por PID y PIDs en orden de fila
+        self._table_rows: Dict[int, tuple] = {}
+        self._table_pids: List[int] = []
+        self._table_pending = None # Última petición de refresco (procesos, planificador)
+        self._table_after_id = None
+        self._table_selected_pid = None
 
         # Variables de control de UI
         self.quantum_var = tk.IntVar(value=200)
+        self.cores_var = tk.IntVar(value=1) # Número de CPUs simuladas
+        self.per_core_queues_var = tk.BooleanVar(value=False) # Con varias CPUs: una cola por núcleo
         self.ticks_per_second_var = tk.IntVar(value=100)
         self.arrival_var = tk.IntVar(value=0)
         self.burst_var = tk.IntVar(value=5)
         self.gantt_zoom_var = tk.IntVar(value=10) # 10% inicial
+        self.seek_var = tk.DoubleVar(value=0) # Posición de la línea de tiempo (salto con 'seek')
+        self.stats_var = tk.BooleanVar(value=False) # Instrumentación y panel de estadísticas
+        self.profile_var = tk.BooleanVar(value=False) # Captura con cProfile
 
         # Configurar estilos visuales
         self.setup_styles()
@@ -177,6 +215,11 @@ class RRApp(tk.Tk, RRViewInterface):
         ttk.Label(qf, text="Quantum:", style="TLabel").pack(side=tk.LEFT)
         qspin = ttk.Spinbox(qf, from_=1, to=50, textvariable=self.quantum_var, width=5, command=self.on_set_quantum, style="TSpinbox")
         qspin.pack(side=tk.LEFT, padx=10)
+        ttk.Label(qf, text="CPUs:", style="TLabel").pack(side=tk.LEFT)
+        cspin = ttk.Spinbox(qf, from_=1, to=128, textvariable=self.cores_var, width=4, command=self.on_set_cores, style="TSpinbox")
+        cspin.pack(side=tk.LEFT, padx=10)
+        ttk.Checkbutton(qf, text="Colas por núcleo", variable=self.per_core_queues_var,
+                        command=self.on_set_cores).pack(side=tk.LEFT)
         # Botones de control
         ctrlf = ttk.Frame(left, style="TFrame")
         ctrlf.pack(fill=tk.X, pady=10, padx=5)
@@ -195,16 +238,27 @@ class RRApp(tk.Tk, RRViewInterface):
         vf.pack(fill=tk.X, pady=(5, 5), padx=5)
         ttk.Label(vf, text="Speed:", style="TLabel").pack(side=tk.LEFT)
         self.ticks_per_second_spinbox = ttk.Spinbox(
-            vf, from_=1, to=1000, textvariable=self.ticks_per_second_var,
-            width=6, style="TSpinbox"
+            vf, from_=1, to=1000000, textvariable=self.ticks_per_second_var,
+            width=8, style="TSpinbox"
         )
         self.ticks_per_second_spinbox.pack(side=tk.LEFT, padx=10)
         ttk.Button(vf, text="Set Speed", command=self.on_set_speed, style="TButton").pack(side=tk.LEFT, padx=5)
+        # Velocidad objetivo frente a la realmente alcanzada (unidades simuladas por segundo)
+        self.speed_label = ttk.Label(left, text="Velocidad: -", style="TLabel")
+        self.speed_label.pack(fill=tk.X, padx=5)
+        # Instrumentación: panel de estadísticas sobre el Gantt y captura con cProfile
+        diag = ttk.Frame(left, style="TFrame")
+        diag.pack(fill=tk.X, padx=5, pady=(5, 0))
+        ttk.Checkbutton(diag, text="Estadísticas", variable=self.stats_var,
+                        command=self.on_toggle_stats).pack(side=tk.LEFT)
+        ttk.Checkbutton(diag, text="Perfil (cProfile)", variable=self.profile_var,
+                        command=self.on_toggle_profile).pack(side=tk.LEFT, padx=10)
         # Tabla de Procesos
         table_frame = ttk.LabelFrame(left, text="Procesos", style="TLabelframe")
         table_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=5)
         cols = ("pid", "arrival", "burst", "start", "remaining", "completion", "turnaround", "waiting", "ntat", "status")
         self.tree = ttk.Treeview(table_frame, columns=cols, show="headings", selectmode="browse", height=10, style="Treeview")
+        self._table_columns = cols
         for c in cols:
             self.tree.heading(c, text=c.capitalize())
             if c == "status":
@@ -250,7 +304,9 @@ class RRApp(tk.Tk, RRViewInterface):
         del_btn.pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
         # Botón de ejemplo
         load_btn = ttk.Button(left, text="Load Sample Processes", command=self.on_load_sample, style="TButton")
-        load_btn.pack(fill=tk.X, pady=(0, 10), padx=5)
+        load_btn.pack(fill=tk.X, pady=(0, 5), padx=5)
+        generate_btn = ttk.Button(left, text="Generate Workload...", command=self.on_generate, style="TButton")
+        generate_btn.pack(fill=tk.X, pady=(0, 10), padx=5)
         # --- PANEL DERECHO ---
         right = ttk.Frame(main_frame, style="Panel.TFrame")
         right.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=0, pady=0, ipadx=5, ipady=5)
@@ -271,11 +327,26 @@ class RRApp(tk.Tk, RRViewInterface):
         self.gantt_zoom_spinbox.pack(side=tk.LEFT, padx=5)
         ttk.Button(zoom_frame, text="Aplicar", command=self.on_set_gantt_zoom, style="TButton").pack(side=tk.LEFT, padx=5)
         self.canvas = tk.Canvas(gantt_container, bg=self.panel_bg, height=200, highlightthickness=0)
-        gantt_h_scroll = ttk.Scrollbar(gantt_container, orient=tk.HORIZONTAL, command=self.canvas.xview, style="Horizontal.TScrollbar")
+        gantt_h_scroll = ttk.Scrollbar(gantt_container, orient=tk.HORIZONTAL, command=self.on_gantt_scroll, style="Horizontal.TScrollbar")
         self.canvas.configure(xscrollcommand=gantt_h_scroll.set)
         self.canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         gantt_h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        # Línea de tiempo: arrastrar y soltar salta a ese instante de la simulación
+        timeline_frame = ttk.Frame(gantt_frame, style="TFrame")
+        timeline_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
+        ttk.Label(timeline_frame, text="Ir a t:", style="TLabel").pack(side=tk.LEFT)
+        self.timeline_scale = ttk.Scale(timeline_frame, from_=0, to=1, orient=tk.HORIZONTAL,
+                                        variable=self.seek_var, command=self.on_timeline_drag)
+        self.timeline_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.timeline_scale.bind('<ButtonRelease-1>', self.on_seek)
+        self.timeline_label = ttk.Label(timeline_frame, text="0 / 0", width=18, style="TLabel")
+        self.timeline_label.pack(side=tk.LEFT)
+        self._timeline_horizon = 0
         self.canvas.bind('<Double-1>', self.toggle_gantt_view) # Toggle vista solo Gantt
+        # Panel de estadísticas superpuesto al Gantt (se muestra con 'show_stats')
+        self.stats_overlay = tk.Label(gantt_frame, font=("Consolas", 8), justify=tk.LEFT, anchor=tk.NW,
+                                      bg="#263238", fg="#eceff1", padx=6, pady=4)
+        self.canvas.bind('<Configure>', lambda e: self.request_gantt_render()) # Redibujar al redimensionar
         # Estado Actual
         queues_frame = ttk.LabelFrame(right, text="Estado Actual", style="TLabelframe")
         queues_frame.pack(fill=tk.X, pady=5, padx=5)
@@ -323,6 +394,11 @@ class RRApp(tk.Tk, RRViewInterface):
             else:
                 self.tree.item(child, tags=('oddrow',))
 
+    def on_gantt_scroll(self, *args):
+        """Desplaza el Gantt y redibuja el contenido de la nueva región visible."""
+        self.canvas.xview(*args)
+        self.request_gantt_render()
+
     def toggle_gantt_view(self, event=None):
         """
         Alterna entre la vista completa (panel izquierdo + Gantt + métricas + log)
@@ -361,10 +437,26 @@ class RRApp(tk.Tk, RRViewInterface):
         """Maneja el evento de cambio de quantum."""
         self.presenter.handle_set_quantum()
 
+    def on_set_cores(self):
+        """Maneja el cambio del número de CPUs o de la variante de colas."""
+        self.presenter.handle_set_cores()
+
     def on_load_sample(self):
         """Maneja el evento de cargar procesos de ejemplo."""
         self.presenter.handle_load_sample()
 
+    def on_generate(self):
+        """Maneja el evento de generar una carga de trabajo sintética."""
+        self.presenter.handle_generate_workload()
+
+    def on_toggle_stats(self):
+        """Activa o desactiva la instrumentación y su panel."""
+        self.presenter.handle_toggle_instrumentation(self.stats_var.get())
+
+    def on_toggle_profile(self):
+        """Inicia o detiene la captura con cProfile."""
+        self.presenter.handle_toggle_profile(self.profile_var.get())
+
     def on_start(self):
         """Inicia la simulación en modo automático."""
         self.presenter.handle_start()
@@ -377,6 +469,14 @@ class RRApp(tk.Tk, RRViewInterface):
         """Ejecuta un paso de la simulación en modo manual."""
         self.presenter.handle_step()
 
+    def on_timeline_drag(self, value):
+        """Muestra el instante bajo el cursor mientras se arrastra la línea de tiempo."""
+        self.timeline_label.config(text=f"{int(float(value))} / {self._timeline_horizon}")
+
+    def on_seek(self, event=None):
+        """Salta al instante seleccionado en la línea de tiempo al soltarla."""
+        self.presenter.handle_seek()
+
     def on_reset(self):
         """Reinicia la simulación."""
         self.presenter.handle_reset()
@@ -396,6 +496,12 @@ class RRApp(tk.Tk, RRViewInterface):
     def get_quantum(self) -> int:
         return self.quantum_var.get()
 
+    def get_cores(self) -> int:
+        return self.cores_var.get()
+
+    def get_per_core_queues(self) -> bool:
+        return self.per_core_queues_var.get()
+
     def get_ticks_per_second(self) -> int:
         return self.ticks_per_second_var.get()
 
@@ -435,12 +541,68 @@ class RRApp(tk.Tk, RRViewInterface):
                 messagebox.showerror("Error de Entrada", "Por favor, introduce un número entero positivo para Burst Time.")
         return new_arr, new_burst
 
+    def get_generate_options(self) -> Optional[Dict[str, Any]]:
+        """
+        Diálogo modal con los parámetros de la carga sintética (ver 'models.workload.generate').
+        Returns:
+            dict: Opciones para 'generate', o None si se cancela.
+        """
+        dialog = tk.Toplevel(self)
+        dialog.title("Generar carga de trabajo")
+        dialog.transient(self)
+        dialog.resizable(False, False)
+        fields = {
+            "count": tk.StringVar(value="200"),
+            "seed": tk.StringVar(value=str(WORKLOAD_DEFAULTS["seed"])),
+            "arrival": tk.StringVar(value=WORKLOAD_DEFAULTS["arrival"]),
+            "burst": tk.StringVar(value=WORKLOAD_DEFAULTS["burst"]),
+            "mean": tk.StringVar(value=f"{WORKLOAD_DEFAULTS['mean']:g}"),
+            "load": tk.StringVar(value=f"{WORKLOAD_DEFAULTS['load']:g}"),
+        }
+        labels = {"count": "Procesos:", "seed": "Semilla:", "arrival": "Llegadas:",
+                  "burst": "Ráfagas:", "mean": "Ráfaga media:", "load": "Carga (ρ):"}
+        choices = {"arrival": ARRIVAL_PATTERNS, "burst": BURST_DISTRIBUTIONS}
+        for row, (key, var) in enumerate(fields.items()):
+            ttk.Label(dialog, text=labels[key], width=14, anchor=tk.W).grid(row=row, column=0, padx=10, pady=3, sticky=tk.W)
+            if key in choices:
+                widget = ttk.Combobox(dialog, textvariable=var, values=choices[key], state="readonly", width=14)
+            else:
+                widget = ttk.Entry(dialog, textvariable=var, width=16)
+            widget.grid(row=row, column=1, padx=10, pady=3)
+        result: Dict[str, Any] = {}
+
+        def accept():
+            try:
+                options = {key: var.get() for key, var in fields.items()}
+                options["count"], options["seed"] = int(options["count"]), int(options["seed"])
+                options["mean"], options["load"] = float(options["mean"]), float(options["load"])
+                if options["count"] <= 0 or options["mean"] < 1 or not 0 < options["load"]:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Error de Entrada", "Procesos debe ser un entero positivo, la ráfaga media al menos 1 y la carga positiva.", parent=dialog)
+                return
+            result.update(options)
+            dialog.destroy()
+
+        buttons = ttk.Frame(dialog)
+        buttons.grid(row=len(fields), column=0, columnspan=2, pady=(5, 10))
+        ttk.Button(buttons, text="Generate", command=accept).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        dialog.bind("<Return>", lambda event: accept())
+        dialog.bind("<Escape>", lambda event: dialog.destroy())
+        dialog.grab_set()
+        self.wait_window(dialog)
+        return result or None
+
     def get_gantt_zoom(self) -> int:
         return self.gantt_zoom_var.get()
 
     def get_canvas_time_scale_base(self) -> float:
         return self.canvas_time_scale_base
 
+    def get_seek_time(self) -> int:
+        return int(self.seek_var.get())
+
     def set_running_state(self, running: bool):
         self.running = running
         state = tk.NORMAL if running else tk.DISABLED
@@ -455,6 +617,13 @@ class RRApp(tk.Tk, RRViewInterface):
     def set_canvas_time_scale(self, scale: float):
         self.canvas_time_scale = scale
 
+    def set_timeline(self, time: int, horizon: int):
+        """Sitúa la línea de tiempo en 'time' dentro del intervalo simulado [0, horizon]."""
+        self._timeline_horizon = horizon
+        self.timeline_scale.config(to=max(1, horizon))
+        self.seek_var.set(time)
+        self.timeline_label.config(text=f"{time} / {horizon}")
+
     def set_next_pid(self, next_pid: int):
         # Este método no es necesario si el PID se maneja completamente en el modelo/presenter
         pass
@@ -474,75 +643,116 @@ class RRApp(tk.Tk, RRViewInterface):
         return simpledialog.askstring(title, prompt, initialvalue=initialvalue, parent=self)
 
     def refresh_process_table(self, processes: Dict[int, Process], scheduler_state: Any):
-        """Actualiza la tabla de procesos con la información más reciente."""
-        # Limpiar tabla
-        for r in self.tree.get_children():
-            self.tree.delete(r)
-        row_count = 0
-        # Obtener estado del scheduler (necesario para calcular el status)
-        # Este paso es un poco incómodo, quizás el Presenter debería pasar el status calculado
-        # Por ahora, asumimos que scheduler_state tiene current, ready, future, finished
+        """
+        Actualiza la tabla de procesos con la información más reciente.
+        La actualización es incremental: cada fila usa el PID como iid y solo se
+        modifican las filas cuyos valores cambiaron. Con muchos procesos y la
+        simulación en marcha, las actualizaciones se limitan a una cada
+        TABLE_REFRESH_INTERVAL_MS (la última petición pendiente se aplica al vencer).
+        """
+        self._table_pending = (processes, scheduler_state)
+        if self.running and len(processes) > self.TABLE_LIVE_REFRESH_LIMIT:
+            if self._table_after_id is None:
+                self._table_after_id = self.after(self.TABLE_REFRESH_INTERVAL_MS, self._apply_table_refresh)
+            return
+        self._apply_table_refresh()
+
+    def _apply_table_refresh(self):
+        """Aplica a la tabla la última petición de refresco (diferencia fila a fila)."""
+        if self._table_after_id is not None:
+            self.after_cancel(self._table_after_id)
+            self._table_after_id = None
+        if self._table_pending is None:
+            return
+        processes, scheduler_state = self._table_pending
+        self._table_pending = None
         current_pid = scheduler_state.current.pid if scheduler_state.current else None
-        ready_pids = [p.pid for p in scheduler_state.ready]
-        future_pids = [p.pid for p in scheduler_state.future]
-        finished_pids = [p.pid for p in scheduler_state.finished]
-
-        def _status_of(p: Process) -> str:
-            if current_pid is not None and current_pid == p.pid:
-                return "Running"
-            if p.pid in ready_pids:
-                return "Ready"
-            if p.pid in future_pids:
-                return "Ready"
-            if p.pid in finished_pids:
-                return "Finished"
-            return "Idle"
-
-        # Ordenar procesos por PID
-        for pid in sorted(processes.keys()):
-            p = processes[pid]
-            status = _status_of(p)
-            start = "" if p.start_time is None else str(p.start_time)
-            comp = "" if p.completion_time is None else str(p.completion_time)
-            turnaround_time = ""
-            waiting_time = ""
-            ntat = ""
-            current_time = scheduler_state.time # Asumimos que se pasa el tiempo actual
-            if p.completion_time is not None:
-                tat_value = p.completion_time - p.arrival
-                turnaround_time = str(tat_value)
-                waiting_time = str(tat_value - p.burst)
-                if p.burst > 0:
-                    ntat = f"{tat_value / p.burst:.2f}"
-                else:
-                    ntat = "∞"
-            elif p.start_time is not None:
-                # Mostrar valores parciales mientras se ejecuta
-                current_turnaround = current_time - p.arrival
-                current_waiting = current_turnaround - (p.burst - p.remaining)
-                turnaround_time = f"{current_turnaround}+"
-                waiting_time = f"{current_waiting}+"
-                if p.burst > 0:
-                    ntat = f"{current_turnaround / p.burst:.2f}+"
-                else:
-                    ntat = "∞"
-            # Aplicar colores alternados a las filas
-            tags = ('evenrow',) if row_count % 2 == 0 else ('oddrow',)
-            self.tree.insert("", tk.END, values=(p.pid, p.arrival, p.burst, start, p.remaining, comp, turnaround_time, waiting_time, ntat, status), tags=tags)
-            row_count += 1
-        self.update_row_tags()
-        # Seleccionar y resaltar el proceso en ejecución
-        if current_pid:
-            for iid in self.tree.get_children():
-                if int(self.tree.set(iid, "pid")) == current_pid:
-                    self.tree.selection_set(iid)
-                    self.tree.focus(iid)
-                    self.tree.see(iid)
-
-    def update_queues_display(self, time: int, current_pid: Optional[int], ready_pids: List[int]):
-        """Actualiza el marco que muestra el estado actual de las colas."""
+        current_time = scheduler_state.time # Asumimos que se pasa el tiempo actual
+        state_of = scheduler_state.state_of
+        cache = self._table_rows
+        structure_changed = False
+
+        # Filas de procesos eliminados
+        for pid in [pid for pid in cache if pid not in processes]:
+            self.tree.delete(str(pid))
+            del cache[pid]
+            self._table_pids.remove(pid)
+            structure_changed = True
+
+        for pid, p in processes.items():
+            values = self._process_row_values(p, state_of(pid), current_time)
+            previous = cache.get(pid)
+            if previous == values:
+                continue
+            cache[pid] = values
+            if previous is None:
+                # Mantener el orden por PID: normalmente los PIDs nuevos van al final
+                index = bisect_left(self._table_pids, pid)
+                self._table_pids.insert(index, pid)
+                self.tree.insert("", index if index < len(self._table_pids) - 1 else tk.END, iid=str(pid), values=values)
+                structure_changed = True
+            else:
+                for column, old, new in zip(self._table_columns, previous, values):
+                    if old != new:
+                        self.tree.set(str(pid), column, new)
+        if structure_changed:
+            self.update_row_tags()
+        # Seleccionar y resaltar el proceso en ejecución (solo si cambió)
+        if current_pid and current_pid != self._table_selected_pid and current_pid in cache:
+            iid = str(current_pid)
+            self.tree.selection_set(iid)
+            self.tree.focus(iid)
+            self.tree.see(iid)
+        self._table_selected_pid = current_pid
+
+    @staticmethod
+    def _process_row_values(p: Process, state: Optional[str], current_time: int) -> tuple:
+        """Calcula los valores de la fila de un proceso (las columnas de la tabla)."""
+        if state == STATE_RUNNING:
+            status = "Running"
+        elif state == STATE_READY or state == STATE_FUTURE:
+            status = "Ready"
+        elif state == STATE_FINISHED:
+            status = "Finished"
+        else:
+            status = "Idle"
+        start = "" if p.start_time is None else str(p.start_time)
+        comp = "" if p.completion_time is None else str(p.completion_time)
+        turnaround_time = ""
+        waiting_time = ""
+        ntat = ""
+        if p.completion_time is not None:
+            tat_value = p.completion_time - p.arrival
+            turnaround_time = str(tat_value)
+            waiting_time = str(tat_value - p.burst)
+            if p.burst > 0:
+                ntat = f"{tat_value / p.burst:.2f}"
+            else:
+                ntat = "∞"
+        elif p.start_time is not None:
+            # Mostrar valores parciales mientras se ejecuta
+            current_turnaround = current_time - p.arrival
+            current_waiting = current_turnaround - (p.burst - p.remaining)
+            turnaround_time = f"{current_turnaround}+"
+            waiting_time = f"{current_waiting}+"
+            if p.burst > 0:
+                ntat = f"{current_turnaround / p.burst:.2f}+"
+            else:
+                ntat = "∞"
+        return (str(p.pid), str(p.arrival), str(p.burst), start, str(p.remaining), comp, turnaround_time, waiting_time, ntat, status)
+
+    def update_queues_display(self, time: int, current_pid: Optional[int], ready_pids: List[int],
+                              running: Optional[List[Optional[int]]] = None):
+        """
+        Actualiza el marco que muestra el estado actual de las colas.
+        Con varias CPUs, 'running' es el PID en ejecución de cada núcleo (None si está libre).
+        """
         ready_pids_str = ", ".join(f"P{p}" for p in ready_pids) or "Ninguno"
-        current_pid_str = f"P{current_pid}" if current_pid else "Ninguno"
+        if running is not None:
+            current_pid_str = "  ".join(f"CPU{core}={'IDLE' if pid is None else f'P{pid}'}"
+                                        for core, pid in enumerate(running))
+        else:
+            current_pid_str = f"P{current_pid}" if current_pid else "Ninguno"
         queues_text = (f"Tiempo Actual: {time}\n"
                        f"Ejecutando: {current_pid_str}\n"
                        f"Cola Ready: [{ready_pids_str}]")
@@ -558,23 +768,74 @@ class RRApp(tk.Tk, RRViewInterface):
         txt = (f"Turnaround Promedio={metrics['avg_turnaround']:.2f} | Espera Promedio={metrics['avg_waiting']:.2f}\n"
              f"Cambios de Contexto={metrics['context_switches']}             | Makespan={metrics['makespan']}\n"
                f"NTAT Promedio={avg_ntat_str}                    | Coef. Var. NTAT={cv_ntat_str} %")
+        if metrics.get("overhead_time"):
+            txt += (f"\nSobrecarga de cambios de contexto={metrics['overhead_time']}"
+                    f" | Eficiencia CPU={metrics['cpu_efficiency'] * 100:.1f} %")
+        if "core_utilization" in metrics:
+            per_core = " ".join(f"{u * 100:.0f}%" for u in metrics["core_utilization"])
+            txt += (f"\nUtilización CPUs={metrics['avg_core_utilization'] * 100:.1f} % [{per_core}]"
+                    f" | Migraciones={metrics['migrations']} | Robos={metrics['steals']}")
         self.metrics_label.config(text=f"Métricas:\n{txt}")
 
+    def update_speed_display(self, target: float, achieved: float):
+        """Muestra la velocidad objetivo y la alcanzada en unidades simuladas por segundo."""
+        self.speed_label.config(text=f"Velocidad: objetivo {target:,.0f} u/s | real {achieved:,.0f} u/s")
+
     def log_message(self, message: str):
         """Añade un mensaje al log de eventos."""
         self.log.insert(tk.END, f"{message}\n")
         self.log.see(tk.END) # Desplazar al final
 
+    def show_stats(self, text: Optional[str]):
+        """Muestra el panel de estadísticas sobre el Gantt con 'text', o lo oculta si es None."""
+        if text is None:
+            self.stats_overlay.place_forget()
+            return
+        self.stats_overlay.config(text=text)
+        self.stats_overlay.place(relx=1.0, y=30, x=-12, anchor=tk.NE)
+        self.stats_overlay.lift()
+
+    def instrument(self, instrumentation):
+        """Mide los elementos creados en el canvas del Gantt, las filas y celdas reescritas de la tabla y el renderizado."""
+        for name in ("create_rectangle", "create_text", "create_line"):
+            instrumentation.wrap(self.canvas, name, "canvas", "canvas_items")
+        for name in ("insert", "item", "delete"):
+            instrumentation.wrap(self.tree, name, "treeview", "tree_rows")
+        instrumentation.wrap(self.tree, "set", "treeview", "tree_cells") # Filas existentes: celda a celda
+        instrumentation.wrap(self, "_render_gantt_viewport", "gantt")
+
+    def _visible_time_range(self, scale: float) -> Tuple[float, float]:
+        """Intervalo de tiempo [t0, t1) visible en el canvas (con un pequeño margen)."""
+        margin = 50
+        x0 = self.canvas.canvasx(0) - margin
+        x1 = self.canvas.canvasx(max(self.canvas.winfo_width(), 800)) + margin
+        if scale <= 0:
+            return 0, 0
+        return max(0.0, x0 / scale), x1 / scale
+
     def draw_static_gantt(self, time: int, scale: float):
-        """Dibuja los elementos estáticos del diagrama de Gantt (eje de tiempo, etiquetas)."""
+        """
+        Dibuja los elementos estáticos del diagrama de Gantt (eje de tiempo, etiquetas).
+        Solo se crean las marcas del eje que caen dentro de la región visible.
+        """
+        self._gantt_time = time
         self.canvas.delete("gantt_static")
-        self.canvas.create_text(5, 6, anchor=tk.NW, text=f"Tiempo: {time}",
+        left = self.canvas.canvasx(0)
+        self.canvas.create_text(left + 5, 6, anchor=tk.NW, text=f"Tiempo: {time}",
                                tag="gantt_static", font=("Segoe UI", 8, "bold"), fill=self.text_color)
-        self.canvas.create_text(100, 6, anchor=tk.NW, text="CPU",
+        self.canvas.create_text(left + 100, 6, anchor=tk.NW,
+                               text="CPU" if self._gantt_lanes == 1 else f"CPUs: {self._gantt_lanes}",
                                tag="gantt_static", font=("Segoe UI", 9, "bold"), fill=self.text_color)
-        self.canvas.create_line(0, 30, self.canvas.winfo_width(), 30,
-                               fill=self.border_color, tag="gantt_static")
+        if self._gantt_lanes > 1:
+            for lane in range(self._gantt_lanes):
+                row_y, height, _ = self._lane_geometry(lane)
+                if height >= 10: # Etiqueta del carril solo si cabe
+                    self.canvas.create_text(left + 2, row_y + height / 2, anchor=tk.W, text=f"CPU{lane}",
+                                           font=("Segoe UI", 7, "bold"), fill=self.text_color,
+                                           tags=("gantt_static", "lane_label"))
         canvas_width = max(self.canvas.winfo_width(), 800)
+        self.canvas.create_line(left, 30, left + canvas_width, 30,
+                               fill=self.border_color, tag="gantt_static")
         if scale <= 0:
             time_step = 1
         else:
@@ -586,7 +847,10 @@ class RRApp(tk.Tk, RRViewInterface):
             else:
                 time_step = max(10, round(time_step / 10) * 10)
         max_time_to_draw = max(time + 50, int((canvas_width + 100) / scale))
-        for t in range(0, max_time_to_draw + 1, time_step):
+        t0, t1 = self._visible_time_range(scale)
+        first_tick = int(t0 // time_step) * time_step
+        last_tick = min(max_time_to_draw, int(t1))
+        for t in range(first_tick, last_tick + 1, time_step):
             x = t * scale
             self.canvas.create_line(x, 30, x, 35, fill=self.border_color, tag="gantt_static")
             self.canvas.create_text(x, 38, anchor=tk.N, text=str(t), font=("Segoe UI", 7), fill=self.text_color, tag="gantt_static")
@@ -597,18 +861,44 @@ class RRApp(tk.Tk, RRViewInterface):
         else:
             self.canvas.config(scrollregion=(0, 0, max(current_canvas_width, needed_width), self.canvas.winfo_height()))
 
-    def draw_execution_burst(self, pid: Optional[int], start_time: int, duration: int, scale: float):
+    def draw_execution_burst(self, pid: Optional[int], start_time: int, duration: int, scale: float, lane: int = 0):
         """
-        Dibuja una barra representando una ráfaga de ejecución en el diagrama de Gantt.
+        Dibuja una barra representando una ráfaga de ejecución en el diagrama de Gantt
+        (en el carril del núcleo 'lane'), solo si interseca la región visible (el resto
+        se dibuja al desplazarse).
         """
         if duration <= 0:
             return
-        height = 28
-        row_y = 38
+        if self._gantt_lod:
+            self.request_gantt_render() # Con poco zoom se redibujan las columnas agregadas
+            return
+        t0, t1 = self._visible_time_range(scale)
+        if start_time < t1 and start_time + duration > t0:
+            self._draw_burst_items(pid, start_time, duration, scale, lane)
+
+    def _lane_geometry(self, lane: int) -> Tuple[float, float, bool]:
+        """
+        Posición del carril de un núcleo: (y superior, altura, si caben las etiquetas de tiempo).
+        Con una sola CPU se conserva el carril original; con varias, los carriles se
+        reparten la altura del canvas.
+        """
+        if self._gantt_lanes == 1:
+            return 38, 28, True
+        stride = max(4, min(34, (max(self.canvas.winfo_height(), 200) - 45) // self._gantt_lanes))
+        return 38 + lane * stride, max(2, stride - 4), False
+
+    def _draw_burst_items(self, pid: Optional[int], start_time: int, duration: int, scale: float, lane: int = 0):
+        """Crea los elementos del canvas (barra y etiquetas) de una ráfaga."""
+        row_y, height, time_labels = self._lane_geometry(lane)
         x0 = start_time * scale
         x1 = (start_time + duration) * scale
         tags = ("burst",)
-        if pid is not None:
+        if pid is not None and (pid == OVERHEAD_PID or not time_labels):
+            # Varios carriles (barra compacta) o sobrecarga, p. ej. migración entre núcleos (sin etiquetas)
+            self.canvas.create_rectangle(x0, row_y, x1, row_y + height, fill=self._color_for_pid(pid), outline=self.border_color, tags=tags)
+            if pid != OVERHEAD_PID and x1 - x0 > 20 and height >= 10:
+                self.canvas.create_text((x0 + x1)/2, row_y + height/2, text=f"P{pid}", fill="white", font=("Segoe UI", 7, "bold"), tags=tags)
+        elif pid is not None:
             color = self._color_for_pid(pid)
             self.canvas.create_rectangle(x0, row_y, x1, row_y + height, fill=color, outline=self.border_color, tags=tags)
             if x1 - x0 > 20: # Solo mostrar texto si hay espacio
@@ -633,18 +923,94 @@ class RRApp(tk.Tk, RRViewInterface):
         current_canvas_width = self.canvas.winfo_width()
         if needed_width > current_canvas_width:
              self.canvas.config(scrollregion=(0, 0, needed_width, self.canvas.winfo_height()))
+        left_before = self.canvas.canvasx(0)
         self.canvas.xview_moveto(max(0, (x_current - self.canvas.winfo_width()) / needed_width))
+        if self.canvas.canvasx(0) != left_before:
+            self.request_gantt_render() # La región visible cambió al seguir la línea de tiempo
 
     def clear_gantt(self):
         """Limpia el contenido del Gantt."""
         self.canvas.delete("all")
 
-    def redraw_gantt_bursts(self, history: List[Tuple[Optional[int], int, int]], scale: float):
-        """Redibuja todas las ráfagas almacenadas en el historial del Gantt."""
-        for entry in history:
-             if len(entry) >= 3:
-                 pid, start_time, duration = entry[0], entry[1], entry[2]
-                 self.draw_execution_burst(pid, start_time, duration, scale)
+    def set_gantt_history(self, history):
+        """
+        Registra el historial del que se redibuja la región visible al desplazarse o hacer
+        zoom: un historial, o una lista de historiales (un carril por núcleo).
+        """
+        self._gantt_history = history
+        self._gantt_lanes = len(history) if isinstance(history, list) else 1
+
+    def redraw_gantt_bursts(self, history: Iterable[Tuple[Optional[int], int, int]], scale: float):
+        """
+        Redibuja las ráfagas del historial (o de cada carril, si es una lista de
+        historiales por núcleo) que caen en la región visible del Gantt.
+        Si hay más ráfagas visibles que columnas de píxel disponibles para ellas, se
+        dibuja una barra agregada por columna (nivel de detalle de la pirámide de ocupación).
+        """
+        self.set_gantt_history(history)
+        self.canvas.delete("burst")
+        t0, t1 = self._visible_time_range(scale)
+        self._gantt_lod = False
+        for lane, lane_history in enumerate(history if isinstance(history, list) else [history]):
+            lod = (hasattr(lane_history, "pyramid")
+                   and lane_history.count_range(t0, t1) * self.LOD_MIN_PX_PER_BURST > (t1 - t0) * scale)
+            self._gantt_lod = self._gantt_lod or lod
+            if lod:
+                self._draw_lod_columns(lane_history, t0, min(t1, lane_history.end_time()), scale, lane)
+                continue
+            if hasattr(lane_history, "range"):
+                entries = lane_history.range(t0, t1) # Índice por intervalos: O(log n + visibles)
+            else:
+                entries = (e for e in lane_history if len(e) >= 3 and e[1] < t1 and e[1] + e[2] > t0)
+            for entry in entries:
+                pid, start_time, duration = entry[0], entry[1], entry[2]
+                if duration > 0:
+                    self._draw_burst_items(pid, start_time, duration, scale, lane)
+        self.canvas.tag_raise("lane_label")
+        self.canvas.tag_raise("tline")
+
+    def _draw_lod_columns(self, history, t0: float, t1: float, scale: float, lane: int = 0):
+        """
+        Dibuja la región [t0, t1) agregada: una columna por píxel con el color del PID
+        dominante y altura proporcional a la ocupación de la CPU. Las columnas contiguas
+        iguales se funden en un único rectángulo.
+        """
+        row_y, height, _ = self._lane_geometry(lane)
+        x_start = int(t0 * scale)
+        count = int(t1 * scale) - x_start
+        if count <= 0:
+            return
+        tags = ("burst",)
+        self.canvas.create_rectangle(x_start, row_y, x_start + count, row_y + height,
+                                     fill="#e0e0e0", outline=self.border_color, tags=tags) # Fondo IDLE
+        columns = history.pyramid().columns(x_start / scale, (x_start + count) / scale, count)
+        run_start = 0
+        run_key = None
+        for i, (pid, utilization) in enumerate(columns + [(None, 0.0)]):
+            key = (pid, round(utilization * height)) if pid is not None else None
+            if key == run_key:
+                continue
+            if run_key is not None and run_key[1] > 0:
+                x0 = x_start + run_start
+                self.canvas.create_rectangle(x0, row_y + height - run_key[1], x_start + i, row_y + height,
+                                             fill=self._color_for_pid(run_key[0]), width=0, tags=tags)
+            run_start = i
+            run_key = key
+
+    def request_gantt_render(self):
+        """Programa (una sola vez por ciclo de eventos) el redibujado de la región visible."""
+        if self._gantt_render_pending:
+            return
+        self._gantt_render_pending = True
+        self.after_idle(self._render_gantt_viewport)
+
+    def _render_gantt_viewport(self):
+        """Redibuja el eje y las ráfagas de la región visible; el número de elementos del canvas se mantiene acotado."""
+        self._gantt_render_pending = False
+        scale = self.canvas_time_scale
+        self.draw_static_gantt(self._gantt_time, scale)
+        if self._gantt_history is not None:
+            self.redraw_gantt_bursts(self._gantt_history, scale)
 
     def toggle_full_gantt_view(self, gantt_only: bool):
         """
@@ -677,6 +1043,8 @@ class RRApp(tk.Tk, RRViewInterface):
         Returns:
             str: Un color en formato hexadecimal (e.g., "#a1b2c3").
         """
+        if pid == OVERHEAD_PID:
+            return "#555555" # Sobrecarga: gris oscuro
         # Algoritmo para generar colores distintos basados en el PID
         hue = (pid * 137.5) % 360 # 137.5 es el ángulo áureo, ayuda a distribuir colores
         saturation = 0.7